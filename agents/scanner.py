@@ -20,6 +20,7 @@ from dataclasses import dataclass, field
 
 import mutagen
 from mutagen.easyid3 import EasyID3
+from mutagen.id3 import ID3
 from mutagen.mp3 import MP3
 from mutagen.flac import FLAC
 from mutagen.mp4 import MP4
@@ -379,9 +380,11 @@ class ScannerAgent(BaseAgent):
         try:
             ext = filepath.suffix.lower()
             if ext == '.mp3':
-                audio = MP3(str(filepath))
-                if audio.tags:
-                    for tag in audio.tags.values():
+                # Tag only (no MPEG frame sync); picture frames need no
+                # v2.2/v2.3 -> v2.4 frame translation to be recognised
+                tags = ID3(str(filepath), translate=False)
+                if tags:
+                    for tag in tags.values():
                         if hasattr(tag, 'mime') and hasattr(tag, 'data'):
                             return True
             elif ext == '.flac':
@@ -55,8 +55,10 @@ def cmd_consolidate(args):
     """Find and consolidate multi-disc albums."""
     from utilities.disc_consolidator import DiscConsolidator
 
-    consolidator = DiscConsolidator()
-    results = consolidator.consolidate_all(args.path, dry_run=args.dry_run)
+    consolidator = (DiscConsolidator(max_workers=args.threads) if args.threads
+                    else DiscConsolidator())
+    results = consolidator.consolidate_all(args.path, dry_run=args.dry_run, copy=args.copy,
+                                           jobs=args.jobs)
 
     print(f"\n=== Consolidation Results ===")
     print(f"Multi-disc sets found: {results['found']}")
@@ -75,7 +77,8 @@ def cmd_move_track(args):
         dest_folder=args.dest,
         track_number=args.number,
         album=args.album,
-        artist=args.artist
+        artist=args.artist,
+        title_from_filename=args.title_from_filename
     )
 
 
@@ -236,6 +239,12 @@ def main():
     consolidate_parser = subparsers.add_parser('consolidate', help='Consolidate multi-disc albums')
     consolidate_parser.add_argument('path', help='Path to scan for multi-disc albums')
     consolidate_parser.add_argument('--dry-run', action='store_true', help='Preview changes without applying')
+    consolidate_parser.add_argument('--copy', action='store_true',
+                                    help='Copy tracks instead of moving them (disc folders are kept)')
+    consolidate_parser.add_argument('--threads', type=int, metavar='N',
+                                    help='Tracks transferred concurrently (default: as disc_consolidator.py)')
+    consolidate_parser.add_argument('--jobs', type=int, default=1, metavar='N',
+                                    help='Albums consolidated in parallel worker processes (default: 1)')
     consolidate_parser.set_defaults(func=cmd_consolidate)
 
     # move-track command
@@ -245,6 +254,8 @@ def main():
     move_parser.add_argument('--number', help='New track number (e.g., "5/12")')
     move_parser.add_argument('--album', help='New album name')
     move_parser.add_argument('--artist', help='New album artist')
+    move_parser.add_argument('--title-from-filename', action='store_true',
+                             help='Take the renamed title from the filename instead of tags')
     move_parser.set_defaults(func=cmd_move_track)
 
     # embed-cover command
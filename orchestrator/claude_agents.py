@@ -120,18 +120,31 @@ class KnowledgeBase:
 
     def __init__(self, knowledge_path: str = ".claude/knowledge"):
         self.knowledge_path = Path(knowledge_path)
+        # filename -> ((mtime_ns, size), parsed data). A batch run asks about
+        # every album, so each file is parsed once and re-read only when it
+        # changes on disk. Returned structures are shared: treat as read-only.
+        self._cache: Dict[str, Any] = {}
 
     def _load(self, filename: str, default: Dict[str, Any]) -> Dict[str, Any]:
         path = self.knowledge_path / filename
-        if not path.exists():
+        try:
+            st = path.stat()
+        except OSError:
             return dict(default)
+        signature = (st.st_mtime_ns, st.st_size)
+        cached = self._cache.get(filename)
+        if cached and cached[0] == signature:
+            return cached[1]
         try:
             data = json.loads(path.read_text(encoding="utf-8"))
         except (json.JSONDecodeError, OSError):
             return dict(default)
         # Fail soft: a hand-edited file whose top level is not an object (e.g. a
         # bare array) must not make the downstream .get() calls explode.
-        return data if isinstance(data, dict) else dict(default)
+        if not isinstance(data, dict):
+            return dict(default)
+        self._cache[filename] = (signature, data)
+        return data
 
     def load_corrections(self) -> List[Dict[str, Any]]:
         """Return the list of logged corrections (empty if none)."""
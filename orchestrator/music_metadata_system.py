@@ -27,6 +27,7 @@ The system implements a 10-step workflow:
 import argparse
 import json
 import os
+import re
 import sys
 import time
 from datetime import datetime
@@ -42,6 +43,11 @@ sys.path.insert(0, str(project_root))
 from orchestrator.config import ConfigManager
 from orchestrator.state import StateStore
 
+# Track-number patterns in filenames, compiled once for the per-file lookup.
+_DISC_TRACK_RE = re.compile(r'^(\d+)-(\d+)')                 # "1-01 Song" -> track is group 2
+_LEADING_TRACK_RE = re.compile(r'^(\d+)\s')                  # "01 Song" -> track is group 1
+_TRACK_WORD_RE = re.compile(r'Track\s*(\d+)', re.IGNORECASE)  # "Track 01" -> track is group 1
+
 
 class MusicMetadataSystem:
     """
@@ -1071,7 +1077,7 @@ class MusicMetadataSystem:
         Returns:
             Tuple of (disc_number, total_discs)
         """
-        from mutagen.easyid3 import EasyID3
+        from utilities.core.audio_file import read_easy_id3
         from mutagen.mp4 import MP4
         from mutagen.flac import FLAC
 
@@ -1079,7 +1085,7 @@ class MusicMetadataSystem:
 
         try:
             if ext == '.mp3':
-                audio = EasyID3(str(audio_file))
+                audio = read_easy_id3(audio_file)
                 disc = audio.get('discnumber', ['1/1'])[0]
                 # Parse "1/2" format
                 parts = disc.split('/')
@@ -1132,7 +1138,7 @@ class MusicMetadataSystem:
 
     def _get_track_number(self, audio_file: Path) -> int:
         """Get track number from audio file metadata."""
-        from mutagen.easyid3 import EasyID3
+        from utilities.core.audio_file import read_easy_id3
         from mutagen.mp4 import MP4
         from mutagen.flac import FLAC
 
@@ -1140,7 +1146,7 @@ class MusicMetadataSystem:
 
         try:
             if ext == '.mp3':
-                audio = EasyID3(str(audio_file))
+                audio = read_easy_id3(audio_file)
                 track = audio.get('tracknumber', ['1'])[0]
                 return int(track.split('/')[0])
             elif ext == '.m4a':
@@ -1159,7 +1165,7 @@ class MusicMetadataSystem:
 
     def _get_title(self, audio_file: Path) -> str:
         """Get title from audio file metadata."""
-        from mutagen.easyid3 import EasyID3
+        from utilities.core.audio_file import read_easy_id3
         from mutagen.mp4 import MP4
         from mutagen.flac import FLAC
 
@@ -1167,7 +1173,7 @@ class MusicMetadataSystem:
 
         try:
             if ext == '.mp3':
-                audio = EasyID3(str(audio_file))
+                audio = read_easy_id3(audio_file)
                 return audio.get('title', [None])[0]
             elif ext == '.m4a':
                 audio = MP4(str(audio_file))
@@ -1182,23 +1188,21 @@ class MusicMetadataSystem:
 
     def _extract_track_from_filename(self, filename: str) -> int:
         """Extract track number from filename."""
-        import re
-
-        # Try patterns like "01 Song.mp3", "1-01 Song.mp3", "Track 01.mp3"
-        patterns = [
-            r'^(\d+)-(\d+)',      # "1-01 Song" -> track is group 2
-            r'^(\d+)\s',          # "01 Song" -> track is group 1
-            r'Track\s*(\d+)',     # "Track 01" -> track is group 1
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, filename, re.IGNORECASE)
+        # Try patterns like "01 Song.mp3", "1-01 Song.mp3", "Track 01.mp3".
+        # The anchored patterns only apply when the name starts with a digit.
+        if filename and filename[0].isdigit():
+            match = _DISC_TRACK_RE.match(filename)
             if match:
                 # For disc-track pattern, return track (group 2)
-                if len(match.groups()) > 1:
-                    return int(match.group(2))
+                return int(match.group(2))
+            match = _LEADING_TRACK_RE.match(filename)
+            if match:
                 return int(match.group(1))
 
+        match = _TRACK_WORD_RE.search(filename)
+        if match:
+            return int(match.group(1))
+
         return 1  # Default
 
     def _extract_title_from_filename(self, filename: str) -> str:
@@ -12,6 +12,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from utilities.core.json_output import read_json, write_json
+
 
 class AlbumStatus(Enum):
     """Album processing status"""
@@ -50,16 +52,14 @@ class QueueManager:
         """Load queue from file"""
         if self.queue_path.exists():
             try:
-                with open(self.queue_path, 'r', encoding='utf-8') as f:
-                    self._queue = json.load(f)
-            except json.JSONDecodeError:
+                self._queue = read_json(self.queue_path)
+            except json.JSONDecodeError:  # orjson's error subclasses this too
                 self._queue = {}
 
     def save(self) -> None:
         """Save queue to file"""
         self.queue_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.queue_path, 'w', encoding='utf-8') as f:
-            json.dump(self._queue, f, indent=2, ensure_ascii=False)
+        write_json(self._queue, self.queue_path)
 
     def add(
         self,
@@ -8,7 +8,8 @@ All sources (MusicBrainz, iTunes, AcoustID, Discogs) inherit from this.
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
-import time
+
+from utilities.core.rate_limit import TokenBucket
 
 
 @dataclass
@@ -79,7 +80,9 @@ class DataSource(ABC):
             rate_limit: Minimum seconds between requests
         """
         self.rate_limit = rate_limit
-        self._last_request: float = 0
+        # Thread-safe pacing on the monotonic clock; a caller only sleeps for
+        # whatever part of the interval has not already passed.
+        self._bucket = TokenBucket(rate=1 / rate_limit) if rate_limit > 0 else None
 
     @property
     @abstractmethod
@@ -129,11 +132,8 @@ class DataSource(ABC):
 
     def _rate_limit_wait(self) -> None:
         """Wait if necessary to respect rate limits"""
-        if self._last_request > 0:
-            elapsed = time.time() - self._last_request
-            if elapsed < self.rate_limit:
-                time.sleep(self.rate_limit - elapsed)
-        self._last_request = time.time()
+        if self._bucket is not None:
+            self._bucket.acquire()
 
     def _extract_year(self, date_str: Optional[str]) -> Optional[int]:
         """Extract year from date string"""
@@ -6,6 +6,8 @@ caught the original bug: after a batch run, ffprobe reports cover dimensions
 greater than zero on every track.
 """
 
+import json
+
 import pytest
 
 from tests.synth import make_audio, make_image_bytes
@@ -30,6 +32,25 @@ def _assert_dims_positive(audio_path):
         assert dims[0] > 0 and dims[1] > 0
 
 
+class _FakeResponse:
+    """A MusicBrainz JSON response for a patched session ``get``."""
+
+    def __init__(self, payload):
+        self.body = json.dumps(payload).encode()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return json.loads(self.body)
+
+
 def test_album_has_valid_art_detects_missing(tmp_path):
     album = _make_album(tmp_path / "No Art")
     assert batch_covers.album_has_valid_art(album) is False
@@ -151,7 +172,7 @@ def test_retries_zero_clamped_to_one_attempt(tmp_path):
     """--retries 0 must still attempt one download, not silently disable it."""
     calls = {"n": 0}
 
-    def fake_download(url):
+    def fake_download(url, **kwargs):
         calls["n"] += 1
         return make_image_bytes("JPEG")
 
@@ -164,3 +185,95 @@ def test_retries_zero_clamped_to_one_attempt(tmp_path):
         batch_covers.download_cover = original
     assert calls["n"] == 1
     assert data
+
+
+def test_concurrent_run_matches_serial_and_reports_in_order(tmp_path, capsys):
+    image = tmp_path / "cover.jpg"
+    image.write_bytes(make_image_bytes("JPEG", size=(640, 640)))
+    libraries = []
+    for name in ("serial", "parallel"):
+        library = tmp_path / name
+        for album in ("A", "B", "C"):
+            _make_album(library / album)
+        (library / "D").mkdir()
+        (library / "D" / "01 track.mp3").write_bytes(b"")  # fails soft
+        libraries.append(library)
+
+    serial = batch_covers.run(str(libraries[0]), "missing", image_path=str(image), jobs=1)
+    capsys.readouterr()
+    parallel = batch_covers.run(str(libraries[1]), "missing", image_path=str(image), jobs=3)
+    out = capsys.readouterr().out
+
+    assert parallel == serial
+    assert parallel["embedded"] == 3 and parallel["failed"] == 1
+    headers = [line for line in out.splitlines() if line.startswith("[")]
+    assert headers == ["[1/4] A", "[2/4] B", "[3/4] C", "[4/4] D"]
+
+
+def test_lookup_warnings_stay_in_album_block(tmp_path, monkeypatch, capsys):
+    for album in ("A", "B"):
+        _make_album(tmp_path / album)
+
+    def offline(url, **kwargs):
+        raise batch_covers.requests.ConnectionError("offline")
+
+    monkeypatch.setattr(batch_covers._musicbrainz_bucket, "acquire", lambda: None)
+    monkeypatch.setattr(batch_covers._musicbrainz_session, "get", offline)
+    summary = batch_covers.run(str(tmp_path), "missing", jobs=2)
+    lines = capsys.readouterr().out.splitlines()
+
+    assert summary["no_source"] == 2
+    for header in ("[1/2] A", "[2/2] B"):
+        at = lines.index(header)
+        assert lines[at + 1].startswith("    [warn] MusicBrainz lookup failed")
+        assert lines[at + 2] == "  [skip] no cover source found"
+
+
+def test_release_id_cache_skips_repeat_searches(tmp_path, monkeypatch):
+    searched = []
+
+    def fake_get(url, **kwargs):
+        searched.append(url)
+        releases = [{"id": "rel-1"}] if "Found" in url else []
+        return _FakeResponse({"count": len(releases), "releases": releases})
+
+    monkeypatch.setattr(batch_covers._musicbrainz_bucket, "acquire", lambda: None)
+    monkeypatch.setattr(batch_covers._musicbrainz_session, "get", fake_get)
+
+    cache = batch_covers.ReleaseIdCache(tmp_path)
+    assert batch_covers.lookup_cover_url("Found", release_ids=cache).endswith("/rel-1/front-1200")
+    assert batch_covers.lookup_cover_url("Nothing", release_ids=cache) is None
+    cache.save()
+
+    reloaded = batch_covers.ReleaseIdCache(tmp_path)  # a rerun
+    assert batch_covers.lookup_cover_url("Found", release_ids=reloaded).endswith("/rel-1/front-1200")
+    assert batch_covers.lookup_cover_url("Nothing", release_ids=reloaded) is None
+    assert len(searched) == 2
+
+    # Negative entries expire; found ids do not.
+    monkeypatch.setattr(batch_covers.time, "time", lambda: 10 ** 12)
+    assert batch_covers.lookup_cover_url("Nothing", release_ids=reloaded) is None
+    assert batch_covers.lookup_cover_url("Found", release_ids=reloaded) is not None
+    assert len(searched) == 3
+
+
+def test_prefetch_release_ids_batches_titles(monkeypatch):
+    queries = []
+
+    def fake_get(url, **kwargs):
+        queries.append(batch_covers.urllib.parse.unquote(url))
+        return _FakeResponse({"releases": [{"id": "other", "title": "Greatest Hits, Vol. 2"},
+                                           {"id": "gh1", "title": "Greatest Hits: Volume 1"},
+                                           {"id": "gh1-dup", "title": "Greatest Hits: Volume 1"},
+                                           {"id": "cafe", "title": "Café Hits"}]})
+
+    monkeypatch.setattr(batch_covers._musicbrainz_bucket, "acquire", lambda: None)
+    monkeypatch.setattr(batch_covers._musicbrainz_session, "get", fake_get)
+
+    cache = batch_covers.ReleaseIdCache()
+    names = ["Greatest Hits - Volume 1", "cafe hits", 'Say "Hi"']
+    assert batch_covers.prefetch_release_ids(names, cache) == 2
+    assert len(queries) == 1 and 'release:"Say \\"Hi\\""' in queries[0]
+    assert cache.get("Greatest Hits - Volume 1") == (True, "gh1")
+    assert cache.get("cafe hits") == (True, "cafe")
+    assert cache.get('Say "Hi"') == (False, None)  # left for a single search
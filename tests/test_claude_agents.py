@@ -144,6 +144,18 @@ def test_album_key_uses_last_two_segments():
     assert KnowledgeBase.album_key("Album") == "Album"
 
 
+def test_knowledge_base_reparses_only_when_file_changes(tmp_path):
+    mapping = tmp_path / "cover_art_mapping.json"
+    mapping.write_text(json.dumps({"albums": {"A/B": {"correct_url": "http://one"}}}))
+    kb = KnowledgeBase(str(tmp_path))
+
+    assert kb.load_cover_mapping() is kb.load_cover_mapping()  # served from cache
+    assert kb.known_cover_url("/m/A/B") == "http://one"
+
+    mapping.write_text(json.dumps({"albums": {"A/B": {"correct_url": "http://two!"}}}))
+    assert kb.known_cover_url("/m/A/B") == "http://two!"
+
+
 def test_knowledge_base_missing_path_fails_soft(tmp_path):
     kb = KnowledgeBase(str(tmp_path / "nope"))
     assert kb.load_patterns() == []
@@ -0,0 +1,64 @@
+"""Tests for album-name cleanup and the reasons it reports."""
+
+import os
+
+import pytest
+
+from utilities import cleanup_names
+from utilities.cleanup_names import (
+    REASON_BRACKETS,
+    REASON_DISC_NOTATION,
+    batch_cleanup,
+    clean_album_name,
+    reason_names,
+    scan_library,
+)
+
+
+@pytest.mark.parametrize("name", ["Album Disk 2", "Album disc 2", "Album  [Disc 2]"])
+def test_disc_notation_rewrite_has_a_reason(name):
+    cleaned, mask = clean_album_name(name, with_reasons=True)
+    assert cleaned == "Album [Disc 2]"
+    assert mask == REASON_DISC_NOTATION
+    assert reason_names(mask) == ["disc notation"]
+
+
+def test_canonical_disc_notation_is_left_alone():
+    assert clean_album_name("Album [Disc 2]", with_reasons=True) == ("Album [Disc 2]", 0)
+
+
+def test_disc_notation_kept_while_other_brackets_change():
+    cleaned, mask = clean_album_name("Album [Live] [Disc 1]", with_reasons=True)
+    assert cleaned == "Album (Live) [Disc 1]"
+    assert mask == REASON_BRACKETS
+
+
+def test_recursive_batch_renames_nested_folders_before_parents(tmp_path, capsys):
+    (tmp_path / "Greatest_Hits" / "Live_1999" / "Bonus  Tracks").mkdir(parents=True)
+
+    batch_cleanup(str(tmp_path), recursive=True)
+
+    assert (tmp_path / "Greatest Hits" / "Live (1999)" / "Bonus Tracks").is_dir()
+    assert not (tmp_path / "Greatest_Hits").exists()
+    assert "Successfully renamed: 3/3" in capsys.readouterr().out
+
+
+def test_scan_library_recursive_lists_nested_folders(tmp_path):
+    (tmp_path / "Artist" / "Album_One" / "Disk_ Two").mkdir(parents=True)
+
+    library = scan_library(str(tmp_path), jobs=1, recursive=True)
+
+    assert sorted(library["Artist"]["needs_cleaning"]) == [
+        ("Album_One", "Album One", "underscores"),
+        (os.path.join("Album_One", "Disk_ Two"), os.path.join("Album_One", "Disk: Two"),
+         "underscores"),
+    ]
+
+
+def test_pooled_classification_matches_serial(monkeypatch):
+    names = ["Album_ Subtitle", "Album [Live] Disk 2", "Clean Album", "Best_1999",
+             "Greatest Hits, Vol. 1", "Trunc_", "A  -  B"] * 20
+    monkeypatch.setattr(cleanup_names, "_POOL_MIN_FOLDERS", 1)
+
+    assert cleanup_names._classify_folders(names, jobs=2) == \
+        cleanup_names._classify_folders(names, jobs=1)
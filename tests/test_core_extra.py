@@ -148,3 +148,101 @@ def test_png_cover_roundtrip_ffprobe_dims(tmp_path):
         assert dims[0] > 0 and dims[1] > 0
 
     assert cover_art.extract_cover_from_file(path) == data
+
+
+# --------------------------------------------------------------------------- #
+# json_output.write_json
+# --------------------------------------------------------------------------- #
+
+
+@pytest.mark.parametrize("have_orjson", [True, False])
+def test_write_json_same_text_with_or_without_orjson(tmp_path, monkeypatch, have_orjson):
+    import json
+    import sys
+
+    from utilities.core.json_output import write_json
+
+    if have_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setitem(sys.modules, "orjson", None)  # import raises ImportError
+
+    report = {"Café": {"Album": {"Tracks": [{"TrackNumber": 1, "Title": "Ünïcode"}], "Date": None}}}
+    path = tmp_path / "report.json"
+    write_json(report, path)
+    assert path.read_text(encoding="utf-8") == json.dumps(report, indent=2, ensure_ascii=False)
+
+
+@pytest.mark.parametrize("have_fast", [True, False])
+def test_read_and_stream_json_match_stdlib(tmp_path, monkeypatch, have_fast):
+    import sys
+
+    from utilities.core.json_output import iter_json_items, loads_json, read_json, write_json
+
+    if have_fast:
+        pytest.importorskip("orjson")
+        pytest.importorskip("ijson")
+    else:
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        monkeypatch.setitem(sys.modules, "ijson", None)
+
+    queue = {"a1": {"status": "needs_review", "metadata": {"confidence": 0.85}},
+             "b2": {"status": "scanned", "path": "Café"}}
+    path = tmp_path / "queue.json"
+    write_json(queue, path)
+    assert read_json(path) == queue
+    assert loads_json(path.read_bytes()) == queue
+    items = list(iter_json_items(path))
+    assert items == list(queue.items())
+    assert isinstance(items[0][1]["metadata"]["confidence"], float)
+
+
+# --------------------------------------------------------------------------- #
+# rate_limit.TokenBucket
+# --------------------------------------------------------------------------- #
+
+
+def test_token_bucket_only_waits_when_empty(monkeypatch):
+    from utilities.core import rate_limit
+
+    clock = {"now": 100.0}
+    sleeps = []
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        clock["now"] += seconds
+
+    monkeypatch.setattr(rate_limit.time, "monotonic", lambda: clock["now"])
+    monkeypatch.setattr(rate_limit.time, "sleep", fake_sleep)
+
+    bucket = rate_limit.TokenBucket(rate=1.0)
+    bucket.acquire()              # full bucket: no wait
+    clock["now"] += 0.25
+    bucket.acquire()              # 0.25s of refill: waits the remaining 0.75s
+    clock["now"] += 5.0
+    bucket.acquire()              # a slow response already covered the spacing
+    assert sleeps == [pytest.approx(0.75)]
+
+
+# --------------------------------------------------------------------------- #
+# audio_file.read_easy_id3
+# --------------------------------------------------------------------------- #
+
+
+def test_read_easy_id3_shares_one_parse_per_file_version(tmp_path):
+    from mutagen.easyid3 import EasyID3
+
+    from utilities.core.audio_file import read_easy_id3
+
+    mp3 = tmp_path / "01 Track.mp3"
+    make_audio(mp3, "libmp3lame")
+    tags = EasyID3(str(mp3))
+    tags["title"] = "First"
+    tags.save()
+
+    first = read_easy_id3(mp3)
+    assert read_easy_id3(str(mp3)) is first  # Path and str share the entry
+
+    tags["title"] = "Second, a longer title"
+    tags.save()
+    assert read_easy_id3(mp3)["title"] == ["Second, a longer title"]
@@ -83,7 +83,130 @@ def test_embed_in_album_fail_soft(tmp_path):
     assert (tmp_path / "folder.jpg").exists()
 
 
+def test_embed_in_album_validates_source_once(tmp_path, monkeypatch):
+    album = tmp_path / "Album"
+    album.mkdir()
+    for name, codec in AUDIO:
+        make_audio(album / name, codec)
+    png = make_image_bytes(fmt="PNG")
+
+    calls = []
+    real_validate = cover_art.validate_image
+    monkeypatch.setattr(cover_art, "validate_image", lambda d: calls.append(1) or real_validate(d))
+    monkeypatch.setattr(cover_art, "ffprobe_available", lambda: True)
+    monkeypatch.setattr(cover_art, "attached_pic_dims", lambda p: (64, 64))
+
+    result = cover_art.embed_in_album(album, png, write_folder_jpg=False)
+    assert result["embedded"] == 3 and len(calls) == 1
+    assert all(cover_art.extract_cover_from_file(album / n) == png for n, _ in AUDIO)
+
+
 def test_embed_in_album_invalid_source_raises(tmp_path):
     make_audio(tmp_path / "a.mp3", "libmp3lame")
     with pytest.raises(InvalidCoverArt):
         cover_art.embed_in_album(tmp_path, b"")
+
+
+class _FakeResponse:
+    def __init__(self, body, content_type, status_code=200, etag=None):
+        self.headers = {"content-type": content_type}
+        if etag:
+            self.headers["etag"] = etag
+        self.body = body
+        self.status_code = status_code
+        self.read = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        self.read = True
+        for i in range(0, len(self.body), chunk_size):
+            yield self.body[i:i + chunk_size]
+
+
+def test_download_cover_streams_over_shared_session(monkeypatch):
+    image = make_image_bytes(size=(640, 640))
+    responses = []
+
+    def fake_get(url, **kwargs):
+        assert kwargs["stream"] is True
+        ok = "ok" in url
+        responses.append(_FakeResponse(image if ok else b"<html>",
+                                       "image/jpeg" if ok else "text/html"))
+        return responses[-1]
+
+    monkeypatch.setattr(cover_art._SESSION, "get", fake_get)
+    monkeypatch.setattr(cover_art, "DOWNLOAD_CHUNK", 1000)
+    assert cover_art.download_cover("https://art/ok.jpg") == image
+
+    with pytest.raises(InvalidCoverArt, match="not an image"):
+        cover_art.download_cover("https://art/missing")
+    assert responses[-1].read is False  # HTML body never pulled down
+
+
+def test_download_cover_cache_revalidates_with_etag(monkeypatch, tmp_path):
+    image = make_image_bytes(size=(640, 640))
+    sent = []
+
+    def fake_get(url, **kwargs):
+        sent.append(kwargs["headers"].get("If-None-Match"))
+        if sent[-1] == '"v1"':
+            return _FakeResponse(b"", "image/jpeg", status_code=304)
+        return _FakeResponse(image, "image/jpeg", etag='"v1"')
+
+    monkeypatch.setattr(cover_art._SESSION, "get", fake_get)
+    url = "https://coverartarchive.org/release/abc/front-1200"
+    assert cover_art.download_cover(url, cache_dir=tmp_path) == image
+    assert cover_art.download_cover(url, cache_dir=tmp_path) == image
+    assert sent == [None, '"v1"']  # second call was a conditional 304
+
+
+def test_download_cover_cache_falls_back_to_last_modified(monkeypatch, tmp_path):
+    image = make_image_bytes(size=(640, 640))
+    stamp = "Wed, 21 Oct 2015 07:28:00 GMT"
+    sent = []
+
+    def fake_get(url, **kwargs):
+        sent.append(kwargs["headers"])
+        if kwargs["headers"].get("If-Modified-Since") == stamp:
+            return _FakeResponse(b"", "image/jpeg", status_code=304)
+        response = _FakeResponse(image, "image/jpeg")  # no ETag
+        response.headers["last-modified"] = stamp
+        return response
+
+    monkeypatch.setattr(cover_art._SESSION, "get", fake_get)
+    url = "https://coverartarchive.org/release/abc/front-1200"
+    assert cover_art.download_cover(url, cache_dir=tmp_path) == image
+    assert cover_art.download_cover(url, cache_dir=tmp_path) == image
+    assert sent == [{}, {"If-Modified-Since": stamp}]
+
+
+def test_http_session_retries_transient_statuses():
+    session = cover_art.new_http_session()
+    retry = session.get_adapter("https://coverartarchive.org/").max_retries
+    assert retry.total == cover_art.HTTP_RETRIES
+    assert 503 in retry.status_forcelist and 404 not in retry.status_forcelist
+    assert session.headers["User-Agent"] == cover_art.DEFAULT_HEADERS["User-Agent"]
+    # JSON lookups (MusicBrainz) come back compressed; requests decodes them.
+    assert "gzip" in session.headers["Accept-Encoding"]
+
+
+def test_reembed_is_written_in_place(audio_file):
+    cover_art.embed_in_file(audio_file, make_image_bytes(size=(1500, 1500)), verify=False)
+    size = audio_file.stat().st_size
+
+    # Smaller, then larger-again replacement art both fit the padding left by
+    # the first embed: the file size never changes, i.e. the audio data is not
+    # moved by either save.
+    for image in (make_image_bytes(size=(640, 640)),
+                  make_image_bytes(size=(1500, 1500), color=(30, 30, 200))):
+        cover_art.embed_in_file(audio_file, image, verify=False)
+        assert audio_file.stat().st_size == size
+        assert cover_art.extract_cover_from_file(audio_file) == image
@@ -6,13 +6,15 @@ that merges tracks into one flat folder with discnumber metadata set and the
 source folders removed.
 """
 
+import os
+
 import pytest
 
 from mutagen.mp3 import MP3
 from mutagen.easyid3 import EasyID3
 
 from tests.synth import make_audio
-from utilities.disc_consolidator import DiscConsolidator
+from utilities.disc_consolidator import DiscConsolidator, PlannedTrack, _fast_copy
 
 
 def _build_two_disc_album(root):
@@ -53,10 +55,15 @@ def test_parse_folder_name(folder_name, expected):
     assert DiscConsolidator().parse_folder_name(folder_name) == expected
 
 
-def test_dry_run_makes_no_changes(tmp_path):
+def test_dry_run_makes_no_changes(tmp_path, capsys):
     disc1, disc2 = _build_two_disc_album(tmp_path)
     results = DiscConsolidator().consolidate_all(tmp_path, dry_run=True)
 
+    # The preview lists the same per-track plan a real run would execute.
+    out = capsys.readouterr().out
+    assert "Would move: 01 One.mp3 -> 1-01 One.mp3" in out
+    assert "Would move: 02 Four.mp3 -> 2-02 Four.mp3" in out
+
     assert results["found"] == 1
     assert results["consolidated"] == 1
     # Source folders untouched; no merged target created.
@@ -92,6 +99,101 @@ def test_consolidate_merges_and_sets_metadata(tmp_path):
     assert disc2_track["discnumber"][0] == "2/2"
 
 
+def test_copy_mode_keeps_source_folders(tmp_path):
+    disc1, disc2 = _build_two_disc_album(tmp_path)
+    results = DiscConsolidator().consolidate_all(tmp_path, dry_run=False, copy=True)
+
+    assert results["consolidated"] == 1
+    target = tmp_path / "Test Album"
+    names = sorted(p.name for p in target.glob("*.mp3"))
+    assert names == ["1-01 One.mp3", "1-02 Two.mp3", "2-01 Three.mp3", "2-02 Four.mp3"]
+
+    # Copies were tagged in memory on the way through.
+    copied = MP3(str(target / "2-02 Four.mp3"), ID3=EasyID3)
+    assert copied["discnumber"][0] == "2/2"
+    assert copied["album"][0] == "Test Album"
+
+    # Sources untouched: still present with their original names.
+    assert sorted(p.name for p in disc1.glob("*.mp3")) == ["01 One.mp3", "02 Two.mp3"]
+    assert sorted(p.name for p in disc2.glob("*.mp3")) == ["01 Three.mp3", "02 Four.mp3"]
+
+
+def test_cover_art_from_detection_is_carried_over(tmp_path):
+    disc1, disc2 = _build_two_disc_album(tmp_path)
+    (disc2 / "Cover.jpg").write_bytes(b"jpeg")
+
+    consolidator = DiscConsolidator()
+    consolidator.detect_multi_disc(tmp_path)
+    assert [d.covers for d in consolidator.disc_sets["Test Album"]] == [[], ["Cover.jpg"]]
+
+    consolidator.consolidate_all(tmp_path, dry_run=False)
+    assert (tmp_path / "Test Album" / "folder.jpg").read_bytes() == b"jpeg"
+    assert not disc2.exists()
+
+
+def test_same_named_tracks_on_two_discs_do_not_collide(tmp_path):
+    disc1 = tmp_path / "Test Album [Disc 1]"
+    disc2 = tmp_path / "Test Album [Disc 2]"
+    disc1.mkdir()
+    disc2.mkdir()
+    # Already "prefixed" names are kept as-is, so both discs plan "01-Intro.mp3".
+    make_audio(disc1 / "01-Intro.mp3", "libmp3lame")
+    make_audio(disc2 / "01-Intro.mp3", "libmp3lame")
+
+    DiscConsolidator().consolidate_all(tmp_path, dry_run=False)
+    names = sorted(p.name for p in (tmp_path / "Test Album").glob("*.mp3"))
+    assert names == ["01-Intro.mp3", "2-01-Intro.mp3"]
+
+
+def test_move_over_existing_destination_replaces_it(tmp_path):
+    disc = tmp_path / "Test Album [Disc 2]"
+    target = tmp_path / "Test Album"
+    disc.mkdir()
+    target.mkdir()
+    make_audio(disc / "01 One.mp3", "libmp3lame")
+    (target / "2-01 One.mp3").write_bytes(b"stale")
+    track = PlannedTrack("01 One.mp3", "2-01 One.mp3",
+                         str(disc / "01 One.mp3"), str(target / "2-01 One.mp3"))
+
+    log = DiscConsolidator()._transfer_track(track, "Test Album", 2, 2, same_folder=False,
+                                             same_fs=True, copy=False)
+
+    assert log == ["    Moved: 01 One.mp3 -> 2-01 One.mp3"]
+    assert not (disc / "01 One.mp3").exists()
+    assert MP3(str(target / "2-01 One.mp3"), ID3=EasyID3)["discnumber"][0] == "2/2"
+
+
+@pytest.mark.parametrize("name,codec", [
+    ("t.mp3", "libmp3lame"), ("t.m4a", "aac"), ("t.flac", "flac"),
+])
+def test_set_track_metadata_skips_save_when_tags_match(tmp_path, name, codec):
+    track = tmp_path / name
+    make_audio(track, codec)
+
+    assert DiscConsolidator._set_track_metadata(str(track), "Album", 1, 2) is True
+    os.utime(track, (1_000_000_000, 1_000_000_000))
+    assert DiscConsolidator._set_track_metadata(str(track), "Album", 1, 2) is False
+    assert track.stat().st_mtime == 1_000_000_000
+
+
+def test_consolidate_all_with_worker_processes(tmp_path, capsys):
+    _build_two_disc_album(tmp_path)
+    for n in (1, 2):
+        disc = tmp_path / f"Other Album (CD {n})"
+        disc.mkdir()
+        make_audio(disc / f"0{n} Song.mp3", "libmp3lame")
+
+    results = DiscConsolidator().consolidate_all(tmp_path, dry_run=False, jobs=2)
+
+    assert results["consolidated"] == 2
+    assert results["errors"] == 0
+    assert sorted(p.name for p in (tmp_path / "Other Album").glob("*.mp3")) == \
+        ["1-01 Song.mp3", "2-02 Song.mp3"]
+    assert len(list((tmp_path / "Test Album").glob("*.mp3"))) == 4
+    # Worker logs are relayed to the parent's stdout.
+    assert "Consolidation complete!" in capsys.readouterr().out
+
+
 def test_orphaned_disc_not_consolidated(tmp_path):
     (tmp_path / "Lonely Album [Disc 1]").mkdir()
     make_audio(tmp_path / "Lonely Album [Disc 1]" / "01 Solo.mp3", "libmp3lame")
@@ -104,3 +206,15 @@ def test_orphaned_disc_not_consolidated(tmp_path):
     assert "Lonely Album" in consolidator.orphaned_discs
     # Orphan left in place.
     assert (tmp_path / "Lonely Album [Disc 1]").exists()
+
+
+def test_fast_copy_preserves_bytes_and_mtime(tmp_path):
+    src = tmp_path / "src.mp3"
+    src.write_bytes(b"ID3" + bytes(range(256)) * 4096)
+    os.utime(src, (1_000_000_000, 1_000_000_000))
+    dst = tmp_path / "dst.mp3"
+
+    _fast_copy(str(src), str(dst))
+
+    assert dst.read_bytes() == src.read_bytes()
+    assert dst.stat().st_mtime == src.stat().st_mtime
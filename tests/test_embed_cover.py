@@ -0,0 +1,70 @@
+"""Tests for the embed_cover CLI helpers (skip-if-same and folder.jpg sync)."""
+
+from tests.synth import make_audio, make_image_bytes
+from utilities import embed_cover
+from utilities.core import cover_art
+
+
+def _album_with_art(tmp_path, image):
+    album = tmp_path / "Album"
+    album.mkdir()
+    make_audio(album / "01 One.mp3", "libmp3lame")
+    make_audio(album / "02 Two.mp3", "libmp3lame")
+    cover = tmp_path / "cover.jpg"
+    cover.write_bytes(image)
+    assert embed_cover.embed_cover_album(str(album), str(cover)) == 2
+    return album, cover
+
+
+def test_embed_cover_album_skips_identical_art(tmp_path):
+    album, cover = _album_with_art(tmp_path, make_image_bytes())
+    assert embed_cover.embed_cover_album(str(album), str(cover)) == 0
+    assert embed_cover.embed_cover_album(str(album), str(cover), force=True) == 2
+
+    other = tmp_path / "other.jpg"
+    other.write_bytes(make_image_bytes(color=(10, 200, 10)))
+    assert embed_cover.embed_cover_album(str(album), str(other)) == 2
+
+
+def test_embed_cover_album_rewrites_only_differing_tracks(tmp_path):
+    image = make_image_bytes()
+    album, cover = _album_with_art(tmp_path, image)
+    stray = make_image_bytes(color=(10, 200, 10))
+    cover_art.embed_in_file(album / "02 Two.mp3", stray)
+    first_mtime = (album / "01 One.mp3").stat().st_mtime_ns
+
+    assert embed_cover.embed_cover_album(str(album), str(cover)) == 1
+    assert (album / "01 One.mp3").stat().st_mtime_ns == first_mtime
+    assert cover_art.extract_cover_from_file(album / "02 Two.mp3") == image
+
+
+def test_sync_folder_jpg_from_embedded_art(tmp_path):
+    image = make_image_bytes()
+    album, _ = _album_with_art(tmp_path, image)
+
+    assert embed_cover.sync_folder_jpg(str(album)) is True
+    embedded = (album / "folder.jpg").read_bytes()
+    assert embedded == embed_cover.get_album_cover_hash(str(album))[1]
+    assert embed_cover.sync_folder_jpg(str(album)) is True  # already in sync
+
+
+def test_file_matches_compares_size_then_content(tmp_path):
+    path = tmp_path / "folder.jpg"
+    path.write_bytes(b"abcdef" * 50000)
+
+    assert embed_cover._file_matches(str(path), b"abcdef" * 50000)
+    assert not embed_cover._file_matches(str(path), b"abcdef" * 49999 + b"abcdeX")
+    assert not embed_cover._file_matches(str(path), b"abc")
+    assert not embed_cover._file_matches(str(tmp_path / "missing.jpg"), b"abc")
+
+
+def test_main_is_thin_wrapper_over_embed(tmp_path):
+    image = make_image_bytes()
+    album, cover = _album_with_art(tmp_path, make_image_bytes(color=(10, 200, 10)))
+    new_cover = tmp_path / "new.jpg"
+    new_cover.write_bytes(image)
+
+    assert embed_cover.main([str(album), str(new_cover)]) == 0
+    assert (album / "folder.jpg").read_bytes() == image
+    assert embed_cover.embed(str(album), str(new_cover)) == 0  # already matches
+    assert embed_cover.main([str(album)]) == 1  # image source required
@@ -0,0 +1,123 @@
+"""Tests for the library metadata audit (scan, cover-art info, outputs)."""
+
+import csv
+
+import pytest
+
+from tests.synth import make_audio, make_image_bytes
+from utilities import extract_metadata as em
+from utilities.core import cover_art
+
+
+def _build_tree(root):
+    album = root / "Artist" / "Album"
+    album.mkdir(parents=True)
+    make_audio(album / "01 One.mp3", "libmp3lame")
+    make_audio(album / "02 Two.flac", "flac")
+    make_audio(album / "03 Three.m4a", "aac")
+    (album / "notes.txt").write_text("not audio")
+    return album
+
+
+def test_scan_directory_pool_matches_serial(tmp_path, monkeypatch):
+    _build_tree(tmp_path)
+    serial = em.scan_directory(str(tmp_path), jobs=1)
+
+    monkeypatch.setattr(em, "_POOL_MIN_FILES", 1)
+    pooled = em.scan_directory(str(tmp_path), jobs=2)
+
+    assert pooled == serial
+    assert sorted(r["filepath"].rsplit("/", 1)[-1] for r in serial) == \
+        ["01 One.mp3", "02 Two.flac", "03 Three.m4a"]
+
+
+@pytest.mark.parametrize("name,codec,mime", [
+    ("t.mp3", "libmp3lame", "image/jpeg"),
+    ("t.flac", "flac", "image/jpeg"),
+    ("t.m4a", "aac", "image"),
+])
+def test_cover_art_info_reports_embedded_picture(tmp_path, name, codec, mime):
+    track = tmp_path / name
+    make_audio(track, codec)
+    assert em.get_cover_art_info(str(track)) is None
+
+    image = make_image_bytes()
+    cover_art.embed_in_file(track, image)
+    assert em.get_cover_art_info(str(track)) == f"embedded:{mime}:{len(image)}bytes"
+
+
+def test_cover_art_info_falls_back_to_cover_file(tmp_path):
+    album = _build_tree(tmp_path)
+    assert em.scan_directory(str(tmp_path), jobs=1)[0]["cover_art"] is None
+
+    (album / "Folder.jpg").write_bytes(b"x")
+    (album / "front.png").write_bytes(b"x")
+    results = em.scan_directory(str(tmp_path), jobs=1)  # fresh listing per scan
+    assert {r["cover_art"] for r in results} == {str(album / "Folder.jpg")}
+
+
+def test_build_structured_json_groups_and_sorts_tracks():
+    results = [
+        {"filepath": "/m/2.mp3", "artist": "A", "album": "X", "tracknumber": "2/9",
+         "title": "Two", "genre": "Rock", "missing_fields": []},
+        {"filepath": "/m/1.mp3", "artist": "A", "album": "X", "tracknumber": "1",
+         "title": "One", "date": "2001", "cover_art": "/m/cover.jpg", "missing_fields": []},
+        {"filepath": "/m/x.mp3", "missing_fields": ["artist"]},
+    ]
+    out = em.build_structured_json(results)
+
+    assert type(out) is dict and type(out["A"]) is dict
+    album = out["A"]["X"]
+    assert (album["CoverArt"], album["Date"], album["Genre"]) == ("/m/cover.jpg", "2001", "Rock")
+    assert [t["TrackNumber"] for t in album["Tracks"]] == [1, 2]
+    assert out["Unknown Artist"]["Unknown Album"]["Tracks"][0]["Title"] == "x.mp3"
+
+
+def test_write_csv_rows(tmp_path):
+    results = [
+        {"filepath": "/m/1.mp3", "artist": "A", "album": "X", "tracknumber": "1",
+         "title": "One", "missing_fields": []},
+        {"filepath": "/m/x.mp3", "artist": None, "missing_fields": ["artist", "title"]},
+    ]
+    path = tmp_path / "audit.csv"
+    em.write_csv(results, str(path))
+
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    assert rows[0][0] == "FilePath" and len(rows) == 3
+    assert rows[1] == ["/m/1.mp3", "A", "X", "", "1", "One", "", "", ""]
+    assert rows[2] == ["/m/x.mp3", "", "", "", "", "", "", "", "artist;title"]
+
+
+def test_scan_cache_reuses_unchanged_files(tmp_path, monkeypatch):
+    album = _build_tree(tmp_path / "lib")
+    cache = tmp_path / "scan_cache.json"
+    first = em.scan_directory(str(tmp_path / "lib"), jobs=1, cache_path=str(cache))
+
+    parsed = []
+    real_extract = em.extract_metadata
+    monkeypatch.setattr(em, "extract_metadata", lambda p: parsed.append(p) or real_extract(p))
+
+    # Nothing changed: no file is parsed, results are identical.
+    assert em.scan_directory(str(tmp_path / "lib"), jobs=1, cache_path=str(cache)) == first
+    assert parsed == []
+
+    # A retagged file is parsed again; a new folder.jpg shows up without a re-parse.
+    track = album / "02 Two.flac"
+    track.write_bytes(track.read_bytes() + b"\0")
+    (album / "folder.jpg").write_bytes(b"x")
+    again = em.scan_directory(str(tmp_path / "lib"), jobs=1, cache_path=str(cache))
+    assert [p.rsplit("/", 1)[-1] for p in parsed] == ["02 Two.flac"]
+    assert {r["cover_art"] for r in again} == {str(album / "folder.jpg")}
+
+
+def test_scan_cache_hit_reports_current_path(tmp_path, monkeypatch):
+    _build_tree(tmp_path / "lib")
+    cache = tmp_path / "scan_cache.json"
+    em.scan_directory(str(tmp_path / "lib"), jobs=1, cache_path=str(cache))
+
+    # Same files, reached through a relative base path this time.
+    monkeypatch.chdir(tmp_path)
+    again = em.scan_directory("lib", jobs=1, cache_path=str(cache))
+    assert again and all(r["filepath"].startswith("lib") for r in again)
+    assert list(tmp_path.glob("*.tmp")) == []
@@ -8,11 +8,14 @@ in the real scan/expected-name path.
 
 import pytest
 from mutagen.easyid3 import EasyID3
+from mutagen.id3 import ID3, TIT2
 from mutagen.mp3 import MP3
 
 from tests.synth import make_audio
+from utilities.core.audio_file import read_id3_album
 from utilities.core.naming import MAX_LENGTH, make_windows_safe
-from utilities.folder_validator import FolderValidator
+from utilities import folder_validator
+from utilities.folder_validator import FolderIssue, FolderValidator, IssueType
 
 
 def test_colon_becomes_dash():
@@ -42,6 +45,19 @@ def test_length_capped():
     assert len(result) <= MAX_LENGTH
 
 
+def test_fullwidth_colon_transliterated_then_replaced():
+    assert make_windows_safe("Album\uff1a X") == "Album - X"
+
+
+@pytest.mark.parametrize("folder,album", [
+    ("Album [Disc 2]", "Album"),
+    ("Album cd1", "Album"),
+    ("Hits", "Greatest Hits Disc2"),
+])
+def test_categorize_issue_multi_disc(folder, album):
+    assert FolderValidator().categorize_issue(folder, album) is IssueType.MULTI_DISC
+
+
 def _set_album(folder, album):
     mp3 = folder / "01 Track.mp3"
     make_audio(mp3, "libmp3lame")
@@ -51,6 +67,21 @@ def _set_album(folder, album):
     audio.save()
 
 
+@pytest.mark.parametrize("folder,album,expected", [
+    ("Greatest Hits Volu", "Greatest Hits Volume One", IssueType.TRUNCATED),
+    ("greatest hits vXYZ", "Greatest Hits Volume One", IssueType.TRUNCATED),  # slack + case
+    ("Greatest Misses", "Greatest Hits Volume One", IssueType.MISMATCH),
+])
+def test_categorize_issue_truncation(folder, album, expected):
+    assert FolderValidator().categorize_issue(folder, album) is expected
+
+
+def test_categorize_issue_decomposed_accent_is_substitution():
+    validator = FolderValidator()
+    for folder in ("Caf\u00e9 Hits", "Cafe\u0301 Hits"):  # NFC and NFD spellings
+        assert validator.categorize_issue(folder, "Cafe Hits Live") is IssueType.SUBSTITUTION
+
+
 def test_folder_validator_detects_and_fixes(tmp_path):
     # Folder name uses a colon-substituted form; metadata has the colon.
     bad = tmp_path / "Greatest Hits_ Volume 1"
@@ -73,3 +104,100 @@ def test_folder_validator_detects_and_fixes(tmp_path):
     assert validator.fix_issue(issue) is True
     assert (tmp_path / "Greatest Hits - Volume 1").exists()
     assert not bad.exists()
+
+
+def test_folder_validator_rescan_uses_cached_album(tmp_path, monkeypatch):
+    folder = tmp_path / "Greatest Hits_ Volume 1"
+    folder.mkdir()
+    _set_album(folder, "Greatest Hits: Volume 1")
+    (tmp_path / "notes.txt").write_text("not a folder")
+
+    validator = FolderValidator()
+    assert validator.fix_all(tmp_path, dry_run=True)["scanned"] == 1
+
+    monkeypatch.setattr(folder_validator, "read_id3_album", lambda path: pytest.fail("re-read unchanged file"))
+    monkeypatch.setattr(folder_validator, "read_easy_id3", lambda path: pytest.fail("re-read unchanged file"))
+    assert [i.expected_name for i in validator.scan(tmp_path)] == ["Greatest Hits - Volume 1"]
+
+
+def test_folder_validator_parallel_scan_matches_serial(tmp_path):
+    for i in range(6):
+        folder = tmp_path / f"Album_ {i}"
+        folder.mkdir()
+        _set_album(folder, f"Album: {i}")
+    (tmp_path / "Clean").mkdir()
+    _set_album(tmp_path / "Clean", "Clean")
+
+    serial = FolderValidator().scan(tmp_path, max_workers=1)
+    parallel = FolderValidator().scan(tmp_path, max_workers=4)
+    assert parallel == serial
+    assert [i.expected_name for i in serial] == [f"Album - {i}" for i in range(6)]
+
+
+@pytest.mark.parametrize("v2_version", [3, 4])
+def test_read_id3_album_matches_mutagen(tmp_path, v2_version):
+    folder = tmp_path / "album"
+    folder.mkdir()
+    _set_album(folder, "Café: Ünïcode Hits")
+    mp3 = folder / "01 Track.mp3"
+    audio = MP3(str(mp3), ID3=EasyID3)
+    audio.save(v2_version=v2_version)
+
+    assert read_id3_album(mp3) == EasyID3(str(mp3))["album"][0]
+    (tmp_path / "bare.mp3").write_bytes(b"\xff\xfb\x90\x00" * 8)
+    assert read_id3_album(tmp_path / "bare.mp3") == ""  # no tag at all: nothing to parse
+
+
+def test_read_id3_album_truncated_tag_defers_to_mutagen(tmp_path):
+    tag = b"ID3\x03\x00\x00" + bytes([0, 0, 8, 0])  # declares a 1024-byte tag
+    album = b"TALB" + (20).to_bytes(4, "big") + b"\x00\x00" + b"\x00Album"
+    for body in (b"", album[:6], album):  # ends in a frame header / in the payload
+        mp3 = tmp_path / "cut.mp3"
+        mp3.write_bytes(tag + body)
+        assert read_id3_album(mp3) is None
+
+
+def test_folder_validator_scan_survives_truncated_mp3(tmp_path):
+    folder = tmp_path / "Cut Album"
+    folder.mkdir()
+    (folder / "01 Track.mp3").write_bytes(b"ID3\x03\x00\x00" + bytes([0, 0, 8, 0]) + b"TA")
+    assert FolderValidator().scan(tmp_path) == []
+
+
+def test_read_id3_album_id3v1_only(tmp_path):
+    v1 = b"TAG" + b"Title".ljust(30, b"\x00") + b"Artist".ljust(30, b"\x00") \
+        + "Café Album".encode("latin-1").ljust(30, b"\x00") + b"1999" + bytes(31)
+    mp3 = tmp_path / "v1.mp3"
+    mp3.write_bytes(b"\xff\xfb\x90\x00" * 64 + v1)
+    assert read_id3_album(mp3) == "Café Album" == EasyID3(str(mp3))["album"][0]
+
+
+def test_read_id3_album_falls_back_to_id3v1_without_talb(tmp_path):
+    mp3 = tmp_path / "v2v1.mp3"
+    mp3.write_bytes(b"")
+    tags = ID3()
+    tags.add(TIT2(encoding=3, text=["Title only"]))  # ID3v2 tag with no TALB
+    tags.save(str(mp3))
+    v1 = b"TAG" + bytes(60) + b"V1 Album".ljust(30, b"\x00") + bytes(35)
+    with open(mp3, "ab") as handle:
+        handle.write(b"\xff\xfb\x90\x00" * 64 + v1)
+
+    assert read_id3_album(mp3) == "V1 Album" == EasyID3(str(mp3))["album"][0]
+
+
+def test_rename_all_handles_swaps_and_chains(tmp_path):
+    for name in ("A", "B", "C", "D", "Taken", "Other"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "marker.txt").write_text(name)
+
+    def issue(src, dst):
+        return FolderIssue(tmp_path / src, src, dst, dst, IssueType.MISMATCH)
+
+    # A<->B swap, C->D while D->E, and a target that really is occupied.
+    issues = [issue("A", "B"), issue("B", "A"), issue("C", "D"), issue("D", "E"),
+              issue("Taken", "Other")]
+    assert FolderValidator().rename_all(issues) == {"fixed": 4, "skipped": 1, "errors": 0}
+
+    contents = {p.name: (p / "marker.txt").read_text() for p in tmp_path.iterdir()}
+    assert contents == {"A": "B", "B": "A", "D": "C", "E": "D", "Taken": "Taken",
+                        "Other": "Other"}
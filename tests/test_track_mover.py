@@ -0,0 +1,100 @@
+"""Tests for TrackMover.
+
+Tracks are tag-only MP3 files (an ID3 tag and no audio), which is all the
+mover reads or writes, so no encoder is needed.
+"""
+
+import errno
+
+from mutagen.easyid3 import EasyID3
+
+from utilities import track_mover
+from utilities.track_mover import TrackMover
+
+
+def _tagged_mp3(path, **tags):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"")
+    audio = EasyID3()
+    audio.update(tags)
+    audio.save(str(path))
+    return path
+
+
+def test_move_renames_from_tag_and_updates_metadata(tmp_path):
+    source = _tagged_mp3(tmp_path / "Old" / "1-05 Wrong Name.mp3", title="Real Title")
+    (tmp_path / "Old" / "folder.jpg").write_bytes(b"jpeg")
+
+    assert TrackMover().move(source, tmp_path / "New", track_number="3/12",
+                             album="New Album", artist="Artist")
+
+    moved = tmp_path / "New" / "03 Real Title.mp3"
+    tags = EasyID3(str(moved))
+    assert tags["album"] == ["New Album"] and tags["albumartist"] == ["Artist"]
+    assert tags["tracknumber"] == ["3/12"] and tags["title"] == ["Real Title"]
+    # Only folder.jpg was left behind: it and the folder are removed.
+    assert not (tmp_path / "Old").exists()
+
+
+def test_tag_is_parsed_once(tmp_path, monkeypatch):
+    source = _tagged_mp3(tmp_path / "Old" / "01 Song.mp3", title="Song")
+    reads = []
+    real_read = track_mover._read_tags
+    monkeypatch.setattr(track_mover, "_read_tags", lambda path: reads.append(path) or real_read(path))
+
+    TrackMover().move(source, tmp_path / "New", track_number="2", album="New Album")
+
+    assert reads == [str(source)]
+    assert EasyID3(str(tmp_path / "New" / "02 Song.mp3"))["album"] == ["New Album"]
+
+
+def test_title_from_filename_skips_the_tag(tmp_path, monkeypatch):
+    source = _tagged_mp3(tmp_path / "Old" / "1-05 Real Title.mp3", title="Tag Title")
+
+    def no_read(path):
+        raise AssertionError("tag should not be read")
+
+    monkeypatch.setattr(track_mover, "_read_tags", no_read)
+    assert TrackMover().move(source, tmp_path / "New", track_number="3",
+                             title_from_filename=True)
+    assert (tmp_path / "New" / "03 Real Title.mp3").exists()
+
+
+def test_title_from_filename_falls_back_to_tag_for_short_names(tmp_path):
+    source = _tagged_mp3(tmp_path / "Old" / "07.mp3", title="Tag Title")
+    TrackMover().move(source, tmp_path / "New", track_number="7", title_from_filename=True)
+    assert (tmp_path / "New" / "07 Tag Title.mp3").exists()
+
+
+def test_move_replaces_existing_destination(tmp_path):
+    source = _tagged_mp3(tmp_path / "Old" / "01 Song.mp3", title="Song")
+    (tmp_path / "Old" / "notes.txt").write_text("keep")
+    dest = tmp_path / "New"
+    dest.mkdir()
+    (dest / "01 Song.mp3").write_bytes(b"stale")
+
+    assert TrackMover().move(source, dest)
+
+    assert EasyID3(str(dest / "01 Song.mp3"))["title"] == ["Song"]
+    # Other files remain, so the source folder is kept.
+    assert sorted(p.name for p in (tmp_path / "Old").iterdir()) == ["notes.txt"]
+
+
+def test_move_across_devices_falls_back_to_copy(tmp_path, monkeypatch):
+    source = _tagged_mp3(tmp_path / "Old" / "01 Song.mp3", title="Song")
+    (tmp_path / "New").mkdir()
+
+    def cross_device(src, dst):
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    monkeypatch.setattr(track_mover.os, "replace", cross_device)
+    assert TrackMover().move(source, tmp_path / "New", album="New Album")
+
+    assert not source.exists()
+    assert EasyID3(str(tmp_path / "New" / "01 Song.mp3"))["album"] == ["New Album"]
+
+
+def test_missing_source_reports_failure(tmp_path, capsys):
+    assert not TrackMover().move(tmp_path / "Old" / "gone.mp3", tmp_path / "New")
+    assert "Source not found" in capsys.readouterr().out
+    assert not (tmp_path / "New").exists()
@@ -0,0 +1,305 @@
+"""Tests for the Various Artists validator: local tag reading and lookup plumbing.
+
+The MusicBrainz and Cover Art Archive requests (_search_release_group,
+_has_cover_art) are stubbed, so no network is required.
+"""
+
+import json
+import threading
+import time
+
+import pytest
+from mutagen.flac import FLAC, Picture
+from mutagen.id3 import APIC, ID3, TALB, TIT2, TPE1, TRCK
+from mutagen.mp4 import MP4, MP4Cover
+
+from tests.synth import make_audio, make_image_bytes
+from utilities import validate_various_artists as vva
+from utilities.core.ffprobe import ffprobe_available
+
+
+def _release(*disc_titles):
+    """A slimmed MusicBrainz release with one medium per list of titles."""
+    return {
+        "id": "rel-1",
+        "title": "Now Hits",
+        "artist-credit": [{"name": "Various Artists"}],
+        "media": [{"track-count": len(titles), "tracks": [{"title": t} for t in titles]}
+                  for titles in disc_titles],
+    }
+
+
+def _local(folder, titles, *, album="Now Hits", has_cover=True):
+    """Local album metadata as get_local_album_metadata returns it."""
+    return {
+        "folder_name": folder,
+        "track_count": len(titles),
+        "tracks": [{"filename": f"{n:02d} {t}.mp3", "title": t, "artist": None,
+                    "track_num": n, "album": album, "has_embedded_cover": False}
+                   for n, t in enumerate(titles, 1)],
+        "has_cover": has_cover,
+        "album_title": album,
+    }
+
+
+@pytest.fixture(autouse=True)
+def _fresh_lookups():
+    """Each test starts without the run's remembered requests and lookups."""
+    vva._REQUESTS.clear()
+    vva._lookup_release.cache_clear()
+    yield
+    vva._REQUESTS.clear()
+    vva._lookup_release.cache_clear()
+
+
+def _tagged_mp3(path, title, album, number, *, artist=None, cover=False):
+    """A tag-only MP3 (ID3 tag, no audio): all the local reader looks at."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"")
+    tags = ID3()
+    tags.add(TIT2(encoding=3, text=[title]))
+    tags.add(TALB(encoding=3, text=[album]))
+    tags.add(TRCK(encoding=3, text=[number]))
+    if artist:
+        tags.add(TPE1(encoding=3, text=[artist]))
+    if cover:
+        tags.add(APIC(encoding=3, mime="image/jpeg", type=3, desc="", data=make_image_bytes()))
+    tags.save(str(path))
+    return path
+
+
+def test_read_track_mp3_with_total_and_cover(tmp_path):
+    path = _tagged_mp3(tmp_path / "03 Song.mp3", "Song", "Now Hits", "3/12",
+                       artist="Singer", cover=True)
+
+    info, error = vva._read_track(str(path), path.name)
+
+    assert error is None
+    assert info == {"filename": "03 Song.mp3", "title": "Song", "artist": "Singer",
+                    "track_num": 3, "album": "Now Hits", "has_embedded_cover": True}
+
+
+def test_untagged_mp3_reads_as_empty(tmp_path):
+    path = tmp_path / "01 Untagged.mp3"
+    path.write_bytes(b"\xff\xfb\x90\x00" + b"\x00" * 400)
+
+    info, error = vva._read_track(str(path), path.name)
+
+    assert error is None
+    assert (info["title"], info["album"], info["track_num"]) == (None, None, None)
+    assert info["has_embedded_cover"] is False
+
+
+@pytest.mark.skipif(not ffprobe_available(), reason="needs bundled ffmpeg")
+def test_album_metadata_reads_flac_and_m4a(tmp_path):
+    flac = make_audio(tmp_path / "01 One.flac", "flac")
+    audio = FLAC(str(flac))
+    audio.update({"title": "One", "album": "Now Hits", "tracknumber": "1/2"})
+    picture = Picture()
+    picture.type, picture.mime, picture.data = 3, "image/jpeg", make_image_bytes()
+    audio.add_picture(picture)
+    audio.save()
+
+    m4a = make_audio(tmp_path / "02 Two.m4a", "aac")
+    audio = MP4(str(m4a))
+    audio["\xa9nam"], audio["\xa9alb"], audio["trkn"] = ["Two"], ["Now Hits"], [(2, 2)]
+    audio["covr"] = [MP4Cover(make_image_bytes(), imageformat=MP4Cover.FORMAT_JPEG)]
+    audio.save()
+    (tmp_path / "Folder.JPG").write_bytes(make_image_bytes())
+
+    local = vva.get_local_album_metadata(str(tmp_path))
+
+    assert local["track_count"] == 2 and local["album_title"] == "Now Hits"
+    assert local["has_cover"] is True  # cover names match case-insensitively
+    assert [(t["title"], t["track_num"], t["has_embedded_cover"]) for t in local["tracks"]] == [
+        ("One", 1, True), ("Two", 2, True)]
+
+
+@pytest.mark.parametrize("read_procs", [1, 2])
+def test_validate_all_albums_writes_report(tmp_path, monkeypatch, capsys, read_procs):
+    library = tmp_path / "Various Artists"
+    for n, title in enumerate(["A", "B"], 1):
+        _tagged_mp3(library / "Local Hits" / f"0{n} {title}.mp3", title, "Local Hits", str(n),
+                    cover=True)
+    for disc, titles in ((1, ["C", "D"]), (2, ["E"])):
+        for n, title in enumerate(titles, 1):
+            _tagged_mp3(library / f"Now Hits [Disc {disc}]" / f"0{n} {title}.mp3", title,
+                        "Now Hits", str(n))
+    searches = []
+
+    def search(search_name, artist):
+        searches.append(search_name)
+        return [_release(["C", "D"], ["E"])]
+
+    monkeypatch.setattr(vva, "_search_release_group", search)
+    monkeypatch.setattr(vva, "_has_cover_art", lambda release_id: True)
+    output = tmp_path / "report.json"
+
+    vva.validate_all_albums(str(library), output_file=str(output), jobs=2,
+                            read_procs=read_procs)
+
+    report = json.loads(output.read_text(encoding="utf-8"))
+    assert not (tmp_path / "report.json.partial").exists()
+    assert searches == ["Now Hits"]  # one search for both discs; Local Hits skipped
+    assert [a["folder_name"] for a in report["albums"]] == [
+        "Local Hits", "Now Hits [Disc 1]", "Now Hits [Disc 2]"]
+    assert report["albums"][0]["source"] == "local-fastpath"
+    assert [a["track_count_correct"] for a in report["albums"][1:]] == [2, 1]
+    assert report["summary"] == {"total": 3, "needs_attention": 2, "title_mismatches": 0,
+                                 "track_mismatches": 0, "missing_covers": 2, "not_found": 0}
+    out = capsys.readouterr().out
+    assert [line for line in out.splitlines() if line.startswith("[Validating]")] == [
+        "[Validating] Local Hits", "[Validating] Now Hits [Disc 1]",
+        "[Validating] Now Hits [Disc 2]"]
+
+
+def test_quiet_validate_album_still_prints_warnings(tmp_path, monkeypatch, capsys):
+    album = tmp_path / "Now Hits"
+    _tagged_mp3(album / "01 A.mp3", "A", "Now Hits", "1")  # no cover: looked up
+
+    def offline(search_name, artist):
+        raise OSError("offline")
+
+    monkeypatch.setattr(vva, "_search_release_group", offline)
+    comparison = vva.validate_album(str(album), verbose=False)
+
+    assert comparison["error"] == "Not found in MusicBrainz"
+    assert capsys.readouterr().out == "  MusicBrainz search error: offline\n"
+
+
+def test_concurrent_searches_share_one_request(monkeypatch):
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def search(search_name, artist):
+        calls.append(search_name)
+        started.set()
+        release.wait(5)
+        return [_release(["One"])]
+
+    monkeypatch.setattr(vva, "_search_release_group", search)
+    results = []
+    first = threading.Thread(target=lambda: results.append(vva._find_releases("Now Hits", "VA")))
+    second = threading.Thread(target=lambda: results.append(vva._find_releases("Now Hits", "VA")))
+    first.start()
+    assert started.wait(5)
+    second.start()
+    time.sleep(0.05)  # let the second caller join the running request
+    release.set()
+    first.join(5)
+    second.join(5)
+
+    assert calls == ["Now Hits"]
+    assert len(results) == 2 and results[0] is results[1]
+
+
+def test_failed_request_is_retried(monkeypatch):
+    calls = []
+
+    def search(search_name, artist):
+        calls.append(search_name)
+        if len(calls) == 1:
+            raise OSError("connection reset")
+        return [_release(["One"])]
+
+    monkeypatch.setattr(vva, "_search_release_group", search)
+    with pytest.raises(OSError):
+        vva._find_releases("Now Hits", "VA")
+    assert vva._find_releases("Now Hits", "VA")[0]["id"] == "rel-1"
+    assert len(calls) == 2
+
+
+def test_disc_folders_are_compared_with_their_own_disc(monkeypatch):
+    monkeypatch.setattr(vva, "_search_release_group",
+                        lambda search_name, artist: [_release(["A", "B"], ["C", "D", "E"])])
+    monkeypatch.setattr(vva, "_has_cover_art", lambda release_id: True)
+    folders = ["Now Hits [Disc 1]", "Now Hits [Disc 2]"]
+    locals_ = {"Now Hits [Disc 1]": _local(folders[0], ["A", "B"], has_cover=False),
+               "Now Hits [Disc 2]": _local(folders[1], ["C", "D", "E"], has_cover=False)}
+    blocks = [[], []]
+
+    disc1, disc2 = vva._validate_discs("/music/VA", folders, blocks,
+                                       read_local=lambda folder, lines: locals_[folder])
+
+    assert (disc1["track_count_correct"], disc2["track_count_correct"]) == (2, 3)
+    assert disc1["track_count_match"] and disc2["track_count_match"]
+    assert disc1["missing_tracks"] == disc2["missing_tracks"] == []
+    assert disc2["cover_status"] == "available_online"
+    assert any("MusicBrainz ID: rel-1" in line for line in blocks[1])
+
+
+def test_disc_view_leaves_single_disc_release_whole():
+    mb = {"track_count": 3, "disc_track_counts": [3], "tracks": [1, 2, 3]}
+    assert vva._disc_view(mb, 2) is mb
+    assert vva._disc_view(None, 1) is None
+
+
+def test_lookup_cache_entries_expire(tmp_path):
+    now = int(time.time())
+    found = {"release_id": "rel-1", "title": "Now Hits"}
+    (tmp_path / vva.LOOKUP_CACHE).write_text(json.dumps({
+        "Various Artists\tNow Hits\t12": {"result": found, "at": now},
+        "Various Artists\tOld Hits\t12": {"result": found, "at": now - vva.LOOKUP_TTL - 60},
+    }), encoding="utf-8")
+
+    cache = vva.LookupCache(str(tmp_path))
+    assert cache.get("Now Hits", "Various Artists", 12) == (True, found)
+    assert cache.get("Old Hits", "Various Artists", 12) == (False, None)
+    assert cache.has_search("Now Hits", "Various Artists")
+    assert not cache.has_search("Old Hits", "Various Artists")
+
+
+def test_failed_cover_check_is_not_cached(tmp_path, monkeypatch):
+    probes = []
+
+    def has_cover_art(release_id):
+        probes.append(release_id)
+        if len(probes) == 1:
+            raise vva.requests.RequestException("503 Service Unavailable")
+        return True
+
+    monkeypatch.setattr(vva, "_search_release_group",
+                        lambda search_name, artist: [_release(["A", "B"])])
+    monkeypatch.setattr(vva, "_has_cover_art", has_cover_art)
+    cache = vva.LookupCache(str(tmp_path))
+    log = []
+
+    first = vva.search_musicbrainz("Now Hits", log=log, cache=cache, track_count=2)
+    assert first["release_id"] == "rel-1" and first["has_cover_art"] is None
+    assert log == ["  Cover Art Archive check error: 503 Service Unavailable"]
+    assert cache.get("Now Hits", "Various Artists", 2) == (False, None)
+
+    again = vva.search_musicbrainz("Now Hits", log=log, cache=cache, track_count=2)
+    assert again["has_cover_art"] is True and probes == ["rel-1", "rel-1"]
+    assert cache.get("Now Hits", "Various Artists", 2) == (True, again)
+
+
+def test_consistent_album_skips_musicbrainz(monkeypatch):
+    def search(*args, **kwargs):
+        raise AssertionError("MusicBrainz should not be searched")
+
+    monkeypatch.setattr(vva, "search_musicbrainz", search)
+    monkeypatch.setattr(vva, "_search_release_group", search)
+    local = _local("Now Hits", ["A", "B", "C"])
+    blocks = [[]]
+
+    [comparison] = vva._validate_discs("/music/VA", ["Now Hits"], blocks,
+                                       read_local=lambda folder, lines: local)
+
+    assert comparison["source"] == "local-fastpath"
+    assert comparison["needs_attention"] is False
+    assert any("lookup skipped" in line for line in blocks[0])
+
+
+def test_inconsistent_album_is_looked_up(monkeypatch):
+    monkeypatch.setattr(vva, "_search_release_group",
+                        lambda search_name, artist: [_release(["A", "B", "C"])])
+    monkeypatch.setattr(vva, "_has_cover_art", lambda release_id: False)
+    local = _local("Now Hits", ["A", "B", "C"])
+    local["tracks"][2]["track_num"] = 7  # numbering gap: not locally consistent
+
+    [comparison] = vva._validate_discs("/music/VA", ["Now Hits"], [[]],
+                                       read_local=lambda folder, lines: local)
+
+    assert comparison["musicbrainz_id"] == "rel-1"
+    assert "source" not in comparison
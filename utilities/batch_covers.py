@@ -23,9 +23,24 @@ Cover source:
                  MusicBrainz -> Cover Art Archive using the album folder name.
                  --restore always reads each album's folder.jpg.
 
+Concurrency:
+  --jobs N       Albums processed at once (default 4). Each worker runs its own
+                 album end to end; only the MusicBrainz searches share a
+                 one-request-per-second token bucket, so while one album waits
+                 for its lookup the others download and embed. Output is still
+                 printed per album, in album order. Online runs first check
+                 every album's art, then resolve the albums that need a cover
+                 with batched MusicBrainz searches (up to 25 titles per
+                 request); only titles without an exact match are searched
+                 one by one.
+  --cache-dir D  Keep downloaded covers (with their ETags) so a rerun only
+                 transfers art that is new or changed, and remember which
+                 MusicBrainz release each album resolved to so a rerun skips
+                 those searches (albums with no match are retried after a week).
+
 Examples:
   python utilities/batch_covers.py "/music/Various Artists" --missing
-  python utilities/batch_covers.py "/music/Various Artists" --retry
+  python utilities/batch_covers.py "/music/Various Artists" --retry --cache-dir ~/.cache/covers
   python utilities/batch_covers.py "/music/Various Artists" --restore
   python utilities/batch_covers.py "/music/Various Artists" --missing --image cover.jpg
 """
@@ -33,31 +48,59 @@ Examples:
 from __future__ import annotations
 
 import argparse
+import os
 import sys
+import threading
 import time
+import uuid
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterator, List, Optional
+from typing import Iterator, List, Optional, Tuple
 
 import requests
 
 # Allow `python utilities/batch_covers.py` to import the utilities.core package.
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
+from utilities.core.album_log import warn  # noqa: E402
 from utilities.core.audio_file import iter_audio_files  # noqa: E402
 from utilities.core.cover_art import (  # noqa: E402
-    DEFAULT_HEADERS,
     InvalidCoverArt,
     download_cover,
     embed_in_album,
     extract_cover_from_file,
+    new_http_session,
     validate_image,
 )
 from utilities.core.ffprobe import attached_pic_dims, ffprobe_available  # noqa: E402
+from utilities.core.json_output import read_json, write_json  # noqa: E402
+from utilities.core.naming import make_windows_safe  # noqa: E402
+from utilities.core.rate_limit import TokenBucket  # noqa: E402
 
 MUSICBRAINZ_SEARCH = "https://musicbrainz.org/ws/2/release/?query={query}&fmt=json&limit=1"
+# Batched search: several release titles OR-ed together. limit is the API
+# maximum so each title in a full batch still has a few candidate releases.
+MUSICBRAINZ_BATCH_SEARCH = "https://musicbrainz.org/ws/2/release/?query={query}&fmt=json&limit=100"
+MUSICBRAINZ_BATCH_SIZE = 25
 COVER_ART_ARCHIVE = "https://coverartarchive.org/release/{release_id}/front-1200"
 
+# MusicBrainz allows one request per second per client.
+MUSICBRAINZ_INTERVAL = 1.0
+
+# Albums processed concurrently by run(). Lookups stay serialized by the
+# MusicBrainz rate limit; the downloads and embeds around them overlap.
+ALBUM_WORKERS = 4
+
+# Release ids resolved by MusicBrainz, kept in --cache-dir between runs.
+RELEASE_ID_CACHE = "mb_release_ids.json"
+# Albums MusicBrainz had no release for are searched again after this long.
+NEGATIVE_TTL = 7 * 24 * 3600
+
+_musicbrainz_bucket = TokenBucket(rate=1 / MUSICBRAINZ_INTERVAL)
+# One keep-alive session for every MusicBrainz search in a run.
+_musicbrainz_session = new_http_session()
+
 
 # --------------------------------------------------------------------------- #
 # Album discovery and art detection
@@ -116,37 +159,153 @@ def album_has_valid_art(album_path) -> bool:
 # --------------------------------------------------------------------------- #
 # Cover-art sources
 # --------------------------------------------------------------------------- #
-def lookup_cover_url(album_name: str, *, timeout: int = 15) -> Optional[str]:
+class ReleaseIdCache:
+    """Album name -> MusicBrainz release id, persisted as JSON in a cache dir.
+
+    Entries are ``{"id": release_id_or_null, "at": unix_time}``. A found id is
+    kept indefinitely; a ``null`` (no matching release) expires after
+    :data:`NEGATIVE_TTL` so the album is searched again eventually. Failed
+    lookups are never stored. Safe to share between :func:`run`'s workers.
+    Without a ``cache_dir`` the cache lives for one run only.
+    """
+
+    def __init__(self, cache_dir=None):
+        self.path = Path(cache_dir).expanduser() / RELEASE_ID_CACHE if cache_dir else None
+        try:
+            self._entries = read_json(self.path) if self.path else {}
+        except (OSError, ValueError):
+            self._entries = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+
+    def get(self, album_name: str) -> Tuple[bool, Optional[str]]:
+        """Return ``(hit, release_id)``; ``release_id`` is ``None`` for a cached miss."""
+        with self._lock:
+            entry = self._entries.get(album_name)
+        if not isinstance(entry, dict):
+            return False, None
+        if entry.get("id") is None and time.time() - entry.get("at", 0) > NEGATIVE_TTL:
+            return False, None
+        return True, entry.get("id")
+
+    def put(self, album_name: str, release_id: Optional[str]) -> None:
+        with self._lock:
+            self._entries[album_name] = {"id": release_id, "at": int(time.time())}
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache atomically (temp file + ``os.replace``) if it changed."""
+        with self._lock:
+            if self.path is None or not self._dirty:
+                return
+            temp = self.path.with_name(f".{self.path.name}.{uuid.uuid4().hex}.tmp")
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                write_json(self._entries, temp)
+                os.replace(temp, self.path)
+                self._dirty = False
+            except OSError as exc:
+                print(f"[warn] could not save {self.path}: {exc}")
+
+
+def _title_key(title: str) -> str:
+    """Comparison key matching a release title to an album folder name."""
+    return make_windows_safe(title).casefold()
+
+
+def prefetch_release_ids(
+    album_names: List[str], release_ids: ReleaseIdCache, *, timeout: int = 15
+) -> int:
+    """Resolve many album names with batched MusicBrainz searches.
+
+    Uncached names are OR-ed into one ``release:"..."`` query per
+    :data:`MUSICBRAINZ_BATCH_SIZE` titles (each request still takes a token
+    from the shared rate limit). A name is stored in ``release_ids`` only when
+    a returned release title matches it exactly (compared as Windows-safe,
+    case-folded names); anything else is left for :func:`lookup_cover_url` to
+    search on its own. Returns the number of names resolved.
+    """
+    names = [name for name in dict.fromkeys(album_names) if not release_ids.get(name)[0]]
+    resolved = 0
+    for start in range(0, len(names), MUSICBRAINZ_BATCH_SIZE):
+        batch = names[start:start + MUSICBRAINZ_BATCH_SIZE]
+        if len(batch) < 2:
+            break  # a lone title is just the normal per-album search
+        query = " OR ".join(
+            'release:"{}"'.format(name.replace("\\", "\\\\").replace('"', '\\"'))
+            for name in batch)
+        _musicbrainz_bucket.acquire()
+        try:
+            url = MUSICBRAINZ_BATCH_SEARCH.format(query=urllib.parse.quote(query))
+            with _musicbrainz_session.get(url, timeout=timeout) as response:
+                response.raise_for_status()
+                releases = response.json().get("releases") or []
+        except (requests.RequestException, ValueError) as exc:
+            print(f"[warn] batched MusicBrainz lookup failed: {exc}")
+            continue
+        # Releases come best-scored first; the first exact title match wins.
+        wanted = {_title_key(name): name for name in batch}
+        for release in releases:
+            name = wanted.pop(_title_key(release.get("title") or ""), None)
+            if name is not None:
+                release_ids.put(name, release["id"])
+                resolved += 1
+    return resolved
+
+
+def lookup_cover_url(
+    album_name: str,
+    *,
+    timeout: int = 15,
+    log: Optional[List[str]] = None,
+    release_ids: Optional[ReleaseIdCache] = None,
+) -> Optional[str]:
     """Resolve a Cover Art Archive front-cover URL for ``album_name``.
 
     Searches MusicBrainz for the first matching release, then builds the Cover
     Art Archive URL. Returns ``None`` when no release is found or the lookup
-    fails. Sleeps 1s first to respect MusicBrainz rate limits.
+    fails. Waits as needed to keep all threads within MusicBrainz's
+    one-request-per-second limit. With ``release_ids``, a cached answer
+    (including a recent "no release") skips the search entirely.
     """
-    time.sleep(1)
+    if release_ids is not None:
+        hit, release_id = release_ids.get(album_name)
+        if hit:
+            return COVER_ART_ARCHIVE.format(release_id=release_id) if release_id else None
+    _musicbrainz_bucket.acquire()
     url = MUSICBRAINZ_SEARCH.format(query=urllib.parse.quote(album_name))
     try:
-        response = requests.get(url, headers=DEFAULT_HEADERS, timeout=timeout)
-        response.raise_for_status()
-        releases = response.json().get("releases") or []
+        # Not streamed: the limit=1 body is small, and reading it whole lets
+        # the keep-alive connection go back to the session's pool.
+        with _musicbrainz_session.get(url, timeout=timeout) as response:
+            response.raise_for_status()
+            releases = response.json().get("releases") or []
     except (requests.RequestException, ValueError) as exc:
-        print(f"    [warn] MusicBrainz lookup failed: {exc}")
+        warn(log, f"    [warn] MusicBrainz lookup failed: {exc}")
         return None
-    if not releases:
+    release_id = releases[0]["id"] if releases else None
+    if release_ids is not None:
+        release_ids.put(album_name, release_id)
+    if not release_id:
         return None
-    return COVER_ART_ARCHIVE.format(release_id=releases[0]["id"])
+    return COVER_ART_ARCHIVE.format(release_id=release_id)
+
 
+def download_with_retries(
+    url: str, *, retries: int, backoff: int, cache_dir=None, log: Optional[List[str]] = None
+) -> bytes:
+    """Download validated cover bytes, retrying transient failures with backoff.
 
-def download_with_retries(url: str, *, retries: int, backoff: int) -> bytes:
-    """Download validated cover bytes, retrying transient failures with backoff."""
+    ``cache_dir`` is passed to :func:`download_cover` (ETag-revalidated cache).
+    """
     last_error: Optional[Exception] = None
     for attempt in range(1, retries + 1):
         try:
-            return download_cover(url)
+            return download_cover(url, cache_dir=cache_dir)
         except InvalidCoverArt as exc:
             last_error = exc
             if attempt < retries:
-                print(f"    [warn] download attempt {attempt} failed, retrying...")
+                warn(log, f"    [warn] download attempt {attempt} failed, retrying...")
                 time.sleep(backoff)
     raise InvalidCoverArt(str(last_error) if last_error else "download failed")
 
@@ -172,22 +331,86 @@ def resolve_source(
     *,
     retries: int,
     backoff: int,
+    cache_dir=None,
+    release_ids: Optional[ReleaseIdCache] = None,
+    log: Optional[List[str]] = None,
 ) -> Optional[bytes]:
-    """Return validated cover bytes for one album, or ``None`` if unavailable."""
+    """Return validated cover bytes for one album, or ``None`` if unavailable.
+
+    Warnings go to ``log`` when given (see :func:`process_album`), else stdout.
+    """
     if mode == "restore":
         return folder_jpg_bytes(album_path)
     if image_bytes is not None:
         return image_bytes
-    cover_url = lookup_cover_url(album_path.name)
+    cover_url = lookup_cover_url(album_path.name, log=log, release_ids=release_ids)
     if not cover_url:
         return None
     try:
-        return download_with_retries(cover_url, retries=retries, backoff=backoff)
+        return download_with_retries(cover_url, retries=retries, backoff=backoff,
+                                     cache_dir=cache_dir, log=log)
     except InvalidCoverArt as exc:
-        print(f"    [warn] {exc}")
+        warn(log, f"    [warn] {exc}")
         return None
 
 
+def process_album(
+    album: Path,
+    mode: str,
+    image_bytes: Optional[bytes],
+    *,
+    dry_run: bool,
+    retries: int,
+    backoff: int,
+    cache_dir=None,
+    release_ids: Optional[ReleaseIdCache] = None,
+    has_art: Optional[bool] = None,
+) -> Tuple[str, Optional[dict], List[str]]:
+    """Handle one album for :func:`run`.
+
+    Returns ``(outcome, embed_result, log_lines)`` where ``outcome`` is one of
+    ``skipped``, ``no_source``, ``embedded`` or ``failed``. Lines (including
+    lookup/download warnings) are returned rather than printed so concurrent
+    albums can be reported in order, one block each. ``has_art`` is the
+    album's :func:`album_has_valid_art` result when the caller already has it.
+    """
+    if has_art is None:
+        has_art = album_has_valid_art(album)
+    # --restore re-embeds existing art; only touch albums missing valid art.
+    if has_art:
+        return "skipped", None, ["  [skip] already has valid embedded art"]
+
+    if dry_run:
+        # Only cheap, offline source checks here (restore + local image);
+        # an online lookup is unknown without a network call, so report it
+        # as a would-attempt rather than guessing.
+        if mode == "restore" and folder_jpg_bytes(album) is None:
+            return "no_source", None, ["  [dry-run] would skip (no folder.jpg)"]
+        return "embedded", None, ["  [dry-run] would embed cover art"]
+
+    lines: List[str] = []
+    data = resolve_source(album, mode, image_bytes, retries=retries, backoff=backoff,
+                          cache_dir=cache_dir, release_ids=release_ids, log=lines)
+    if data is None:
+        reason = "no folder.jpg" if mode == "restore" else "no cover source found"
+        return "no_source", None, lines + [f"  [skip] {reason}"]
+
+    try:
+        # In restore mode folder.jpg IS the source, so don't rewrite it.
+        result = embed_in_album(album, data, write_folder_jpg=(mode != "restore"))
+    except InvalidCoverArt as exc:
+        return "failed", None, lines + [f"  [error] {exc}"]
+
+    if int(result["embedded"]) > 0:
+        lines.append(f"  [ok] embedded into {result['embedded']}/{result['total']} files")
+        outcome = "embedded"
+    else:
+        lines.append("  [error] no files embedded")
+        outcome = "failed"
+    lines.extend(f"    - {error}" for error in result["errors"])
+    return outcome, result, lines
+
+
 def run(
     library_path: str,
     mode: str,
@@ -196,9 +419,16 @@ def run(
     dry_run: bool = False,
     retries: int = 1,
     backoff: int = 3,
+    jobs: int = ALBUM_WORKERS,
+    cache_dir: Optional[str] = None,
 ) -> dict:
     """Process all albums under ``library_path`` for the chosen ``mode``.
 
+    Up to ``jobs`` albums are processed at once; per-album output is printed
+    in album order. With ``cache_dir``, online downloads are cached there and
+    revalidated by ETag, so a rerun only transfers art it does not have yet,
+    and resolved MusicBrainz release ids are saved there (even if the run is
+    interrupted) so a rerun skips those searches.
     Returns a summary dict with album- and file-level counts.
     """
     image_bytes: Optional[bytes] = None
@@ -221,52 +451,38 @@ def run(
     print(f"Library: {library_path}")
     print(f"Albums found: {len(albums)}\n")
 
-    for index, album in enumerate(albums, 1):
-        print(f"[{index}/{len(albums)}] {album.name}")
+    # Online lookups: always share one release-id cache (persisted only with
+    # cache_dir) so batched searches can resolve albums ahead of the workers.
+    online = mode != "restore" and image_bytes is None and not dry_run
+    release_ids = ReleaseIdCache(cache_dir) if cache_dir or online else None
 
-        # --restore re-embeds existing art; only touch albums missing valid art.
-        if album_has_valid_art(album):
-            print("  [skip] already has valid embedded art")
-            summary["skipped"] += 1
-            continue
-
-        if dry_run:
-            # Only cheap, offline source checks here (restore + local image);
-            # an online lookup is unknown without a network call, so report it
-            # as a would-attempt rather than guessing.
-            if mode == "restore" and folder_jpg_bytes(album) is None:
-                print("  [dry-run] would skip (no folder.jpg)")
-                summary["no_source"] += 1
-            else:
-                print("  [dry-run] would embed cover art")
-                summary["embedded"] += 1
-            continue
-
-        data = resolve_source(album, mode, image_bytes, retries=retries, backoff=backoff)
-        if data is None:
-            reason = "no folder.jpg" if mode == "restore" else "no cover source found"
-            print(f"  [skip] {reason}")
-            summary["no_source"] += 1
-            continue
+    def process(album: Path, has_art: Optional[bool]):
+        return process_album(album, mode, image_bytes, dry_run=dry_run, retries=retries,
+                             backoff=backoff, cache_dir=cache_dir, release_ids=release_ids,
+                             has_art=has_art)
 
-        try:
-            # In restore mode folder.jpg IS the source, so don't rewrite it.
-            result = embed_in_album(album, data, write_folder_jpg=(mode != "restore"))
-        except InvalidCoverArt as exc:
-            print(f"  [error] {exc}")
-            summary["failed"] += 1
-            continue
-
-        summary["files_embedded"] += int(result["embedded"])
-        summary["files_failed"] += int(result["failed"])
-        if int(result["embedded"]) > 0:
-            print(f"  [ok] embedded into {result['embedded']}/{result['total']} files")
-            summary["embedded"] += 1
-        else:
-            print("  [error] no files embedded")
-            summary["failed"] += 1
-        for error in result["errors"]:
-            print(f"    - {error}")
+    workers = max(1, min(jobs, len(albums)))
+    if workers > 1:
+        ffprobe_available()  # resolve (maybe download) ffprobe once, not per thread
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            mapper = pool.map if workers > 1 else map
+            has_art: List[Optional[bool]] = [None] * len(albums)
+            if online:
+                has_art = list(mapper(album_has_valid_art, albums))
+                prefetch_release_ids(
+                    [album.name for album, art in zip(albums, has_art) if not art], release_ids)
+            outcomes = mapper(process, albums, has_art)
+            for index, (album, (outcome, result, lines)) in enumerate(zip(albums, outcomes), 1):
+                # One write per album rather than one per line
+                print("\n".join([f"[{index}/{len(albums)}] {album.name}", *lines]), flush=True)
+                summary[outcome] += 1
+                if result is not None:
+                    summary["files_embedded"] += int(result["embedded"])
+                    summary["files_failed"] += int(result["failed"])
+    finally:
+        if release_ids is not None:
+            release_ids.save()
 
     _print_summary(summary)
     return summary
@@ -331,6 +547,17 @@ def build_parser() -> argparse.ArgumentParser:
         default=3,
         help="Seconds to wait between download retries (default 3)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=ALBUM_WORKERS,
+        help=f"Albums to process concurrently (default {ALBUM_WORKERS})",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        help="Keep downloaded covers (ETag-revalidated) and MusicBrainz release ids "
+        "here so reruns skip re-downloads and repeat searches",
+    )
     parser.set_defaults(mode="missing")
     return parser
 
@@ -347,6 +574,8 @@ def main(argv: Optional[List[str]] = None) -> int:
             dry_run=args.dry_run,
             retries=retries,
             backoff=args.backoff,
+            jobs=args.jobs,
+            cache_dir=args.cache_dir,
         )
     except (InvalidCoverArt, OSError) as exc:
         print(f"error: {exc}", file=sys.stderr)
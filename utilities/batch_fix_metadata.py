@@ -3,6 +3,9 @@ import sys
 from mutagen.easyid3 import EasyID3
 from mutagen.mp3 import MP3
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utilities.core.audio_file import keep_padding
+
 def fix_genre_batch(directory, new_genre):
     """Fix genre for all MP3 files in a directory"""
     mp3_files = [f for f in os.listdir(directory)
@@ -20,7 +23,7 @@ def fix_genre_batch(directory, new_genre):
             audio = MP3(filepath, ID3=EasyID3)
             old_genre = audio.get('genre', ['Unknown'])[0]
             audio['genre'] = new_genre
-            audio.save()
+            audio.save(padding=keep_padding)
 
             print(f"  {filename}")
             print(f"    Changed: '{old_genre}' -> '{new_genre}'")
@@ -2,7 +2,6 @@
 # -*- coding: utf-8 -*-
 """Quick check of disc metadata"""
 
-from mutagen.mp3 import MP3
 from mutagen.id3 import ID3
 import sys
 
@@ -10,18 +9,19 @@ if __name__ == "__main__":
     filepath = sys.argv[1]
 
     try:
-        audio = MP3(filepath, ID3=ID3)
+        # Tag only: MP3() would also sync to and decode the first MPEG frame
+        audio = ID3(filepath)
         print(f"File: {filepath.split('/')[-1]}")
 
         # Check TPOS (disc number)
-        if 'TPOS' in audio.tags:
-            print(f"  Disc: {audio.tags['TPOS'].text[0]}")
+        if 'TPOS' in audio:
+            print(f"  Disc: {audio['TPOS'].text[0]}")
         else:
             print(f"  Disc: NOT SET")
 
         # Check TRCK (track number)
-        if 'TRCK' in audio.tags:
-            print(f"  Track: {audio.tags['TRCK'].text[0]}")
+        if 'TRCK' in audio:
+            print(f"  Track: {audio['TRCK'].text[0]}")
         else:
             print(f"  Track: NOT SET")
 
@@ -15,22 +15,85 @@ Usage:
 
     # Batch clean all albums
     python cleanup_names.py --batch "/path/to/music/Various Artists"
+
+    # Scan every artist directory under a library root (parallel)
+    python cleanup_names.py --root "/path/to/music" --jobs 8
+
+    # Include nested album folders (e.g. deep Various Artists trees)
+    python cleanup_names.py --scan "/path/to/music/Various Artists" --recursive
 """
 
 import os
 import sys
-import json
 import argparse
+import multiprocessing
 import re
-import urllib.request
-import urllib.parse
 import time
 from collections import defaultdict
 
+# Allow running as a script (python utilities/cleanup_names.py ...).
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utilities.core.audio_file import is_excluded_dir
+from utilities.core.json_output import write_json
+
 # Cache for MusicBrainz lookups to avoid repeated API calls
 _musicbrainz_cache = {}
 
-def clean_album_name(name):
+# Trailing disc notation and truncation markers checked by detect_truncation
+_DISC_TRAIL_RE1 = re.compile(r'\s*\[Disc\s+\d+\]$', re.IGNORECASE)
+_DISC_TRAIL_RE2 = re.compile(r'\s*Disc\s+\d+$', re.IGNORECASE)
+_TRAIL_USCORE_RE = re.compile(r'_\s*$')
+
+# Short words that are valid endings for an album name
+_VALID_SHORT = frozenset({'2', '3', '4', '5', '6', '7', '8', '9', '10', 'II', 'III', 'IV', 'UK', 'US', 'CD', 'EP', 'LP'})
+
+# Disc notation preserved across cleanup (normalized to " [Disc N]")
+_DISC_NOTATION_RES = [
+    re.compile(r'\s*\[Disc\s+(\d+)\]$', re.IGNORECASE),
+    re.compile(r'\s*Disc\s+(\d+)$', re.IGNORECASE),
+    re.compile(r'\s*Disk\s+(\d+)$', re.IGNORECASE),
+]
+
+# Reason bits recorded by clean_album_name as each rewrite rule fires
+REASON_UNDERSCORES = 1
+REASON_BRACKETS = 2
+REASON_SPACING = 4
+REASON_SEPARATORS = 8
+REASON_DISC_NOTATION = 16
+
+_REASON_NAMES = (
+    (REASON_UNDERSCORES, 'underscores'),
+    (REASON_BRACKETS, 'brackets'),
+    (REASON_SPACING, 'spacing'),
+    (REASON_SEPARATORS, 'separators'),
+    (REASON_DISC_NOTATION, 'disc notation'),
+)
+
+# Cleanup rules in application order: (compiled pattern, replacement, reason bit)
+_CLEANUP_RULES = [
+    # Pattern 1: "Album_ Subtitle" → "Album: Subtitle"
+    (re.compile(r'_\s+'), ': ', REASON_UNDERSCORES),
+    # Pattern 2: "Album_Year" → "Album (Year)" if followed by 4-digit year
+    (re.compile(r'_(\d{4})'), r' (\1)', REASON_UNDERSCORES),
+    # Pattern 3: Any remaining underscores → space or hyphen
+    (re.compile(r'_'), ' ', REASON_UNDERSCORES),
+    # [Genre], [Country], [Edition] → (Genre), (Country), (Edition)
+    (re.compile(r'\[([^\]]+)\]'), r'(\1)', REASON_BRACKETS),
+    # Fix multiple spaces
+    (re.compile(r'\s{2,}'), ' ', REASON_SPACING),
+    # Fix spacing around colons
+    (re.compile(r'\s*:\s*'), ': ', REASON_SEPARATORS),
+    # Fix spacing around hyphens (but not in ranges like "2000-2005")
+    (re.compile(r'(?<!\d)\s*-\s*(?!\d)'), ' - ', REASON_SEPARATORS),
+    # Fix spacing around commas
+    (re.compile(r'\s*,\s*'), ', ', REASON_SEPARATORS),
+]
+
+def reason_names(mask):
+    """Convert a clean_album_name reason mask to a list of reason names."""
+    return [label for bit, label in _REASON_NAMES if mask & bit]
+
+def clean_album_name(name, with_reasons=False):
     """
     Clean album folder name by applying standardization rules.
 
@@ -42,54 +105,32 @@ def clean_album_name(name):
 
     Args:
         name: Original album folder name
+        with_reasons: Also return a bit mask of the rules that changed the name
+            (REASON_* flags; see reason_names)
 
     Returns:
-        Cleaned album name
+        Cleaned album name, or (cleaned name, reason mask) with with_reasons
     """
-    original = name
     cleaned = name
+    mask = 0
 
     # Preserve disc notation temporarily
     disc_notation = None
-    disc_patterns = [
-        r'\s*\[Disc\s+(\d+)\]$',
-        r'\s*Disc\s+(\d+)$',
-        r'\s*Disk\s+(\d+)$',
-    ]
-
-    for pattern in disc_patterns:
-        match = re.search(pattern, cleaned, re.IGNORECASE)
+    for pattern in _DISC_NOTATION_RES:
+        match = pattern.search(cleaned)
         if match:
             disc_notation = f" [Disc {match.group(1)}]"
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
+            if match.group(0) != disc_notation:
+                mask |= REASON_DISC_NOTATION  # e.g. "Disk 2" -> "[Disc 2]"
+            cleaned = cleaned[:match.start()]
             break
 
-    # Replace underscores with proper separators
-    # Pattern 1: "Album_ Subtitle" → "Album: Subtitle"
-    cleaned = re.sub(r'_\s+', ': ', cleaned)
-
-    # Pattern 2: "Album_Year" → "Album (Year)" if followed by 4-digit year
-    cleaned = re.sub(r'_(\d{4})', r' (\1)', cleaned)
-
-    # Pattern 3: Any remaining underscores → space or hyphen
-    cleaned = re.sub(r'_', ' ', cleaned)
-
-    # Replace square brackets with parentheses (except disc notation which we removed)
-    # Pattern: [Genre], [Country], [Edition] → (Genre), (Country), (Edition)
-    cleaned = re.sub(r'\[([^\]]+)\]', r'(\1)', cleaned)
-
-    # Standardize separators
-    # Fix multiple spaces
-    cleaned = re.sub(r'\s{2,}', ' ', cleaned)
-
-    # Fix spacing around colons
-    cleaned = re.sub(r'\s*:\s*', ': ', cleaned)
-
-    # Fix spacing around hyphens (but not in ranges like "2000-2005")
-    cleaned = re.sub(r'(?<!\d)\s*-\s*(?!\d)', ' - ', cleaned)
-
-    # Fix spacing around commas
-    cleaned = re.sub(r'\s*,\s*', ', ', cleaned)
+    # Underscores, brackets (disc notation was removed above), then separators
+    for pattern, replacement, bit in _CLEANUP_RULES:
+        rewritten = pattern.sub(replacement, cleaned)
+        if rewritten != cleaned:
+            mask |= bit
+            cleaned = rewritten
 
     # Strip leading/trailing whitespace
     cleaned = cleaned.strip()
@@ -98,6 +139,8 @@ def clean_album_name(name):
     if disc_notation:
         cleaned += disc_notation
 
+    if with_reasons:
+        return cleaned, mask
     return cleaned
 
 def detect_truncation(name):
@@ -113,83 +156,141 @@ def detect_truncation(name):
         Boolean indicating if name appears truncated
     """
     # Remove disc notation for analysis
-    test_name = re.sub(r'\s*\[Disc\s+\d+\]$', '', name, flags=re.IGNORECASE)
-    test_name = re.sub(r'\s*Disc\s+\d+$', '', test_name, flags=re.IGNORECASE)
+    test_name = _DISC_TRAIL_RE1.sub('', name)
+    test_name = _DISC_TRAIL_RE2.sub('', test_name)
 
     # Check for ellipsis
     if test_name.endswith('...'):
         return True
 
     # Check for truncated word (ends with underscore or unusual pattern)
-    if re.search(r'_\s*$', test_name):
+    if _TRAIL_USCORE_RE.search(test_name):
         return True
 
     # Check for suspiciously short last word (< 3 chars, not a valid short word)
     words = test_name.split()
     if len(words) > 0:
         last_word = words[-1].strip('.,!?;:')
-        # Short words that are valid endings
-        valid_short = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'II', 'III', 'IV', 'UK', 'US', 'CD', 'EP', 'LP']
-        if len(last_word) < 3 and last_word not in valid_short and not last_word.isdigit():
+        if len(last_word) < 3 and last_word not in _VALID_SHORT and not last_word.isdigit():
             return True
 
     return False
 
-def scan_albums(artist_path, dry_run=True):
+# Below this many folders a worker pool costs more to start than it saves
+_POOL_MIN_FOLDERS = 512
+
+def _clean_one(folder):
     """
-    Scan directory for albums that need name cleanup.
+    Classify one album folder (module-level so pool workers can pickle it).
 
-    Returns:
-        dict: {
-            'needs_cleaning': [(old_name, new_name, reason), ...],
-            'truncated': [(album_name, path), ...],
-            'clean': [album_name, ...]
-        }
+    ``folder`` is a name, or a relative path in recursive scans; only its last
+    component is cleaned, so the cleaned value is the same relative path with
+    the new folder name.
     """
-    print(f"Scanning albums in: {artist_path}")
+    parent, name = os.path.split(folder)
+    cleaned, mask = clean_album_name(name, with_reasons=True)
+    return folder, os.path.join(parent, cleaned), mask, detect_truncation(name)
 
-    if not os.path.exists(artist_path):
-        print(f"Error: Path does not exist: {artist_path}")
-        return {}
+def _classify_folders(folder_names, jobs=1):
+    """
+    Run the cleanup pipeline over folder names, in a process pool when worthwhile.
 
-    try:
-        all_folders = [d for d in os.listdir(artist_path)
-                      if os.path.isdir(os.path.join(artist_path, d))]
-    except Exception as e:
-        print(f"Error reading directory: {e}")
-        return {}
+    The per-name work is pure CPU (regex), so large libraries are spread across
+    processes; results come back in input order.
+    """
+    if jobs > 1 and len(folder_names) >= _POOL_MIN_FOLDERS:
+        with multiprocessing.Pool(jobs) as pool:
+            return list(pool.imap(_clean_one, folder_names, chunksize=256))
+    return [_clean_one(name) for name in folder_names]
 
+def _iter_album_dirs(root):
+    """
+    Yield a DirEntry for every directory below root, at any depth.
+
+    Walks iteratively with os.scandir, so directory-ness comes from the
+    directory read itself (no per-entry stat). Symlinks are not followed, and
+    recycle-bin/system/backup directories are pruned.
+    """
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False) and not is_excluded_dir(entry.name):
+                        yield entry
+                        stack.append(entry.path)
+        except OSError as e:
+            print(f"Error reading directory {current}: {e}")
+
+def _list_album_folders(artist_path, recursive=False):
+    """
+    Return the album folders inside artist_path.
+
+    Non-recursive scans return folder names; recursive scans return paths
+    relative to artist_path for every nested folder.
+    """
+    if recursive:
+        prefix = len(os.path.join(artist_path, ''))
+        return [entry.path[prefix:] for entry in _iter_album_dirs(artist_path)]
+    return [d for d in os.listdir(artist_path)
+            if os.path.isdir(os.path.join(artist_path, d))]
+
+def _build_scan_results(artist_path, classified):
+    """Group classified folder names into the scan_albums results dict."""
     results = {
         'needs_cleaning': [],
         'truncated': [],
         'clean': []
     }
 
-    for folder in all_folders:
-        cleaned_name = clean_album_name(folder)
-
+    for folder, cleaned_name, mask, truncated in classified:
         if cleaned_name != folder:
-            # Determine reason for cleaning
-            reasons = []
-            if '_' in folder:
-                reasons.append('underscores')
-            if '[' in folder and 'Disc' not in folder:
-                reasons.append('brackets')
-            if '  ' in folder:
-                reasons.append('spacing')
-
-            reason = ', '.join(reasons)
+            # Reasons come from the rules that fired during cleanup
+            reason = ', '.join(reason_names(mask))
             results['needs_cleaning'].append((folder, cleaned_name, reason))
 
         # Check for truncation
-        if detect_truncation(folder):
+        if truncated:
             folder_path = os.path.join(artist_path, folder)
             results['truncated'].append((folder, folder_path))
 
         # Track clean albums
-        if cleaned_name == folder and not detect_truncation(folder):
+        if cleaned_name == folder and not truncated:
             results['clean'].append(folder)
 
+    return results
+
+def scan_albums(artist_path, dry_run=True, jobs=1, recursive=False):
+    """
+    Scan directory for albums that need name cleanup.
+
+    Args:
+        artist_path: Path to artist directory
+        jobs: Worker processes for classifying folder names
+        recursive: Also scan nested folders (names become relative paths)
+
+    Returns:
+        dict: {
+            'needs_cleaning': [(old_name, new_name, reason), ...],
+            'truncated': [(album_name, path), ...],
+            'clean': [album_name, ...]
+        }
+    """
+    print(f"Scanning albums in: {artist_path}")
+
+    if not os.path.exists(artist_path):
+        print(f"Error: Path does not exist: {artist_path}")
+        return {}
+
+    try:
+        all_folders = _list_album_folders(artist_path, recursive=recursive)
+    except Exception as e:
+        print(f"Error reading directory: {e}")
+        return {}
+
+    results = _build_scan_results(artist_path, _classify_folders(all_folders, jobs))
+
     # Print summary
     print(f"\n=== SCAN SUMMARY ===")
     print(f"Albums needing cleanup: {len(results['needs_cleaning'])}")
@@ -216,6 +317,69 @@ def scan_albums(artist_path, dry_run=True):
 
     return results
 
+def scan_library(root_path, jobs=None, recursive=False):
+    """
+    Scan every artist directory under a library root.
+
+    Album folder names from all artists are classified in a single process
+    pool, so the CPU-bound cleanup pipeline scales with cores.
+
+    Args:
+        root_path: Library root containing artist directories
+        jobs: Worker processes (defaults to the CPU count)
+        recursive: Also scan folders nested below each artist's albums
+
+    Returns:
+        dict: {artist_name: scan_albums-style results, ...}
+    """
+    print(f"Scanning library in: {root_path}")
+
+    if not os.path.exists(root_path):
+        print(f"Error: Path does not exist: {root_path}")
+        return {}
+
+    try:
+        artists = _list_album_folders(root_path)
+    except Exception as e:
+        print(f"Error reading directory: {e}")
+        return {}
+
+    # Flatten (artist, album) pairs so one pool covers the whole library
+    owners = []
+    all_folders = []
+    for artist in artists:
+        try:
+            folders = _list_album_folders(os.path.join(root_path, artist), recursive=recursive)
+        except Exception as e:
+            print(f"Error reading directory {artist}: {e}")
+            continue
+        owners.extend([artist] * len(folders))
+        all_folders.extend(folders)
+
+    classified = _classify_folders(all_folders, jobs or os.cpu_count() or 1)
+
+    grouped = defaultdict(list)
+    for artist, item in zip(owners, classified):
+        grouped[artist].append(item)
+
+    library = {
+        artist: _build_scan_results(os.path.join(root_path, artist), items)
+        for artist, items in grouped.items()
+    }
+
+    print(f"\n=== LIBRARY SCAN SUMMARY ===")
+    print(f"Artists scanned: {len(artists)}")
+    print(f"Albums scanned: {len(all_folders)}")
+    print(f"Albums needing cleanup: {sum(len(r['needs_cleaning']) for r in library.values())}")
+    print(f"Albums with truncated names: {sum(len(r['truncated']) for r in library.values())}")
+
+    for artist, results in sorted(library.items()):
+        if results['needs_cleaning'] or results['truncated']:
+            print(f"  {artist}: {len(results['needs_cleaning'])} to clean, "
+                  f"{len(results['truncated'])} truncated")
+
+    return library
+
 def rename_album_folder(old_path, new_name, dry_run=False):
     """
     Safely rename an album folder.
@@ -256,18 +420,19 @@ def rename_album_folder(old_path, new_name, dry_run=False):
         print(f"    [ERROR] Rename failed: {e}")
         return False
 
-def batch_cleanup(artist_path, dry_run=False):
+def batch_cleanup(artist_path, dry_run=False, recursive=False):
     """
     Batch clean all albums in directory.
 
     Args:
         artist_path: Path to artist directory
         dry_run: If True, only preview changes
+        recursive: Also clean nested folders
     """
     print(f"\n=== BATCH CLEANUP ===" + (" [DRY RUN]" if dry_run else ""))
 
     # Scan for albums needing cleanup
-    results = scan_albums(artist_path, dry_run=True)
+    results = scan_albums(artist_path, dry_run=True, recursive=recursive)
 
     if not results['needs_cleaning']:
         print("\nNo albums need cleanup!")
@@ -278,10 +443,13 @@ def batch_cleanup(artist_path, dry_run=False):
     success_count = 0
     error_count = 0
 
-    for old_name, new_name, reason in results['needs_cleaning']:
+    # Rename nested folders before their parents so queued paths stay valid
+    renames = sorted(results['needs_cleaning'], key=lambda item: item[0].count(os.sep), reverse=True)
+
+    for old_name, new_name, reason in renames:
         old_path = os.path.join(artist_path, old_name)
 
-        if rename_album_folder(old_path, new_name, dry_run=dry_run):
+        if rename_album_folder(old_path, os.path.basename(new_name), dry_run=dry_run):
             success_count += 1
         else:
             error_count += 1
@@ -291,24 +459,30 @@ def batch_cleanup(artist_path, dry_run=False):
     if error_count > 0:
         print(f"Errors: {error_count}")
 
-def save_cleanup_report(results, output_path):
-    """Save cleanup analysis to JSON file."""
+def _report_dict(results):
+    """Convert scan results to a JSON-serializable report."""
+    return {
+        'needs_cleaning': [
+            {'old_name': old, 'new_name': new, 'reason': reason}
+            for old, new, reason in results['needs_cleaning']
+        ],
+        'truncated': [
+            {'name': name, 'path': path}
+            for name, path in results['truncated']
+        ],
+        'clean': results['clean']
+    }
+
+def save_cleanup_report(results, output_path, by_artist=False):
+    """Save cleanup analysis to JSON file (per artist when by_artist is set)."""
     try:
         # Convert results to serializable format
-        report = {
-            'needs_cleaning': [
-                {'old_name': old, 'new_name': new, 'reason': reason}
-                for old, new, reason in results['needs_cleaning']
-            ],
-            'truncated': [
-                {'name': name, 'path': path}
-                for name, path in results['truncated']
-            ],
-            'clean': results['clean']
-        }
+        if by_artist:
+            report = {artist: _report_dict(r) for artist, r in results.items()}
+        else:
+            report = _report_dict(results)
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
+        write_json(report, output_path)
         print(f"\nCleanup report saved: {output_path}")
         return True
     except Exception as e:
@@ -321,6 +495,9 @@ def main():
     parser.add_argument('--clean', metavar='ALBUM', help='Clean specific album by name')
     parser.add_argument('--path', metavar='PATH', help='Path to artist directory (used with --clean)')
     parser.add_argument('--batch', metavar='PATH', help='Batch clean all albums in directory')
+    parser.add_argument('--root', metavar='PATH', help='Scan every artist directory under a library root')
+    parser.add_argument('--recursive', action='store_true', help='Include nested album folders')
+    parser.add_argument('--jobs', type=int, metavar='N', help='Worker processes for --scan/--root (default: CPU count for --root)')
     parser.add_argument('--dry-run', action='store_true', help='Preview changes without making them')
     parser.add_argument('--output-report', metavar='FILE', default='D:/music cleanup/outputs/name_cleanup_report.json',
                        help='Output path for cleanup report')
@@ -329,11 +506,18 @@ def main():
 
     if args.scan:
         # Scan for albums needing cleanup
-        results = scan_albums(args.scan, dry_run=True)
+        results = scan_albums(args.scan, dry_run=True, jobs=args.jobs or 1, recursive=args.recursive)
 
         # Save report
         save_cleanup_report(results, args.output_report)
 
+    elif args.root:
+        # Scan the whole library, one artist directory at a time
+        library = scan_library(args.root, jobs=args.jobs, recursive=args.recursive)
+
+        # Save report
+        save_cleanup_report(library, args.output_report, by_artist=True)
+
     elif args.clean and args.path:
         # Clean specific album
         old_path = os.path.join(args.path, args.clean)
@@ -347,7 +531,7 @@ def main():
 
     elif args.batch:
         # Batch clean all albums
-        batch_cleanup(args.batch, dry_run=args.dry_run)
+        batch_cleanup(args.batch, dry_run=args.dry_run, recursive=args.recursive)
 
     else:
         parser.print_help()
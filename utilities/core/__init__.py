@@ -5,8 +5,17 @@ across utilities/, agents/, and orchestrator/ - most importantly album cover art
 handling, which was producing invalid (width=0/height=0) embeds.
 
 Import as:  from utilities.core import cover_art, ffprobe, audio_file
+
+Submodules load on first use, so a walker that only needs ``audio_file`` does
+not pay for mutagen/Pillow/requests via ``cover_art``.
 """
 
-from . import audio_file, cover_art, ffprobe  # noqa: F401
+import importlib
 
 __all__ = ["audio_file", "cover_art", "ffprobe"]
+
+
+def __getattr__(name):
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,19 @@
+"""Per-album output buffering shared by the concurrent batch tools.
+
+Tools that process albums on worker threads collect each album's output in a
+list of lines and print it as one block, so albums never interleave. Helpers
+deep in a lookup take that list as ``log`` and fall back to printing when a
+caller runs them on their own.
+"""
+
+from __future__ import annotations
+
+from typing import List, Optional
+
+
+def warn(log: Optional[List[str]], message: str) -> None:
+    """Append ``message`` to an album's ``log`` lines, or print it when there is none."""
+    if log is None:
+        print(message)
+    else:
+        log.append(message)
@@ -10,11 +10,21 @@ off-library backup stores - and can never drift apart.
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterator
+from typing import Iterator, Optional
 
 # Audio containers the toolkit reads/writes cover art for.
-AUDIO_EXTS = {".mp3", ".m4a", ".mp4", ".flac"}
+AUDIO_EXTS = frozenset({".mp3", ".m4a", ".mp4", ".flac"})
+
+# Tag padding left when a save has to grow the tag block (see keep_padding).
+MIN_TAG_PADDING = 4096
+
+# Parsed EasyID3 tags kept by read_easy_id3 (one entry per file version).
+EASY_ID3_CACHE_SIZE = 4096
+
+# Text encodings of an ID3v2 text frame, indexed by its first payload byte.
+_ID3_TEXT_ENCODINGS = ("latin-1", "utf-16", "utf-16-be", "utf-8")
 
 # Directory names that are never a real album folder. Their contents are usually
 # deleted/stub files (recycle bins) or non-music system metadata, so counting them
@@ -37,6 +47,19 @@ EXCLUDED_DIR_NAMES = {
 EXCLUDED_DIR_PREFIXES = ("@", "#", "$", ".trash", ".spotlight", ".fseventsd")
 
 
+def keep_padding(info, minimum: int = MIN_TAG_PADDING) -> int:
+    """mutagen ``padding=`` policy that avoids whole-file rewrites.
+
+    Existing padding is kept whenever the new tags fit (mutagen's default may
+    shrink or grow it, which rewrites the audio data). When they do not fit,
+    the rewrite is unavoidable, so at least ``minimum`` bytes are left for
+    later saves.
+    """
+    if info.padding >= 0:
+        return info.padding
+    return max(minimum, info.get_default_padding())
+
+
 def is_excluded_dir(name) -> bool:
     """True if a single directory *name* is a recycle-bin / system / backup dir
     that must never be treated as an album folder."""
@@ -67,10 +90,113 @@ def is_audio_file(path) -> bool:
 
 
 def iter_audio_files(folder) -> Iterator[Path]:
-    """Yield audio files directly inside ``folder``, sorted by name."""
-    base = Path(folder)
-    if not base.is_dir():
+    """Yield audio files directly inside ``folder``, sorted by name.
+
+    One ``os.scandir`` read: file-ness comes from the directory entry, so only
+    matching names are turned into ``Path`` objects. Names sort with
+    ``normcase`` to keep ``Path`` ordering (case-insensitive on Windows).
+    """
+    try:
+        with os.scandir(folder) as it:
+            entries = [e for e in it
+                       if os.path.splitext(e.name)[1].lower() in AUDIO_EXTS and e.is_file()]
+    except (FileNotFoundError, NotADirectoryError):
         return
-    for entry in sorted(base.iterdir()):
-        if entry.is_file() and entry.suffix.lower() in AUDIO_EXTS:
-            yield entry
+    entries.sort(key=lambda e: os.path.normcase(e.name))
+    for entry in entries:
+        yield Path(entry.path)
+
+
+def read_id3_album(path) -> Optional[str]:
+    """Return the album (TALB) text of an MP3's leading ID3v2 tag.
+
+    Reads only frame headers and the album frame itself - the MPEG stream and
+    any embedded cover art are seeked past, not read. A file without an ID3v2
+    header, or an ID3v2 tag without an album frame, is answered from its
+    ID3v1 tail (mutagen merges v1 fields into a v2 tag the same way), so it
+    is never handed to a full parser. Returns ``''`` when there is no album, and
+    ``None`` when the ID3v2 tag uses something this reader does not handle
+    (unsynchronised or compressed data, an extended header, malformed
+    frames) or the file ends inside the tag; callers then fall back to mutagen.
+    """
+    try:
+        with open(path, "rb") as handle:
+            header = handle.read(10)
+            if header[:3] != b"ID3":
+                return _read_id3v1_album(handle)
+            if len(header) < 10 or header[3] not in (2, 3, 4):
+                return None
+            version, flags = header[3], header[5]
+            if flags & 0xC0:  # unsynchronisation / extended header
+                return None
+            end = 10 + _syncsafe(header[6:10])
+            id_len, head_len = (3, 6) if version == 2 else (4, 10)
+            album_id = b"TAL" if version == 2 else b"TALB"
+
+            while handle.tell() + head_len <= end:
+                frame = handle.read(head_len)
+                if len(frame) < head_len:  # file shorter than its tag claims
+                    return None
+                frame_id = frame[:id_len]
+                if frame_id[0] == 0:  # padding: no more frames
+                    break
+                if not (frame_id.isalnum() and frame_id == frame_id.upper()):
+                    return None
+                raw_size = frame[id_len:id_len + (3 if version == 2 else 4)]
+                size = _syncsafe(raw_size) if version == 4 else int.from_bytes(raw_size, "big")
+                if handle.tell() + size > end:
+                    return None
+                if frame_id != album_id:
+                    handle.seek(size, os.SEEK_CUR)
+                    continue
+                if version > 2 and frame[9]:  # compressed/encrypted/unsynced frame
+                    return None
+                payload = handle.read(size)
+                if len(payload) < size or not payload or payload[0] >= len(_ID3_TEXT_ENCODINGS):
+                    return None
+                text = payload[1:].decode(_ID3_TEXT_ENCODINGS[payload[0]])
+                return text.split("\x00")[0]
+            return _read_id3v1_album(handle)  # no TALB frame in the v2 tag
+    except (OSError, UnicodeDecodeError, IndexError, ValueError):
+        return None
+
+
+def read_easy_id3(path):
+    """Return the EasyID3 tag of ``path``, parsed once per file version.
+
+    Parses are cached by ``(path, mtime_ns, size)``: readers that look at the
+    same file in one run (track number, then title, ...) share a single
+    parse, and a file rewritten since is parsed again. The object is shared,
+    so treat it as read-only; parse a fresh ``EasyID3`` to edit tags. Raises
+    what ``EasyID3`` raises, or ``OSError`` if the file cannot be stat'ed.
+    """
+    path = os.fspath(path)
+    st = os.stat(path)
+    return _parse_easy_id3(path, st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=EASY_ID3_CACHE_SIZE)
+def _parse_easy_id3(path: str, mtime_ns: int, size: int):
+    from mutagen.easyid3 import EasyID3  # only tag readers need mutagen
+
+    return EasyID3(path)
+
+
+def _read_id3v1_album(handle) -> str:
+    """Album field of the 128-byte ID3v1 tag at the end of ``handle``, or ``''``."""
+    handle.seek(0, os.SEEK_END)
+    if handle.tell() < 128:
+        return ""
+    handle.seek(-128, os.SEEK_END)
+    tail = handle.read(128)
+    if tail[:3] != b"TAG":
+        return ""
+    return tail[63:93].split(b"\x00")[0].strip().decode("latin-1")
+
+
+def _syncsafe(data: bytes) -> int:
+    """Decode an ID3v2 syncsafe integer (7 significant bits per byte)."""
+    value = 0
+    for byte in data:
+        value = (value << 7) | (byte & 0x7F)
+    return value
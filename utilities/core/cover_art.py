@@ -19,18 +19,24 @@ as :func:`embed_in_album` catch per-file failures, log, skip, and continue.
 
 from __future__ import annotations
 
+import hashlib
 import io
+import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional, Union
+from typing import Dict, Optional, Tuple, Union
 
 import requests
 from PIL import Image
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from mutagen.flac import FLAC, Picture
 from mutagen.id3 import ID3, APIC
 from mutagen.mp3 import MP3
 from mutagen.mp4 import MP4, MP4Cover
 
-from .audio_file import iter_audio_files
+from .audio_file import iter_audio_files, keep_padding
 from .ffprobe import attached_pic_dims, ffprobe_available
 
 # Below this, an image is not real album art (icons, tracking pixels, junk).
@@ -38,6 +44,15 @@ MIN_DIMENSION = 50
 # Technically valid but low quality - warn only, do not reject.
 RECOMMENDED_DIMENSION = 500
 
+# Tracks embedded concurrently by embed_in_album (tag rewrites + ffprobe
+# read-backs are I/O and subprocess bound, so threads overlap well).
+EMBED_WORKERS = 8
+
+# Tag padding reserved when an embed has to grow the tag block, so a later
+# re-embed of similar-sized art is written in place instead of rewriting the
+# whole audio file.
+COVER_TAG_PADDING = 64 * 1024
+
 _JPEG_MAGIC = b"\xff\xd8\xff"
 _PNG_MAGIC = b"\x89PNG\r\n\x1a\n"
 
@@ -45,6 +60,35 @@ DEFAULT_HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
 }
 
+# Read size for streamed cover downloads.
+DOWNLOAD_CHUNK = 1 << 16
+
+# Transient HTTP statuses retried inside urllib3 (honouring Retry-After) before
+# a request is reported as failed.
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+HTTP_RETRIES = 3
+
+
+def new_http_session() -> requests.Session:
+    """Return a keep-alive session with pooled connections and transient retries."""
+    retry = Retry(
+        total=HTTP_RETRIES,
+        backoff_factor=1,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=("GET", "HEAD"),
+    )
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=EMBED_WORKERS, max_retries=retry)
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Shared by every download_cover call so batch runs against the same art host
+# (iTunes, Cover Art Archive) reuse keep-alive connections.
+_SESSION = new_http_session()
+
 ImageSource = Union[bytes, bytearray, str, "Path"]
 
 
@@ -120,26 +164,100 @@ def quality_warning(data: bytes) -> Optional[str]:
     return None
 
 
-def download_cover(url: str, *, timeout: int = 60) -> bytes:
+def _cache_paths(cache_dir, url: str) -> Tuple[Path, Path]:
+    """Return the (image, etag) cache files for ``url`` under ``cache_dir``."""
+    key = hashlib.sha256(url.encode("utf-8")).hexdigest()[:32]
+    return Path(cache_dir) / f"{key}.img", Path(cache_dir) / f"{key}.etag"
+
+
+def _read_cache(
+    image_path: Path, etag_path: Path
+) -> Tuple[Optional[bytes], Optional[str], Optional[str]]:
+    """Return cached ``(bytes, etag, last_modified)``; each is ``None`` when absent.
+
+    The etag file holds the ETag on its first line and the Last-Modified date
+    (if the server sent one) on its second.
+    """
+    try:
+        data = image_path.read_bytes()
+    except OSError:
+        return None, None, None
+    try:
+        lines = etag_path.read_text(encoding="utf-8").splitlines()
+    except OSError:
+        lines = []
+    etag = (lines[0].strip() or None) if lines else None
+    last_modified = (lines[1].strip() or None) if len(lines) > 1 else None
+    return data, etag, last_modified
+
+
+def _write_cache(
+    image_path: Path, etag_path: Path, data: bytes,
+    etag: Optional[str], last_modified: Optional[str],
+) -> None:
+    """Store a download atomically (temp file + ``os.replace``); failures are ignored."""
+    validators = f"{etag or ''}\n{last_modified or ''}\n".encode("utf-8")
+    try:
+        image_path.parent.mkdir(parents=True, exist_ok=True)
+        for path, payload in ((image_path, data), (etag_path, validators)):
+            temp = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+            temp.write_bytes(payload)
+            os.replace(temp, path)
+    except OSError:
+        pass
+
+
+def download_cover(url: str, *, timeout: int = 60, cache_dir=None) -> bytes:
     """Download cover art from ``url`` and return validated bytes.
 
+    The body is streamed over a shared keep-alive session; it is still
+    collected in memory because validation needs the whole image.
+
+    With ``cache_dir``, each download is kept on disk with its ETag and
+    Last-Modified date. A rerun revalidates with ``If-None-Match`` (or
+    ``If-Modified-Since`` when the server sent no ETag) and reuses the cached
+    image on ``304 Not Modified`` (or when the request fails outright), so
+    only new or changed art is transferred again.
+
     Raises :class:`InvalidCoverArt` on a network error, a non-image
     Content-Type, or empty/corrupt payload.
     """
     if not url:
         raise InvalidCoverArt("no cover URL provided")
+
+    cached, headers = None, {}
+    if cache_dir is not None:
+        image_path, etag_path = _cache_paths(cache_dir, url)
+        cached, etag, last_modified = _read_cache(image_path, etag_path)
+        if cached is not None and etag:
+            headers["If-None-Match"] = etag
+        elif cached is not None and last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    fresh = False
     try:
-        response = requests.get(url, headers=DEFAULT_HEADERS, timeout=timeout)
-        response.raise_for_status()
+        with _SESSION.get(url, stream=True, timeout=timeout, headers=headers) as response:
+            if response.status_code == 304 and cached is not None:
+                data = cached
+            else:
+                response.raise_for_status()
+                # Checked before the body is read: an HTML error page is never downloaded.
+                content_type = response.headers.get("content-type", "")
+                if content_type and not content_type.lower().startswith("image/"):
+                    raise InvalidCoverArt(
+                        f"response is not an image (content-type: {content_type})"
+                    )
+                data = b"".join(response.iter_content(DOWNLOAD_CHUNK))
+                etag, fresh = response.headers.get("etag"), True
+                last_modified = response.headers.get("last-modified")
     except requests.RequestException as exc:
-        raise InvalidCoverArt(f"download failed: {exc}") from exc
+        if cached is None:
+            raise InvalidCoverArt(f"download failed: {exc}") from exc
+        data = cached
 
-    content_type = response.headers.get("content-type", "")
-    if content_type and not content_type.lower().startswith("image/"):
-        raise InvalidCoverArt(f"response is not an image (content-type: {content_type})")
-
-    data = response.content
     validate_image(data)  # raises on empty/corrupt
+    if fresh and cache_dir is not None:
+        _write_cache(image_path, etag_path, data, etag, last_modified)
     return data
 
 
@@ -157,11 +275,10 @@ def extract_cover_from_file(filepath) -> Optional[bytes]:
     ext = path.suffix.lower()
     try:
         if ext == ".mp3":
-            audio = MP3(str(path), ID3=ID3)
-            if audio.tags:
-                for key in audio.tags:
-                    if key.startswith("APIC"):
-                        return audio.tags[key].data
+            # Tags only: MP3() would also locate and decode the first MPEG
+            # frame header, which art extraction never needs.
+            for frame in ID3(str(path)).getall("APIC"):
+                return frame.data
         elif ext in (".m4a", ".mp4"):
             audio = MP4(str(path))
             if audio.get("covr"):
@@ -175,6 +292,10 @@ def extract_cover_from_file(filepath) -> Optional[bytes]:
     return None
 
 
+def _cover_padding(info) -> int:
+    return keep_padding(info, COVER_TAG_PADDING)
+
+
 def _write_mp3(path: Path, data: bytes, mime: str) -> None:
     try:
         audio = MP3(str(path), ID3=ID3)
@@ -184,14 +305,14 @@ def _write_mp3(path: Path, data: bytes, mime: str) -> None:
         audio.add_tags()
     audio.tags.delall("APIC")  # never double-embed
     audio.tags.add(APIC(encoding=3, mime=mime, type=3, desc="Cover", data=data))
-    audio.save()
+    audio.save(padding=_cover_padding)
 
 
 def _write_m4a(path: Path, data: bytes, mime: str) -> None:
     audio = MP4(str(path))
     image_format = MP4Cover.FORMAT_PNG if mime == "image/png" else MP4Cover.FORMAT_JPEG
     audio["covr"] = [MP4Cover(data, imageformat=image_format)]
-    audio.save()
+    audio.save(padding=_cover_padding)
 
 
 def _write_flac(path: Path, data: bytes, mime: str) -> None:
@@ -203,7 +324,7 @@ def _write_flac(path: Path, data: bytes, mime: str) -> None:
     picture.desc = "Cover"
     picture.data = data
     audio.add_picture(picture)
-    audio.save()
+    audio.save(padding=_cover_padding)
 
 
 def _assert_embedded_ok(path: Path) -> None:
@@ -235,10 +356,13 @@ def embed_in_file(filepath, image: ImageSource, *, verify: bool = True) -> None:
     touching the file, so existing art is preserved) or if the post-write
     ffprobe read-back does not show real dimensions.
     """
-    path = Path(filepath)
     data = _read_cover_bytes(image)
     mime = validate_image(data)  # raises before we clear/modify the file
+    _embed_validated(Path(filepath), data, mime, verify=verify)
 
+
+def _embed_validated(path: Path, data: bytes, mime: str, *, verify: bool = True) -> None:
+    """Write already-validated ``data`` (of type ``mime``) into ``path``."""
     ext = path.suffix.lower()
     if ext == ".mp3":
         _write_mp3(path, data, mime)
@@ -253,35 +377,67 @@ def embed_in_file(filepath, image: ImageSource, *, verify: bool = True) -> None:
         _assert_embedded_ok(path)
 
 
+def _embed_one(
+    audio_file: Path, data: bytes, mime: str, skip_identical: bool = False
+) -> Tuple[bool, Optional[str]]:
+    """Embed into one file for :func:`embed_in_album`.
+
+    Returns ``(written, error)``: ``(False, None)`` means the file already
+    held exactly ``data`` and ``skip_identical`` left it untouched.
+    """
+    try:
+        if skip_identical and extract_cover_from_file(audio_file) == data:
+            return False, None
+        _embed_validated(audio_file, data, mime)
+    except Exception as exc:  # fail-soft: log + skip + continue
+        return False, f"{audio_file.name}: {exc}"
+    return True, None
+
+
 def embed_in_album(
     album_path,
     image: ImageSource,
     *,
     write_folder_jpg: bool = True,
+    max_workers: int = EMBED_WORKERS,
+    skip_identical: bool = False,
 ) -> Dict[str, object]:
     """Embed validated cover art into every audio file in an album folder.
 
     Fail-soft at the batch layer: the source image is validated once up front
-    (an invalid source raises and nothing is written), then each file is
-    embedded independently - a file that fails is logged in the result and
-    skipped while the rest continue.
-
-    Returns a dict: ``{embedded, failed, total, errors}``.
+    (an invalid source raises and nothing is written) and its MIME type reused
+    for every track, then each file is embedded independently - a file that
+    fails is logged in the result and skipped while the rest continue. Files
+    are embedded on up to ``max_workers`` threads; errors are reported in file
+    order. With ``skip_identical``, tracks whose embedded art already equals
+    the image are left untouched and counted as ``skipped``.
+
+    Returns a dict: ``{embedded, skipped, failed, total, errors}``.
     """
     data = _read_cover_bytes(image)
-    validate_image(data)  # whole-batch gate: bad source -> raise, touch nothing
+    mime = validate_image(data)  # whole-batch gate: bad source -> raise, touch nothing
 
-    result: Dict[str, object] = {"embedded": 0, "failed": 0, "total": 0, "errors": []}
+    result: Dict[str, object] = {
+        "embedded": 0, "skipped": 0, "failed": 0, "total": 0, "errors": [],
+    }
     files = list(iter_audio_files(album_path))
     result["total"] = len(files)
 
-    for audio_file in files:
-        try:
-            embed_in_file(audio_file, data)
-            result["embedded"] = int(result["embedded"]) + 1
-        except Exception as exc:  # fail-soft: log + skip + continue
-            result["failed"] = int(result["failed"]) + 1
-            result["errors"].append(f"{audio_file.name}: {exc}")  # type: ignore[attr-defined]
+    n = len(files)
+    workers = min(max_workers, n)
+    if workers > 1:
+        ffprobe_available()  # resolve (maybe download) ffprobe once, not per thread
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            outcomes = list(pool.map(_embed_one, files, [data] * n, [mime] * n,
+                                     [skip_identical] * n))
+    else:
+        outcomes = [_embed_one(audio_file, data, mime, skip_identical) for audio_file in files]
+
+    errors = [error for _, error in outcomes if error is not None]
+    result["errors"] = errors
+    result["failed"] = len(errors)
+    result["embedded"] = sum(1 for written, _ in outcomes if written)
+    result["skipped"] = n - len(errors) - int(result["embedded"])
 
     if write_folder_jpg and int(result["embedded"]) > 0:
         try:
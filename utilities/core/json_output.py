@@ -0,0 +1,66 @@
+"""JSON report and state-file I/O shared by the library-wide tools.
+
+Audit and cleanup reports cover the whole library and can run to tens of MB,
+where stdlib ``json`` pretty-printing is slow. :func:`write_json` uses
+``orjson`` when it is installed and falls back to ``json`` otherwise; both emit
+the same 2-space-indented UTF-8 text for the plain str/int/list/dict data the
+reports contain, so the files do not change with the environment.
+
+:func:`read_json` (files) and :func:`loads_json` (bytes, e.g. an HTTP response
+body) parse with ``orjson`` when available, and
+:func:`iter_json_items` streams a top-level object with ``ijson`` so a reader
+that only wants a few entries never holds the whole file in memory.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Iterator, Tuple
+
+
+def read_json(path) -> Any:
+    """Parse the UTF-8 JSON file at ``path``."""
+    try:
+        import orjson  # optional dependency
+    except ImportError:
+        with open(path, "r", encoding="utf-8") as handle:
+            return json.load(handle)
+    with open(path, "rb") as handle:
+        return orjson.loads(handle.read())
+
+
+def loads_json(data: bytes) -> Any:
+    """Parse a UTF-8 JSON document held in memory."""
+    try:
+        import orjson  # optional dependency
+    except ImportError:
+        return json.loads(data)
+    return orjson.loads(data)
+
+
+def iter_json_items(path) -> Iterator[Tuple[str, Any]]:
+    """Yield ``(key, value)`` for each entry of the top-level JSON object at ``path``.
+
+    Streams with ``ijson`` when it is installed (one entry in memory at a time),
+    otherwise loads the file with :func:`read_json`. Numbers come back as
+    ``int``/``float`` either way.
+    """
+    try:
+        import ijson  # optional dependency
+    except ImportError:
+        yield from read_json(path).items()
+        return
+    with open(path, "rb") as handle:
+        yield from ijson.kvitems(handle, "", use_float=True)
+
+
+def write_json(obj, path) -> None:
+    """Write ``obj`` to ``path`` as 2-space-indented UTF-8 JSON."""
+    try:
+        import orjson  # optional dependency
+    except ImportError:
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(obj, handle, indent=2, ensure_ascii=False)
+        return
+    with open(path, "wb") as handle:
+        handle.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
@@ -0,0 +1,42 @@
+"""Thread-safe request rate limiting shared by the online lookups.
+
+MusicBrainz and friends allow an average request rate rather than demanding a
+fixed pause after every call. :class:`TokenBucket` enforces exactly that: a
+caller only waits when the bucket is empty, so time already spent on a slow
+response (or on local work between requests) counts toward the spacing, and
+concurrent threads together never exceed ``rate`` requests per second.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Allow ``rate`` acquisitions per second on average, bursting up to ``capacity``."""
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available.
+
+        The lock is held while sleeping so waiting threads are served one at a
+        time rather than all waking on the same refill.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            if self._tokens < 1:
+                time.sleep((1 - self._tokens) / self.rate)
+                self._tokens = 1.0
+                self._last = time.monotonic()
+            self._tokens -= 1
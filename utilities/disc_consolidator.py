@@ -18,11 +18,20 @@ Consolidation behaviour:
 - The discnumber metadata is set to "N/total" (MP3/FLAC) or the disk tuple (M4A).
 - Cover art (folder.jpg / cover.jpg / album.jpg / front.jpg) is carried over.
 - Empty source folders are removed after their tracks move.
+- Tracks are renamed in place when source and target share a filesystem and
+  copied otherwise; ``--copy`` copies instead and leaves the disc folders intact.
+- ``--jobs N`` consolidates up to N albums at once in worker processes.
 """
 
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import contextlib
+import io
+import multiprocessing
+import os
 import re
 import shutil
 import sys
@@ -31,19 +40,122 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
 sys.stdout.reconfigure(encoding='utf-8')
 
-try:
-    from mutagen.mp3 import MP3
-    from mutagen.mp4 import MP4
-    from mutagen.flac import FLAC
-    from mutagen.easyid3 import EasyID3
-except ImportError:
-    print("Error: mutagen library required. Install with: pip install mutagen")
-    sys.exit(1)
-
-from utilities.core.audio_file import iter_audio_files
+from utilities.core.audio_file import AUDIO_EXTS, keep_padding
 
 # Cover-art filenames carried over to the consolidated folder, in priority order.
 COVER_NAMES = ["folder.jpg", "cover.jpg", "album.jpg", "front.jpg"]
+_COVER_RANK = {name: rank for rank, name in enumerate(COVER_NAMES)}
+
+# Name filters for the disc folder scan, matched in C without lowercasing each
+# name. Built from AUDIO_EXTS / COVER_NAMES so they cannot drift apart.
+_AUDIO_NAME_RE = re.compile(
+    r'.\.(?:%s)\Z' % '|'.join(re.escape(ext[1:]) for ext in sorted(AUDIO_EXTS)),
+    re.IGNORECASE | re.DOTALL)
+_COVER_NAME_RE = re.compile(
+    '|'.join(re.escape(name) for name in COVER_NAMES), re.IGNORECASE)
+
+# Tracks transferred + tagged concurrently per album (the work is I/O bound).
+DEFAULT_MAX_WORKERS = 8
+
+# Buffer for the user-space copy fallback (shutil's default is 64 KiB).
+COPY_BUFSIZE = 1024 * 1024
+
+# A filename that already carries a disc prefix ("1-01 Track.mp3").
+_DISC_PREFIX_RE = re.compile(r'^\d+-')
+
+
+def _scan_disc_folder(folder: str) -> Tuple[List[str], List[str]]:
+    """Audio file names and cover images directly inside ``folder``.
+
+    Plain-string counterpart of ``iter_audio_files`` for the consolidation hot
+    loop, which only needs names to build source/target paths with ``os.path``.
+    Cover images are picked up by the same directory read so carrying art over
+    needn't list the folder again; they come back in ``COVER_NAMES`` order.
+    """
+    names = []
+    covers = []
+    # Bound once: this loop runs for every file of every disc folder.
+    is_audio = _AUDIO_NAME_RE.search
+    is_cover = _COVER_NAME_RE.fullmatch
+    with os.scandir(folder) as it:
+        for e in it:
+            name = e.name
+            if is_audio(name):
+                if e.is_file():
+                    names.append(name)
+            elif is_cover(name) and e.is_file():
+                covers.append(name)
+    names.sort()
+    covers.sort(key=lambda n: _COVER_RANK[n.lower()])
+    return names, covers
+
+
+def _unique_name(name: str, taken: set) -> str:
+    """``name``, or ``stem (2).ext`` etc. if its casefold is already in ``taken``."""
+    stem, ext = os.path.splitext(name)
+    candidate = name
+    n = 2
+    while candidate.casefold() in taken:
+        candidate = f"{stem} ({n}){ext}"
+        n += 1
+    return candidate
+
+
+def _kernel_copy(src_fd: int, dst_fd: int, size: int) -> bool:
+    """Copy ``size`` bytes between file descriptors inside the kernel.
+
+    Tries ``os.copy_file_range`` (can reflink), then ``os.sendfile`` (works
+    across filesystems on older kernels). Each attempt starts from offset 0;
+    returns False if neither completes.
+    """
+    copiers = []
+    if hasattr(os, 'copy_file_range'):
+        copiers.append(lambda n: os.copy_file_range(src_fd, dst_fd, n))
+    if hasattr(os, 'sendfile'):
+        copiers.append(lambda n: os.sendfile(dst_fd, src_fd, None, n))
+
+    for copy_chunk in copiers:
+        os.lseek(src_fd, 0, os.SEEK_SET)
+        os.lseek(dst_fd, 0, os.SEEK_SET)
+        os.ftruncate(dst_fd, 0)
+        remaining = size
+        try:
+            while remaining > 0:
+                copied = copy_chunk(remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        except OSError:
+            continue
+        if remaining == 0:
+            return True
+    return False
+
+
+def _fast_copy(src: str, dst: str) -> str:
+    """Copy ``src`` to ``dst`` with its metadata, like ``shutil.copy2``.
+
+    On Linux the data is copied in the kernel (see ``_kernel_copy``), with a
+    1 MiB user-space loop as the last resort. Elsewhere ``shutil.copy2``
+    already hands the copy to the OS (``fcopyfile`` / ``CopyFile2``).
+    """
+    if not sys.platform.startswith('linux'):
+        return shutil.copy2(src, dst)
+
+    # Unbuffered source: every path below reads in big chunks itself. The
+    # destination keeps BufferedWriter, which retries short writes (1 MiB
+    # chunks bypass its buffer anyway).
+    with open(src, 'rb', buffering=0) as fsrc, open(dst, 'wb') as fdst:
+        size = os.fstat(fsrc.fileno()).st_size
+        # Whole-file sequential read: let the kernel read ahead aggressively.
+        os.posix_fadvise(fsrc.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        if not _kernel_copy(fsrc.fileno(), fdst.fileno(), size):
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+            shutil.copyfileobj(fsrc, fdst, COPY_BUFSIZE)
+    shutil.copystat(src, dst)
+    return dst
 
 
 @dataclass
@@ -52,6 +164,19 @@ class DiscInfo:
     base_name: str
     disc_number: int
     track_count: int
+    # Audio file names found during detection (None = not listed yet).
+    files: Optional[List[str]] = field(default=None, repr=False)
+    # Cover image names found alongside, best first (None = not listed yet).
+    covers: Optional[List[str]] = field(default=None, repr=False)
+
+
+@dataclass
+class PlannedTrack:
+    """One track's planned move into the consolidated folder."""
+    name: str
+    new_name: str
+    source: str
+    dest: str
 
 
 class DiscConsolidator:
@@ -66,18 +191,28 @@ class DiscConsolidator:
         (r'^(.+?)\s*CD\s*(\d+)$', 'suffix_cd'),                   # "Album CD1" / "Album CD 1"
     ]
 
-    def __init__(self):
+    # All patterns as one alternation, compiled once. Alternatives are tried in
+    # list order, exactly like looping over DISC_PATTERNS. Each contributes a
+    # (base, number) group pair, so the matched one ends at ``lastindex``.
+    DISC_RE = re.compile('|'.join(f'(?:{p})' for p, _ in DISC_PATTERNS), re.IGNORECASE)
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS):
+        self.max_workers = max_workers
         self.disc_sets: Dict[str, List[DiscInfo]] = {}
         self.orphaned_discs: Dict[str, DiscInfo] = {}
 
     def parse_folder_name(self, name: str) -> Optional[Tuple[str, int]]:
         """Extract base album name and disc number from folder name."""
-        for pattern, _ in self.DISC_PATTERNS:
-            match = re.match(pattern, name, re.IGNORECASE)
-            if match:
-                base_name = match.group(1).strip()
-                disc_num = int(match.group(2))
-                return base_name, disc_num
+        # Every pattern needs "disc"/"disk"/"cd"; most album folders have none,
+        # so a substring test skips the regex for them.
+        folded = name.casefold()
+        if 'dis' not in folded and 'cd' not in folded:
+            return None
+        match = self.DISC_RE.match(name)
+        if match:
+            base_name = match.group(match.lastindex - 1).strip()
+            disc_num = int(match.group(match.lastindex))
+            return base_name, disc_num
         return None
 
     def detect_multi_disc(self, path: str | Path) -> Dict[str, List[DiscInfo]]:
@@ -94,21 +229,29 @@ class DiscConsolidator:
             print(f"Path not found: {base_path}")
             return {}
 
-        grouped: Dict[str, List[DiscInfo]] = {}
+        grouped: Dict[str, List[DiscInfo]] = defaultdict(list)
+        parse = self.parse_folder_name
 
-        for folder in (d for d in base_path.iterdir() if d.is_dir()):
-            result = self.parse_folder_name(folder.name)
-            if result:
+        # os.scandir gives names and entry types from one directory read; only
+        # folders that parse as a disc become Path objects.
+        with os.scandir(base_path) as it:
+            for entry in it:
+                result = parse(entry.name)
+                if not result or not entry.is_dir():
+                    continue
                 base_name, disc_num = result
-                track_count = sum(1 for _ in iter_audio_files(folder))
+                # Keep the listing so consolidation needn't read the folder again.
+                files, covers = _scan_disc_folder(entry.path)
 
                 disc_info = DiscInfo(
-                    folder=folder,
+                    folder=Path(entry.path),
                     base_name=base_name,
                     disc_number=disc_num,
-                    track_count=track_count
+                    track_count=len(files),
+                    files=files,
+                    covers=covers
                 )
-                grouped.setdefault(base_name, []).append(disc_info)
+                grouped[base_name].append(disc_info)
 
         for name, discs in grouped.items():
             if len(discs) >= 2:
@@ -119,34 +262,92 @@ class DiscConsolidator:
         return self.disc_sets
 
     @staticmethod
-    def _set_track_metadata(filepath: Path, album: str, disc_number: int, total_discs: int) -> None:
-        """Set album + disc-number metadata across MP3/M4A/FLAC formats."""
-        ext = filepath.suffix.lower()
+    def _set_track_metadata(
+        filething, album: str, disc_number: int, total_discs: int, ext: Optional[str] = None
+    ) -> bool:
+        """Set album + disc-number metadata across MP3/M4A/FLAC formats.
+
+        All fields go out in a single save per file, using ``keep_padding`` so
+        the save is in place whenever the tags fit. Files whose tags already
+        match are not saved at all, so re-running a consolidation is cheap.
+        ``filething`` is a path or a seekable file object (e.g. ``BytesIO``);
+        pass ``ext`` for file objects, whose format cannot be taken from a name.
+
+        Returns True if the file was written.
+        """
+        # mutagen is imported here so detection / dry runs never load it.
+        from mutagen.mp3 import MP3
+        from mutagen.mp4 import MP4
+        from mutagen.flac import FLAC
+        from mutagen.easyid3 import EasyID3
+
+        ext = (ext or os.path.splitext(filething)[1]).lower()
         if ext == '.mp3':
-            audio = MP3(str(filepath), ID3=EasyID3)
-            audio['album'] = album
-            audio['discnumber'] = f"{disc_number}/{total_discs}"
-            audio.save()
+            audio = MP3(filething, ID3=EasyID3)
+            wanted = {
+                'album': [album],
+                'discnumber': [f"{disc_number}/{total_discs}"],
+            }
         elif ext in ('.m4a', '.mp4'):
-            audio = MP4(str(filepath))
-            audio['\xa9alb'] = [album]
-            audio['disk'] = [(disc_number, total_discs)]
-            audio.save()
+            audio = MP4(filething)
+            wanted = {
+                '\xa9alb': [album],
+                'disk': [(disc_number, total_discs)],
+            }
         elif ext == '.flac':
-            audio = FLAC(str(filepath))
-            audio['album'] = album
-            audio['discnumber'] = str(disc_number)
-            audio['disctotal'] = str(total_discs)
-            audio.save()
+            audio = FLAC(filething)
+            wanted = {
+                'album': [album],
+                'discnumber': [str(disc_number)],
+                'disctotal': [str(total_discs)],
+            }
+        else:
+            return False
+
+        if all(audio.get(key) == value for key, value in wanted.items()):
+            return False
+        for key, value in wanted.items():
+            audio[key] = value
+        audio.save(filething, padding=keep_padding)
+        return True
+
+    def _copy_with_metadata(
+        self, source: str, dest: str, album: str, disc_number: int, total_discs: int
+    ) -> bool:
+        """Copy a track with its disc tags patched in memory: one read, one write.
+
+        Returns False (after a plain copy) when the tags could not be set, so the
+        caller can retry on disk and report the failure.
+        """
+        with open(source, 'rb') as f:
+            buffer = io.BytesIO(f.read())
+        try:
+            self._set_track_metadata(buffer, album, disc_number, total_discs,
+                                     ext=os.path.splitext(source)[1])
+        except Exception:
+            _fast_copy(source, dest)
+            return False
+        with open(dest, 'wb') as f:
+            f.write(buffer.getbuffer())
+        shutil.copystat(source, dest)
+        return True
 
     def consolidate(
         self,
         album_name: str,
         discs: List[DiscInfo],
         target_folder: Optional[str] = None,
-        dry_run: bool = False
+        dry_run: bool = False,
+        copy: bool = False,
+        refresh: bool = False
     ) -> bool:
-        """Consolidate a multi-disc set into a single folder."""
+        """Consolidate a multi-disc set into a single folder.
+
+        With ``copy`` the tracks and cover art are copied and the disc folders
+        are left untouched; otherwise they are moved and emptied folders removed.
+        Track listings cached by ``detect_multi_disc`` are reused unless
+        ``refresh`` asks for the disc folders to be read again.
+        """
         if not discs:
             return False
 
@@ -160,66 +361,162 @@ class DiscConsolidator:
         print(f"  Discs found: {len(discs)}")
         print(f"  Target: {target_name}")
 
+        # Walk each disc folder once; the dry run and the real run share the plan.
+        plan = self._plan_consolidation(discs, target_path, refresh=refresh)
+
         if dry_run:
-            for disc in discs:
+            for disc, tracks in plan:
                 print(f"  [Disc {disc.disc_number}] {disc.folder.name} ({disc.track_count} tracks)")
+                for track in tracks:
+                    if track.source != track.dest:
+                        print(f"    Would {'copy' if copy else 'move'}: {track.name} -> {track.new_name}")
             print("  (Dry run - no changes)")
             return True
 
         # Create target folder if needed
         target_path.mkdir(exist_ok=True)
-
-        for disc in discs:
-            disc_num = disc.disc_number
-            print(f"\n  Processing Disc {disc_num}...")
-
-            for track in iter_audio_files(disc.folder):
-                # Add disc prefix to filename if not already present.
-                name = track.name
-                if not re.match(r'^\d+-', name):
-                    new_name = f"{disc_num}-{name}"
-                else:
-                    new_name = name
-
-                # Move file into the flat target folder.
-                dest = target_path / new_name
-                if disc.folder != target_path:
-                    shutil.move(str(track), str(dest))
-                    print(f"    Moved: {name} -> {new_name}")
-                elif name != new_name:
-                    track.rename(dest)
-                    print(f"    Renamed: {name} -> {new_name}")
-
-                # Update album + disc metadata.
-                try:
-                    self._set_track_metadata(dest, target_name, disc_num, total_discs)
-                except Exception as e:
-                    print(f"    Warning: Could not update metadata: {e}")
-
+        target_dev = os.stat(target_path).st_dev
+
+        # Transfer + tag tracks in a thread pool. Targets were fixed during
+        # planning, so workers never race on names; logs come back in order.
+        tasks = []
+        for index, (disc, tracks) in enumerate(plan):
+            same_folder = disc.folder == target_path
+            # One device check per disc: same filesystem means a plain rename.
+            same_fs = os.stat(disc.folder).st_dev == target_dev
+            tasks.extend((index, track, same_folder, same_fs) for track in tracks)
+
+        def run(task):
+            index, track, same_folder, same_fs = task
+            disc_num = plan[index][0].disc_number
+            return index, self._transfer_track(
+                track, target_name, disc_num, total_discs, same_folder, same_fs, copy)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            current = None
+            for index, lines in pool.map(run, tasks):
+                if index != current:
+                    current = index
+                    print(f"\n  Processing Disc {plan[index][0].disc_number}...")
+                for line in lines:
+                    print(line)
+
+        for disc, _ in plan:
             # Carry over cover art and remove the now-empty source folder.
-            if disc.folder != target_path:
-                self._carry_cover_art(disc.folder, target_path)
-                remaining = list(disc.folder.iterdir())
-                if not remaining:
+            if disc.folder == target_path:
+                continue
+            self._carry_cover_art(disc.folder, target_path, disc.covers, copy=copy)
+            if not copy:
+                try:
                     disc.folder.rmdir()
-                    print(f"  Removed empty folder: {disc.folder.name}")
+                except OSError:
+                    continue  # other files remain
+                print(f"  Removed empty folder: {disc.folder.name}")
 
         print(f"\n  Consolidation complete!")
         return True
 
+    def _transfer_track(
+        self,
+        track: PlannedTrack,
+        album: str,
+        disc_number: int,
+        total_discs: int,
+        same_folder: bool,
+        same_fs: bool,
+        copy: bool
+    ) -> List[str]:
+        """Move/copy/rename one planned track and set its disc tags.
+
+        Runs on a worker thread, so it returns its log lines instead of printing.
+        """
+        log = []
+        if not same_folder and (copy or not same_fs):
+            # Bytes must be copied anyway: tag them on the way through.
+            tagged = self._copy_with_metadata(
+                track.source, track.dest, album, disc_number, total_discs)
+            if not copy:
+                os.remove(track.source)
+            log.append(f"    {'Copied' if copy else 'Moved'}: {track.name} -> {track.new_name}")
+            if tagged:
+                return log
+        elif not same_folder:
+            # os.replace, not os.rename: on Windows rename refuses an existing dest
+            os.replace(track.source, track.dest)
+            log.append(f"    Moved: {track.name} -> {track.new_name}")
+        elif track.name != track.new_name:
+            os.replace(track.source, track.dest)
+            log.append(f"    Renamed: {track.name} -> {track.new_name}")
+
+        # Update album + disc metadata.
+        try:
+            self._set_track_metadata(track.dest, album, disc_number, total_discs)
+        except Exception as e:
+            log.append(f"    Warning: Could not update metadata: {e}")
+        return log
+
     @staticmethod
-    def _carry_cover_art(source: Path, target: Path) -> None:
-        """Move the first available cover image into the target if it lacks one."""
-        if any((target / name).exists() for name in COVER_NAMES):
+    def _plan_consolidation(
+        discs: List[DiscInfo], target_path: Path, refresh: bool = False
+    ) -> List[Tuple[DiscInfo, List[PlannedTrack]]]:
+        """Plan every track's target name/path, listing each disc at most once.
+
+        Target names are tracked in a set (casefolded, as on Windows), so two
+        discs with the same file name never overwrite each other and no
+        per-file ``exists`` check is needed.
+        """
+        target_str = str(target_path)
+        # Files already in a pre-existing target (not one of the discs) are taken.
+        planned = set()
+        if target_path.is_dir() and all(d.folder != target_path for d in discs):
+            planned.update(n.casefold() for n in _scan_disc_folder(target_str)[0])
+
+        plan = []
+        for disc in discs:
+            folder_str = str(disc.folder)
+            if refresh or disc.files is None or disc.covers is None:
+                disc.files, disc.covers = _scan_disc_folder(folder_str)
+            tracks = []
+            for name in disc.files:
+                # Add disc prefix to filename if not already present.
+                if not _DISC_PREFIX_RE.match(name):
+                    new_name = f"{disc.disc_number}-{name}"
+                else:
+                    new_name = name
+                if new_name.casefold() in planned:
+                    new_name = _unique_name(f"{disc.disc_number}-{name}", planned)
+                planned.add(new_name.casefold())
+                tracks.append(PlannedTrack(
+                    name=name,
+                    new_name=new_name,
+                    source=os.path.join(folder_str, name),
+                    dest=os.path.join(target_str, new_name),
+                ))
+            plan.append((disc, tracks))
+        return plan
+
+    @staticmethod
+    def _carry_cover_art(
+        source: Path, target: Path, covers: List[str], copy: bool = False
+    ) -> None:
+        """Move (or copy) the best of ``covers`` into the target if it lacks one."""
+        if not covers or any((target / name).exists() for name in COVER_NAMES):
             return
-        for name in COVER_NAMES:
-            candidate = source / name
-            if candidate.exists():
-                shutil.move(str(candidate), str(target / "folder.jpg"))
-                return
-
-    def consolidate_all(self, path: str | Path, dry_run: bool = False) -> Dict:
-        """Detect and consolidate all multi-disc albums."""
+        candidate = source / covers[0]
+        if copy:
+            _fast_copy(str(candidate), str(target / "folder.jpg"))
+        else:
+            shutil.move(str(candidate), str(target / "folder.jpg"))
+
+    def consolidate_all(
+        self, path: str | Path, dry_run: bool = False, copy: bool = False, jobs: int = 1
+    ) -> Dict:
+        """Detect and consolidate all multi-disc albums.
+
+        With ``jobs`` > 1 albums are consolidated in that many worker
+        processes (their files are disjoint); each album's log is printed
+        whole, in detection order.
+        """
         disc_sets = self.detect_multi_disc(path)
 
         results = {
@@ -236,18 +533,53 @@ class DiscConsolidator:
 
         print(f"\n=== Found {len(disc_sets)} multi-disc sets ===")
 
-        for album_name, discs in disc_sets.items():
-            try:
-                if self.consolidate(album_name, discs, dry_run=dry_run):
-                    results['consolidated'] += 1
-                else:
-                    results['skipped'] += 1
-            except Exception as e:
-                print(f"Error consolidating {album_name}: {e}")
-                results['errors'] += 1
+        tasks = [(album_name, discs, dry_run, copy, self.max_workers)
+                 for album_name, discs in disc_sets.items()]
+        if jobs > 1 and len(tasks) > 1:
+            with multiprocessing.Pool(min(jobs, len(tasks))) as pool:
+                outcomes = pool.imap(_consolidate_one, tasks)
+                for _, ok, log in outcomes:
+                    print(log, end='')
+                    self._tally(results, ok)
+        else:
+            for album_name, discs, *_ in tasks:
+                try:
+                    ok = self.consolidate(album_name, discs, dry_run=dry_run, copy=copy)
+                except Exception as e:
+                    print(f"Error consolidating {album_name}: {e}")
+                    ok = None
+                self._tally(results, ok)
 
         return results
 
+    @staticmethod
+    def _tally(results: Dict, ok: Optional[bool]) -> None:
+        """Count one album outcome: True consolidated, False skipped, None error."""
+        if ok is None:
+            results['errors'] += 1
+        elif ok:
+            results['consolidated'] += 1
+        else:
+            results['skipped'] += 1
+
+
+def _consolidate_one(task: Tuple) -> Tuple[str, Optional[bool], str]:
+    """Consolidate one album in a pool worker (module-level so it pickles).
+
+    Output is captured and returned rather than printed, so albums running
+    side by side don't interleave their logs.
+    """
+    album_name, discs, dry_run, copy, max_workers = task
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        try:
+            ok = DiscConsolidator(max_workers).consolidate(
+                album_name, discs, dry_run=dry_run, copy=copy)
+        except Exception as e:
+            print(f"Error consolidating {album_name}: {e}")
+            ok = None
+    return album_name, ok, log.getvalue()
+
 
 def main():
     """CLI entry point."""
@@ -258,10 +590,16 @@ def main():
     parser.add_argument('--dry-run', action='store_true', help='Preview without changes')
     parser.add_argument('--scan-only', action='store_true', help='Only detect, do not consolidate')
     parser.add_argument('--album', help='Consolidate specific album only')
+    parser.add_argument('--copy', action='store_true',
+                        help='Copy tracks instead of moving them (disc folders are kept)')
+    parser.add_argument('--threads', type=int, default=DEFAULT_MAX_WORKERS,
+                        help=f'Tracks transferred concurrently (default: {DEFAULT_MAX_WORKERS})')
+    parser.add_argument('--jobs', type=int, default=1, metavar='N',
+                        help='Albums consolidated in parallel worker processes (default: 1)')
 
     args = parser.parse_args()
 
-    consolidator = DiscConsolidator()
+    consolidator = DiscConsolidator(max_workers=args.threads)
 
     if args.scan_only:
         disc_sets = consolidator.detect_multi_disc(args.path)
@@ -277,11 +615,13 @@ def main():
     elif args.album:
         disc_sets = consolidator.detect_multi_disc(args.path)
         if args.album in disc_sets:
-            consolidator.consolidate(args.album, disc_sets[args.album], dry_run=args.dry_run)
+            consolidator.consolidate(args.album, disc_sets[args.album], dry_run=args.dry_run,
+                                     copy=args.copy)
         else:
             print(f"Album not found: {args.album}")
     else:
-        results = consolidator.consolidate_all(args.path, dry_run=args.dry_run)
+        results = consolidator.consolidate_all(args.path, dry_run=args.dry_run, copy=args.copy,
+                                               jobs=args.jobs)
         print(f"\n=== SUMMARY ===")
         print(f"Found: {results['found']}")
         print(f"Consolidated: {results['consolidated']}")
@@ -97,74 +97,103 @@ def log_cover_correction(album_path, image_url, old_hash=None, old_size_kb=None)
         print(f"  Warning: Failed to update cover mapping: {e}")
 
 
-def download_image(url, output_path=None):
-    """Download a validated image from ``url``.
+def extract_cover_from_file(filepath):
+    """Extract embedded cover art bytes from an audio file. Returns bytes or None."""
+    return cover_art.extract_cover_from_file(filepath)
+
+
+def _image_bytes(image):
+    """Image bytes from raw bytes or a file path (read once by the caller)."""
+    if isinstance(image, (bytes, bytearray)):
+        return bytes(image)
+    with open(image, "rb") as f:
+        return f.read()
+
+
+def _load_image(image_source):
+    """Return validated-download or local-file bytes for ``image_source``."""
+    if isinstance(image_source, str) and image_source.startswith("http"):
+        print("Downloading cover art...")
+        return cover_art.download_cover(image_source)
+    return _image_bytes(image_source)
 
-    Returns the bytes (when ``output_path`` is None) or True after writing the
-    file. Returns None/False on failure (invalid or unreachable image).
+
+def _file_matches(path, data, chunk_size=1 << 16):
+    """True if the file at ``path`` holds exactly ``data``.
+
+    A size mismatch answers without reading; otherwise the file is streamed in
+    chunks against ``data`` and stops at the first difference, so the existing
+    image is never loaded whole next to the new one.
     """
     try:
-        data = cover_art.download_cover(url)
-    except InvalidCoverArt as e:
-        print(f"  Image download/validation failed: {e}")
-        return None if output_path is None else False
-    if output_path:
-        with open(output_path, "wb") as f:
-            f.write(data)
-        return True
-    return data
+        if os.path.getsize(path) != len(data):
+            return False
+        view = memoryview(data)
+        with open(path, "rb") as f:
+            offset = 0
+            while chunk := f.read(chunk_size):
+                if view[offset:offset + len(chunk)] != chunk:
+                    return False
+                offset += len(chunk)
+        return offset == len(data)
+    except OSError:
+        return False
 
 
-def extract_cover_from_file(filepath):
-    """Extract embedded cover art bytes from an audio file. Returns bytes or None."""
-    return cover_art.extract_cover_from_file(filepath)
+def _first_embedded_cover(album_path):
+    """Return the bytes of the first track's embedded cover, or None."""
+    from utilities.core.audio_file import iter_audio_files
+
+    for audio_file in iter_audio_files(album_path):
+        data = cover_art.extract_cover_from_file(audio_file)
+        if data:
+            return data
+    return None
 
 
 def get_album_cover_hash(album_path):
-    """Return (md5_hex, bytes) of the first track's embedded cover, or (None, None)."""
-    from utilities.core.audio_file import AUDIO_EXTS
+    """Return (md5_hex, bytes) of the first track's embedded cover, or (None, None).
 
-    for filename in sorted(os.listdir(album_path)):
-        if os.path.splitext(filename)[1].lower() in AUDIO_EXTS:
-            data = cover_art.extract_cover_from_file(os.path.join(album_path, filename))
-            if data:
-                return hashlib.md5(data).hexdigest(), data
-    return None, None
+    The MD5 is what gets shown (--show-current) and logged to corrections.json;
+    equality checks compare the bytes directly instead.
+    """
+    data = _first_embedded_cover(album_path)
+    if data is None:
+        return None, None
+    return hashlib.md5(data).hexdigest(), data
 
 
-def embed_cover_mp3(filepath, image_path):
-    """Embed (validated) cover art into an MP3 file."""
-    cover_art.embed_in_file(filepath, image_path)
+def embed_cover_mp3(filepath, image):
+    """Embed (validated) cover art into an MP3 file. ``image`` is bytes or a path."""
+    cover_art.embed_in_file(filepath, image)
 
 
-def embed_cover_m4a(filepath, image_path):
-    """Embed (validated) cover art into an M4A file."""
-    cover_art.embed_in_file(filepath, image_path)
+def embed_cover_m4a(filepath, image):
+    """Embed (validated) cover art into an M4A file. ``image`` is bytes or a path."""
+    cover_art.embed_in_file(filepath, image)
 
 
-def embed_cover_flac(filepath, image_path):
-    """Embed (validated) cover art into a FLAC file."""
-    cover_art.embed_in_file(filepath, image_path)
+def embed_cover_flac(filepath, image):
+    """Embed (validated) cover art into a FLAC file. ``image`` is bytes or a path."""
+    cover_art.embed_in_file(filepath, image)
 
 
-def embed_cover_album(album_path, image_path, force=False):
+def embed_cover_album(album_path, image, force=False):
     """Embed validated cover art into all audio files in an album folder.
 
-    When ``force`` is False and the album already has identical embedded art,
-    the operation is skipped. Returns the count of files embedded.
+    ``image`` is the image bytes or a path to it. When ``force`` is False,
+    each track whose embedded art already equals the image is skipped, so
+    albums with mixed per-track covers only rewrite the tracks that differ.
+    Returns the count of files embedded.
     """
-    with open(image_path, "rb") as f:
-        new_image_data = f.read()
-
-    if not force:
-        existing_hash, _ = get_album_cover_hash(album_path)
-        if existing_hash and existing_hash == hashlib.md5(new_image_data).hexdigest():
-            print("  Cover art already matches - skipping (use --force to override)")
-            return 0
-
-    result = cover_art.embed_in_album(album_path, new_image_data)
+    result = cover_art.embed_in_album(album_path, _image_bytes(image), skip_identical=not force)
     for error in result["errors"]:
         print(f"  ERROR on {error}")
+    if result["skipped"] and not result["embedded"] and not result["errors"]:
+        print("  Cover art already matches - skipping (use --force to override)")
+        return 0
+    if result["skipped"]:
+        print(f"  Unchanged: {result['skipped']} files already had this cover")
     print(f"  Embedded: {result['embedded']}/{result['total']} files")
     return int(result["embedded"])
 
@@ -175,12 +204,7 @@ def embed_cover_art(album_path, cover):
     ``cover`` may be an http(s) URL or a local image path. Downloads/validates,
     embeds into every track, and writes folder.jpg. Returns files embedded.
     """
-    if isinstance(cover, str) and cover.startswith("http"):
-        print("Downloading cover art...")
-        data = cover_art.download_cover(cover)
-    else:
-        with open(cover, "rb") as f:
-            data = f.read()
+    data = _load_image(cover)
 
     print(f"Embedding cover art into: {album_path}")
     result = cover_art.embed_in_album(album_path, data)
@@ -190,25 +214,21 @@ def embed_cover_art(album_path, cover):
     return int(result["embedded"])
 
 
-def sync_folder_jpg(album_path, image_path=None):
-    """Sync folder.jpg with embedded cover art or a provided image."""
+def sync_folder_jpg(album_path, image=None):
+    """Sync folder.jpg with embedded cover art or a provided image (bytes or path)."""
     folder_jpg = os.path.join(album_path, "folder.jpg")
 
-    if image_path:
-        with open(image_path, "rb") as f:
-            image_data = f.read()
+    if image:
+        image_data = _image_bytes(image)
     else:
-        _, image_data = get_album_cover_hash(album_path)
+        image_data = _first_embedded_cover(album_path)
         if not image_data:
             print("  No embedded cover art found to sync")
             return False
 
-    if os.path.exists(folder_jpg):
-        with open(folder_jpg, "rb") as f:
-            existing_data = f.read()
-        if hashlib.md5(existing_data).hexdigest() == hashlib.md5(image_data).hexdigest():
-            print("  folder.jpg already in sync")
-            return True
+    if _file_matches(folder_jpg, image_data):
+        print("  folder.jpg already in sync")
+        return True
 
     with open(folder_jpg, "wb") as f:
         f.write(image_data)
@@ -216,23 +236,59 @@ def sync_folder_jpg(album_path, image_path=None):
     return True
 
 
-if __name__ == "__main__":
-    if len(sys.argv) < 2:
+def embed(album_path, image_source, force=False, image_data=None):
+    """Embed ``image_source`` into an album exactly as the CLI does, in-process.
+
+    ``image_source`` is an http(s) URL or a local image path; pass
+    ``image_data`` when its bytes are already loaded. The embed itself is
+    :func:`utilities.core.cover_art.embed_in_album` (via
+    :func:`embed_cover_album`), which validates the image once, skips tracks
+    whose art already matches unless ``force``, and writes folder.jpg. For a
+    forced URL replacement the correction is then logged to the knowledge
+    base. Returns the number of files embedded; raises
+    :class:`InvalidCoverArt` when a URL does not yield a valid image.
+    """
+    if image_data is None:
+        image_data = _load_image(image_source)
+    learn = force and isinstance(image_source, str) and image_source.startswith("http")
+
+    old_hash, old_data, old_size_kb = None, None, 0
+    if learn:
+        old_hash, old_data = get_album_cover_hash(album_path)
+        old_size_kb = len(old_data) // 1024 if old_data else 0
+
+    print(f"Embedding cover art into: {album_path}")
+    count = embed_cover_album(album_path, image_data, force=force)
+
+    if count > 0:
+        print(f"\nDone! Embedded cover art into {count} files.")
+        if learn:
+            print("\n--- Learning from this correction ---")
+            log_cover_correction(album_path, image_source, old_hash, old_size_kb if old_data else None)
+    elif not force:
+        print("\nNo files embedded (cover art already matches).")
+    return count
+
+
+def main(argv=None):
+    """CLI entry point; returns the process exit code."""
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) < 1:
         print("Usage: python embed_cover.py <album_path> <image_url_or_path> [--force] [--verify]")
         print("       python embed_cover.py <album_path> --sync-folder")
         print("       python embed_cover.py <album_path> --show-current")
-        sys.exit(1)
+        return 1
 
-    album_path = sys.argv[1]
-    force = "--force" in sys.argv
-    verify = "--verify" in sys.argv
+    album_path = argv[0]
+    force = "--force" in argv
+    verify = "--verify" in argv
 
-    if "--sync-folder" in sys.argv:
+    if "--sync-folder" in argv:
         print(f"Syncing folder.jpg from embedded art: {album_path}")
         sync_folder_jpg(album_path)
-        sys.exit(0)
+        return 0
 
-    if "--show-current" in sys.argv:
+    if "--show-current" in argv:
         print(f"Extracting current embedded cover art: {album_path}")
         existing_hash, existing_data = get_album_cover_hash(album_path)
         if existing_data:
@@ -247,56 +303,40 @@ if __name__ == "__main__":
             print(f"  Hash: {existing_hash}")
         else:
             print("  No embedded cover art found")
-        sys.exit(0)
+        return 0
 
-    if len(sys.argv) < 3 or sys.argv[2].startswith("--"):
+    if len(argv) < 2 or argv[1].startswith("--"):
         print("Error: image_url_or_path is required")
-        sys.exit(1)
+        return 1
 
-    image_source = sys.argv[2]
+    image_source = argv[1]
 
-    # Resolve the image to a local path (download URLs first, with validation).
-    if image_source.startswith("http"):
-        print("Downloading cover art...")
-        temp_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "temp")
-        os.makedirs(temp_dir, exist_ok=True)
-        temp_image = os.path.join(temp_dir, "temp_cover.jpg")
-        if not download_image(image_source, temp_image):
-            print("Failed to download a valid image")
-            sys.exit(1)
-        image_path = temp_image
-    else:
-        image_path = image_source
+    # Load the image once (download URLs, with validation); preview, embed and
+    # folder.jpg sync all reuse the same bytes.
+    try:
+        image_data = _load_image(image_source)
+    except InvalidCoverArt as e:
+        print(f"  Image download/validation failed: {e}")
+        print("Failed to download a valid image")
+        return 1
 
     if verify:
         preview_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "outputs")
         os.makedirs(preview_dir, exist_ok=True)
         album_name = os.path.basename(album_path.rstrip("/\\"))
         preview_path = os.path.join(preview_dir, f"{album_name}_new_cover_preview.jpg")
-        with open(image_path, "rb") as f:
-            preview_data = f.read()
         with open(preview_path, "wb") as f:
-            f.write(preview_data)
+            f.write(image_data)
         print("\n=== VERIFICATION MODE ===")
         print(f"Album: {album_name}")
         print(f"Preview saved to: {preview_path}")
-        print(f"Size: {len(preview_data) // 1024}KB")
+        print(f"Size: {len(image_data) // 1024}KB")
         print("To proceed, run again without --verify flag.")
-        sys.exit(0)
+        return 0
 
-    old_hash, old_data, old_size_kb = None, None, 0
-    if force and image_source.startswith("http"):
-        old_hash, old_data = get_album_cover_hash(album_path)
-        old_size_kb = len(old_data) // 1024 if old_data else 0
+    embed(album_path, image_source, force=force, image_data=image_data)
+    return 0
 
-    print(f"Embedding cover art into: {album_path}")
-    count = embed_cover_album(album_path, image_path, force=force)
 
-    if count > 0:
-        print(f"\nDone! Embedded cover art into {count} files.")
-        sync_folder_jpg(album_path, image_path)
-        if force and image_source.startswith("http"):
-            print("\n--- Learning from this correction ---")
-            log_cover_correction(album_path, image_source, old_hash, old_size_kb if old_data else None)
-    elif not force:
-        print("\nNo files embedded (cover art already matches).")
+if __name__ == "__main__":
+    sys.exit(main())
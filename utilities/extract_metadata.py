@@ -1,51 +1,142 @@
 import mutagen
 from mutagen.easyid3 import EasyID3
-from mutagen.mp3 import MP3
 from mutagen.flac import FLAC
 from mutagen.mp4 import MP4
 from mutagen.id3 import ID3
 import os
 import json
 import csv
+import multiprocessing
 import sys
+import uuid
+from collections import defaultdict
+from functools import lru_cache
 
 # Allow running as a script (python utilities/extract_metadata.py ...).
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from utilities.core.audio_file import prune_dirs
+from utilities.core.audio_file import is_excluded_dir
+from utilities.core.json_output import write_json
+
+# Below this many files a worker pool costs more to start than it saves
+_POOL_MIN_FILES = 256
+
+# Extensions scan_directory audits; wider than core AUDIO_EXTS so the audit
+# also reports OGG/WAV/WMA files the other tools do not handle
+_AUDIO_EXTS = frozenset({'.mp3', '.flac', '.m4a', '.mp4', '.ogg', '.wav', '.wma'})
+
+# Cover image files looked for beside a track, in priority order
+_COVER_NAMES = ('cover.jpg', 'cover.png', 'folder.jpg', 'folder.png',
+                'album.jpg', 'album.png', 'front.jpg', 'front.png')
+
+@lru_cache(maxsize=1024)
+def _dir_covers(dirname):
+    """Map lowercased name -> actual name of the cover files in ``dirname``.
+
+    One directory read per album instead of a stat per candidate per track;
+    scan_directory clears the cache so each scan sees the current folders.
+    """
+    try:
+        with os.scandir(dirname) as it:
+            return {e.name.lower(): e.name for e in it if e.name.lower() in _COVER_NAMES}
+    except OSError:
+        return {}
+
+def _flac_picture_info(filepath):
+    """(mime, data length) of the first PICTURE block in a FLAC file, or None.
+
+    Reads only the metadata block headers and seeks past every other block, so
+    neither the Vorbis comments nor the picture bytes themselves are loaded.
+    """
+    with open(filepath, 'rb') as f:
+        magic = f.read(4)
+        if magic[:3] == b'ID3':
+            # Some taggers prepend an ID3v2 tag; its size is syncsafe.
+            header = magic + f.read(6)
+            size = 0
+            for byte in header[6:10]:
+                size = (size << 7) | (byte & 0x7F)
+            if header[5] & 0x10:
+                size += 10  # footer present
+            f.seek(10 + size)
+            magic = f.read(4)
+        if magic != b'fLaC':
+            return None
+        while True:
+            block = f.read(4)
+            if len(block) < 4:
+                return None
+            block_type = block[0] & 0x7F
+            length = int.from_bytes(block[1:4], 'big')
+            if block_type == 6:  # PICTURE
+                f.seek(4, 1)  # picture type
+                mime = f.read(int.from_bytes(f.read(4), 'big')).decode('ascii', 'replace')
+                f.seek(int.from_bytes(f.read(4), 'big') + 16, 1)  # description + dims
+                return mime, int.from_bytes(f.read(4), 'big')
+            if block[0] & 0x80:  # last metadata block
+                return None
+            f.seek(length, 1)
+
+def _embedded_cover_info(audio, ext):
+    """Describe the embedded cover in already-loaded tags (ID3/FLAC/MP4), or None"""
+    if ext == '.mp3':
+        for pic in audio.getall('APIC'):
+            return f"embedded:{pic.mime}:{len(pic.data)}bytes"
+    elif ext == '.flac':
+        if audio.pictures:
+            pic = audio.pictures[0]
+            return f"embedded:{pic.mime}:{len(pic.data)}bytes"
+    elif ext in ('.m4a', '.mp4'):
+        if audio.tags and 'covr' in audio.tags:
+            return f"embedded:image:{len(audio.tags['covr'][0])}bytes"
+    return None
+
+def _folder_cover(filepath):
+    """Path of a cover image file beside the track, or None"""
+    dirname = os.path.dirname(filepath)
+    present = _dir_covers(dirname)
+    for cover in _COVER_NAMES:
+        if cover in present:
+            return os.path.join(dirname, present[cover])
+    return None
 
 def get_cover_art_info(filepath):
     """Extract cover art information from audio file"""
     try:
         ext = os.path.splitext(filepath)[1].lower()
         if ext == '.mp3':
-            audio = MP3(filepath)
-            if audio.tags:
-                for tag in audio.tags.values():
-                    if hasattr(tag, 'mime') and hasattr(tag, 'data'):
-                        return f"embedded:{tag.mime}:{len(tag.data)}bytes"
+            # Tag only: MP3() would also decode the first MPEG frame header
+            cover = _embedded_cover_info(ID3(filepath), ext)
+            if cover:
+                return cover
         elif ext == '.flac':
-            audio = FLAC(filepath)
-            if audio.pictures:
-                pic = audio.pictures[0]
-                return f"embedded:{pic.mime}:{len(pic.data)}bytes"
+            picture = _flac_picture_info(filepath)
+            if picture:
+                mime, size = picture
+                return f"embedded:{mime}:{size}bytes"
         elif ext in ['.m4a', '.mp4']:
-            audio = MP4(filepath)
-            if 'covr' in audio.tags:
-                return f"embedded:image:{len(audio.tags['covr'][0])}bytes"
+            cover = _embedded_cover_info(MP4(filepath), ext)
+            if cover:
+                return cover
     except:
         pass
 
     # Check for cover art files in same directory
-    dirname = os.path.dirname(filepath)
-    cover_names = ['cover.jpg', 'cover.png', 'folder.jpg', 'folder.png', 'album.jpg', 'album.png', 'front.jpg', 'front.png']
-    for cover in cover_names:
-        cover_path = os.path.join(dirname, cover)
-        if os.path.exists(cover_path):
-            return cover_path
-    return None
+    return _folder_cover(filepath)
+
+def _easy_id3_get(id3, key):
+    """First value of an EasyID3-style key (e.g. 'date', 'genre') from raw ID3 tags"""
+    try:
+        return EasyID3.Get[key](id3, key)[0]
+    except (KeyError, IndexError):
+        return None
 
 def extract_metadata(filepath):
-    """Extract metadata from an audio file"""
+    """Extract metadata from an audio file
+
+    Each file is parsed once: the cover-art description comes from the same
+    loaded tags as the text fields (a separate read is only needed on the
+    generic fallback path).
+    """
     result = {
         'filepath': filepath,
         'artist': None,
@@ -60,17 +151,16 @@ def extract_metadata(filepath):
 
     try:
         ext = os.path.splitext(filepath)[1].lower()
+        tags = None  # loaded tag object the cover can be read from
 
         if ext == '.mp3':
             try:
-                audio = MP3(filepath, ID3=EasyID3)
-                result['artist'] = audio.get('artist', [None])[0]
-                result['album'] = audio.get('album', [None])[0]
-                result['title'] = audio.get('title', [None])[0]
-                result['tracknumber'] = audio.get('tracknumber', [None])[0]
-                result['date'] = audio.get('date', [None])[0]
-                result['genre'] = audio.get('genre', [None])[0]
+                # Raw ID3 (tags only); EasyID3's key getters give the same values
+                tags = ID3(filepath)
+                for key in ('artist', 'album', 'title', 'tracknumber', 'date', 'genre'):
+                    result[key] = _easy_id3_get(tags, key)
             except:
+                tags = None
                 audio = mutagen.File(filepath, easy=True)
                 if audio:
                     result['artist'] = audio.get('artist', [None])[0]
@@ -78,7 +168,7 @@ def extract_metadata(filepath):
                     result['title'] = audio.get('title', [None])[0]
                     result['tracknumber'] = audio.get('tracknumber', [None])[0]
         elif ext == '.flac':
-            audio = FLAC(filepath)
+            audio = tags = FLAC(filepath)
             result['artist'] = audio.get('artist', [None])[0]
             result['album'] = audio.get('album', [None])[0]
             result['title'] = audio.get('title', [None])[0]
@@ -86,7 +176,7 @@ def extract_metadata(filepath):
             result['date'] = audio.get('date', [None])[0]
             result['genre'] = audio.get('genre', [None])[0]
         elif ext in ['.m4a', '.mp4']:
-            audio = MP4(filepath)
+            audio = tags = MP4(filepath)
             result['artist'] = audio.tags.get('\xa9ART', [None])[0] if audio.tags else None
             result['album'] = audio.tags.get('\xa9alb', [None])[0] if audio.tags else None
             result['title'] = audio.tags.get('\xa9nam', [None])[0] if audio.tags else None
@@ -103,7 +193,10 @@ def extract_metadata(filepath):
                 result['title'] = audio.get('title', [None])[0]
                 result['tracknumber'] = audio.get('tracknumber', [None])[0]
 
-        result['cover_art'] = get_cover_art_info(filepath)
+        if tags is not None:
+            result['cover_art'] = _embedded_cover_info(tags, ext) or _folder_cover(filepath)
+        else:
+            result['cover_art'] = get_cover_art_info(filepath)
 
         # Track missing fields
         for field in ['artist', 'album', 'title', 'tracknumber']:
@@ -116,53 +209,146 @@ def extract_metadata(filepath):
 
     return result
 
-def scan_directory(base_path):
-    """Scan directory for audio files and extract metadata"""
-    audio_extensions = {'.mp3', '.flac', '.m4a', '.mp4', '.ogg', '.wav', '.wma'}
+def _walk_audio_files(base_path, audio_extensions=_AUDIO_EXTS):
+    """Yield DirEntry objects for audio files under base_path, in os.walk (top-down) order.
+
+    Walks iteratively with os.scandir, so file/dir-ness comes from the
+    directory read itself. Symlinked directories are not followed, and
+    recycle-bin/system/backup directories are pruned.
+    """
+    stack = [base_path]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        subdirs = []
+        for entry in entries:
+            if entry.is_dir():
+                if not entry.is_symlink() and not is_excluded_dir(entry.name):
+                    subdirs.append(entry.path)
+            elif os.path.splitext(entry.name)[1].lower() in audio_extensions:
+                yield entry
+        stack.extend(reversed(subdirs))
+
+def _load_scan_cache(cache_path):
+    """Read the scan cache sidecar; a missing or unreadable cache is empty"""
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+def _save_scan_cache(cache_path, cache, base_path, fresh):
+    """Replace base_path's entries in the cache with this scan's and write it
+
+    Written to a temp file and swapped in with os.replace, so an interrupted
+    scan never leaves a truncated cache behind.
+    """
+    prefix = os.path.join(os.path.abspath(base_path), '')
+    kept = {k: v for k, v in cache.items() if not k.startswith(prefix)}
+    kept.update(fresh)
+    temp = f"{cache_path}.{uuid.uuid4().hex}.tmp"
+    try:
+        with open(temp, 'w', encoding='utf-8') as f:
+            json.dump(kept, f, ensure_ascii=False)
+        os.replace(temp, cache_path)
+    except OSError as e:
+        print(f"Warning: could not write scan cache {cache_path}: {e}")
+
+def _extract_all(filepaths, jobs):
+    """extract_metadata over filepaths (in order), in a process pool when worthwhile"""
+    if jobs > 1 and len(filepaths) >= _POOL_MIN_FILES:
+        results = []
+        with multiprocessing.Pool(jobs) as pool:
+            for metadata in pool.imap(extract_metadata, filepaths, chunksize=32):
+                print(f"Processing: {metadata['filepath']}")
+                results.append(metadata)
+        return results
+
     results = []
+    for filepath in filepaths:
+        print(f"Processing: {filepath}")
+        results.append(extract_metadata(filepath))
+    return results
 
-    for root, dirs, files in os.walk(base_path):
-        prune_dirs(dirs)  # skip recycle-bin / system / backup dirs
-        for file in files:
-            ext = os.path.splitext(file)[1].lower()
-            if ext in audio_extensions:
-                filepath = os.path.join(root, file)
-                print(f"Processing: {filepath}")
-                metadata = extract_metadata(filepath)
-                results.append(metadata)
+def scan_directory(base_path, jobs=None, cache_path=None):
+    """Scan directory for audio files and extract metadata
+
+    Tag parsing is pure-Python CPU work, so large trees are spread over
+    ``jobs`` worker processes (default: CPU count); results keep walk order.
+
+    With ``cache_path`` (a JSON sidecar), files whose mtime and size are
+    unchanged since the previous scan reuse their cached metadata instead of
+    being parsed again. Folder cover-file lookups are redone on every scan,
+    since adding a folder.jpg does not touch the tracks.
+    """
+    _dir_covers.cache_clear()
+    cache = _load_scan_cache(cache_path) if cache_path else {}
+    jobs = jobs or os.cpu_count() or 1
+
+    results = []    # walk order; None where the file still has to be parsed
+    signatures = {}  # abspath -> [mtime_ns, size]
+    to_parse = []
+    for entry in _walk_audio_files(base_path):
+        key = os.path.abspath(entry.path)
+        try:
+            st = entry.stat()
+            signatures[key] = [st.st_mtime_ns, st.st_size]
+        except OSError:
+            pass
+        cached = cache.get(key)
+        if cached and key in signatures and cached.get('sig') == signatures[key]:
+            metadata = cached['metadata']
+            # The same file may be reached through a different base path
+            metadata['filepath'] = entry.path
+            if not (metadata.get('cover_art') or '').startswith('embedded:'):
+                metadata['cover_art'] = _folder_cover(entry.path)
+            results.append(metadata)
+        else:
+            results.append(None)
+            to_parse.append(entry.path)
+
+    if len(to_parse) < len(results):
+        print(f"Reusing cached metadata for {len(results) - len(to_parse)} unchanged files")
+
+    parsed = iter(_extract_all(to_parse, jobs))
+    results = [r if r is not None else next(parsed) for r in results]
+
+    if cache_path:
+        fresh = {}
+        for metadata in results:
+            key = os.path.abspath(metadata['filepath'])
+            # Read errors may be transient (network share): always retry those
+            if key in signatures and 'error' not in metadata:
+                fresh[key] = {'sig': signatures[key], 'metadata': metadata}
+        _save_scan_cache(cache_path, cache, base_path, fresh)
 
     return results
 
+def _new_album_entry():
+    """Empty album record for build_structured_json"""
+    return {'CoverArt': None, 'Date': None, 'Genre': None, 'Tracks': []}
+
 def build_structured_json(results):
     """Build the structured JSON output format"""
-    output = {}
+    output = defaultdict(lambda: defaultdict(_new_album_entry))
 
     for r in results:
         artist = r.get('artist') or 'Unknown Artist'
         album = r.get('album') or 'Unknown Album'
+        entry = output[artist][album]
 
-        if artist not in output:
-            output[artist] = {}
-
-        if album not in output[artist]:
-            output[artist][album] = {
-                'CoverArt': None,
-                'Date': None,
-                'Genre': None,
-                'Tracks': []
-            }
-
-        # Set cover art if not already set
-        if r.get('cover_art') and not output[artist][album]['CoverArt']:
-            output[artist][album]['CoverArt'] = r['cover_art']
-
-        # Set date if not already set
-        if r.get('date') and not output[artist][album]['Date']:
-            output[artist][album]['Date'] = r['date']
-
-        # Set genre if not already set
-        if r.get('genre') and not output[artist][album]['Genre']:
-            output[artist][album]['Genre'] = r['genre']
+        # Set cover art, date and genre from the first track that has them
+        if r.get('cover_art') and not entry['CoverArt']:
+            entry['CoverArt'] = r['cover_art']
+        if r.get('date') and not entry['Date']:
+            entry['Date'] = r['date']
+        if r.get('genre') and not entry['Genre']:
+            entry['Genre'] = r['genre']
 
         # Parse track number
         track_num = r.get('tracknumber')
@@ -175,7 +361,7 @@ def build_structured_json(results):
             except:
                 track_num = None
 
-        output[artist][album]['Tracks'].append({
+        entry['Tracks'].append({
             'TrackNumber': track_num,
             'Title': r.get('title') or os.path.basename(r['filepath']),
             'FilePath': r['filepath'],
@@ -183,44 +369,48 @@ def build_structured_json(results):
         })
 
     # Sort tracks by track number
-    for artist in output:
-        for album in output[artist]:
-            output[artist][album]['Tracks'].sort(
-                key=lambda x: (x['TrackNumber'] or 999, x['Title'])
-            )
+    for albums in output.values():
+        for entry in albums.values():
+            entry['Tracks'].sort(key=lambda x: (x['TrackNumber'] or 999, x['Title']))
 
-    return output
+    # Plain dicts out: missing-key lookups must not create empty albums
+    return {artist: dict(albums) for artist, albums in output.items()}
 
 def write_csv(results, output_path):
     """Write results to CSV file"""
-    with open(output_path, 'w', newline='', encoding='utf-8') as f:
+    rows = (
+        (
+            r.get('filepath', ''),
+            r.get('artist', ''),
+            r.get('album', ''),
+            r.get('cover_art', ''),
+            r.get('tracknumber', ''),
+            r.get('title', ''),
+            r.get('date', ''),
+            r.get('genre', ''),
+            ';'.join(r.get('missing_fields', [])),
+        )
+        for r in results
+    )
+    # One writerows pass into a 1 MiB buffer: few write calls for big libraries
+    with open(output_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
         writer = csv.writer(f)
         writer.writerow(['FilePath', 'Artist', 'Album', 'CoverArtPath', 'TrackNumber', 'Title', 'Date', 'Genre', 'MissingOrUncertainFields'])
-
-        for r in results:
-            writer.writerow([
-                r.get('filepath', ''),
-                r.get('artist', ''),
-                r.get('album', ''),
-                r.get('cover_art', ''),
-                r.get('tracknumber', ''),
-                r.get('title', ''),
-                r.get('date', ''),
-                r.get('genre', ''),
-                ';'.join(r.get('missing_fields', []))
-            ])
+        writer.writerows(rows)
 
 if __name__ == "__main__":
     base_path = "/path/to/music/U2"
     output_dir = "D:/music cleanup/outputs"
+    # Unchanged files are not re-parsed on the next run
+    cache_path = os.path.join(output_dir, ".scan_cache.json")
 
     if len(sys.argv) > 1:
         # Scan specific album
         album_path = os.path.join(base_path, sys.argv[1])
-        results = scan_directory(album_path)
+        results = scan_directory(album_path, cache_path=cache_path)
     else:
         # Scan all
-        results = scan_directory(base_path)
+        results = scan_directory(base_path, cache_path=cache_path)
 
     # Print summary
     print(f"\n\nTotal files processed: {len(results)}")
@@ -230,8 +420,7 @@ if __name__ == "__main__":
 
     # Write JSON file
     json_path = os.path.join(output_dir, "u2_library_audit.json")
-    with open(json_path, 'w', encoding='utf-8') as f:
-        json.dump(structured, f, indent=2, ensure_ascii=False)
+    write_json(structured, json_path)
     print(f"JSON output written to: {json_path}")
 
     # Write CSV file
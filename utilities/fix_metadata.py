@@ -1,8 +1,12 @@
+import os
 import sys
 from mutagen.easyid3 import EasyID3
 from mutagen.mp3 import MP3
 from mutagen.mp4 import MP4
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utilities.core.audio_file import keep_padding
+
 def fix_mp3_artist(filepath, new_artist):
     """Fix artist tag in MP3 file"""
     audio = MP3(filepath, ID3=EasyID3)
@@ -12,10 +16,9 @@ def fix_mp3_artist(filepath, new_artist):
     print(f"  Title: {audio.get('title', ['N/A'])[0]}")
 
     audio['artist'] = new_artist
-    audio.save()
+    audio.save(padding=keep_padding)
 
-    # Verify
-    audio = MP3(filepath, ID3=EasyID3)
+    # save() wrote exactly this object's tags; no need to parse the file again
     print("\nAFTER:")
     print(f"  Artist: {audio.get('artist', ['N/A'])[0]}")
     print(f"  Album: {audio.get('album', ['N/A'])[0]}")
@@ -29,10 +32,9 @@ def fix_mp3_title(filepath, new_title):
     print(f"  Title: {audio.get('title', ['N/A'])[0]}")
 
     audio['title'] = new_title
-    audio.save()
+    audio.save(padding=keep_padding)
 
-    # Verify
-    audio = MP3(filepath, ID3=EasyID3)
+    # save() wrote exactly this object's tags; no need to parse the file again
     print("\nAFTER:")
     print(f"  Title: {audio.get('title', ['N/A'])[0]}")
     print("\nDone!")
@@ -47,10 +49,9 @@ def fix_mp3_genre(filepath, new_genre):
     print(f"  Title: {audio.get('title', ['N/A'])[0]}")
 
     audio['genre'] = new_genre
-    audio.save()
+    audio.save(padding=keep_padding)
 
-    # Verify
-    audio = MP3(filepath, ID3=EasyID3)
+    # save() wrote exactly this object's tags; no need to parse the file again
     print("\nAFTER:")
     print(f"  Genre: {audio.get('genre', ['N/A'])[0]}")
     print(f"  Artist: {audio.get('artist', ['N/A'])[0]}")
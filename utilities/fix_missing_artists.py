@@ -1,10 +1,18 @@
 #!/usr/bin/env python3
 """Fix tracks with missing artist metadata"""
 
+from concurrent.futures import ThreadPoolExecutor
 from mutagen.mp3 import MP3
 from mutagen.easyid3 import EasyID3
+import os
 import sys
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utilities.core.audio_file import keep_padding
+
+# Fixes applied concurrently (network-share writes are latency bound)
+MAX_WORKERS = 8
+
 # Tracks to fix based on research
 fixes = [
     {
@@ -24,39 +32,54 @@ fixes = [
     }
 ]
 
-def fix_track(filepath, artist, title):
-    """Fix artist metadata for a track"""
+def fix_track(filepath, artist, title, log=None):
+    """Fix artist metadata for a track
+
+    Output lines are appended to ``log`` when given (so fixes running on
+    worker threads can be printed in order afterwards), else printed.
+    """
+    out = log.append if log is not None else print
     try:
-        print(f"\nFixing: {title}")
-        print(f"  File: {filepath}")
+        out(f"\nFixing: {title}")
+        out(f"  File: {filepath}")
 
         # Read current metadata
         audio = MP3(filepath, ID3=EasyID3)
-        print(f"  BEFORE - Artist: {audio.get('artist', ['(none)'])[0]}")
+        out(f"  BEFORE - Artist: {audio.get('artist', ['(none)'])[0]}")
 
         # Update artist
         audio['artist'] = artist
-        audio.save()
+        audio.save(padding=keep_padding)
 
-        # Verify
-        audio = MP3(filepath, ID3=EasyID3)
-        print(f"  AFTER  - Artist: {audio.get('artist', ['(none)'])[0]}")
-        print("  ✓ Fixed successfully")
+        # save() wrote exactly this object's tags; no need to parse the file again
+        out(f"  AFTER  - Artist: {audio.get('artist', ['(none)'])[0]}")
+        out("  ✓ Fixed successfully")
         return True
 
     except Exception as e:
-        print(f"  ✗ ERROR: {e}")
+        out(f"  ✗ ERROR: {e}")
         return False
 
+def _run_fix(fix):
+    """Apply one entry of ``fixes`` on a worker thread; returns (ok, log lines)"""
+    lines = []
+    ok = fix_track(fix['path'], fix['artist'], fix['title'], log=lines)
+    return ok, lines
+
 if __name__ == "__main__":
     print("=== Fixing Tracks With Missing Artist Metadata ===\n")
 
     success_count = 0
     total = len(fixes)
 
-    for fix in fixes:
-        if fix_track(fix['path'], fix['artist'], fix['title']):
-            success_count += 1
+    # The files live on a network share, where round-trips dominate: overlap
+    # them on a few threads, then print each fix's output in list order.
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, total) or 1) as pool:
+        for ok, lines in pool.map(_run_fix, fixes):
+            for line in lines:
+                print(line)
+            if ok:
+                success_count += 1
 
     print(f"\n=== Summary ===")
     print(f"Fixed: {success_count}/{total} tracks")
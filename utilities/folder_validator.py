@@ -7,6 +7,7 @@ Detects:
 - Multi-disc indicators in folder names
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Optional
 from enum import Enum
@@ -14,21 +15,54 @@ from dataclasses import dataclass
 import os
 import re
 import sys
+import unicodedata
+import uuid
 
 sys.stdout.reconfigure(encoding='utf-8')
 
 # Ensure the project root is importable whether run as a script or imported.
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from utilities.core.audio_file import read_easy_id3, read_id3_album
 from utilities.core.naming import make_windows_safe
 
 try:
-    from mutagen.mp3 import MP3
-    from mutagen.easyid3 import EasyID3
+    from mutagen import MutagenError
 except ImportError:
     print("Error: mutagen library required. Install with: pip install mutagen")
     sys.exit(1)
 
+# Folders checked concurrently by scan() (directory reads and tag parses on
+# network shares are latency bound, so threads overlap well)
+SCAN_WORKERS = 8
+
+# Trailing folder-name characters ignored when testing for truncation.
+_TRUNC_SLACK = 3
+
+# Multi-disc indicator in a folder name or album tag ("[Disc 2]", "Disc2", "CD 1").
+# ASCII semantics: the marker is always ASCII, and ASCII-only case folding and
+# \s/\d classes keep the matcher simple.
+_DISC_RE = re.compile(r'(?:Disc|CD)\s*\d+', re.IGNORECASE | re.ASCII)
+
+
+def _has_disc_marker(text: str) -> bool:
+    """True if ``text`` carries a disc indicator; substring pre-check before the regex."""
+    lowered = text.lower()
+    return ('disc' in lowered or 'cd' in lowered) and _DISC_RE.search(text) is not None
+
+
+def _same_dir(a: Path, b: Path) -> bool:
+    """True if ``a`` and ``b`` are the same directory (e.g. differ only in case)."""
+    try:
+        return os.path.samefile(a, b)
+    except OSError:
+        return False
+
+
+def _nfc(text: str) -> str:
+    """Compose accents (NFC) so a macOS-style decomposed 'é' compares as 'é'."""
+    return text if text.isascii() else unicodedata.normalize('NFC', text)
+
 
 class IssueType(Enum):
     TRUNCATED = "truncated"
@@ -53,48 +87,91 @@ class FolderValidator:
 
     def __init__(self):
         self.issues: List[FolderIssue] = []
+        self.folders_scanned = 0
+        # (mp3 path, mtime_ns) -> album tag, so repeat scans skip unchanged files
+        self._album_cache: Dict[tuple, Optional[str]] = {}
 
     def get_album_metadata(self, folder: Path) -> Optional[str]:
-        """Get album name from first MP3 in folder."""
-        mp3s = list(folder.glob("*.mp3"))
-        if not mp3s:
-            return None
+        """Get album name from the first MP3 (by name) in folder.
 
+        Reads only the album frame of the ID3 tag (no MPEG stream or cover
+        art); mutagen is used only for ID3v2 features the fast reader skips.
+        Results are remembered per file and mtime so a second scan does not
+        reopen it.
+        """
         try:
-            audio = MP3(str(mp3s[0]), ID3=EasyID3)
-            album = audio.get('album', [''])[0]
-            return album if album else None
-        except Exception:
+            first = None
+            with os.scandir(folder) as it:
+                # Stream the entries keeping only the lowest-named MP3; the
+                # type check (d_type, no stat) runs only for a new candidate.
+                for e in it:
+                    if (e.name.lower().endswith('.mp3')
+                            and (first is None or e.name < first.name) and e.is_file()):
+                        first = e
+            if first is None:
+                return None
+            key = (first.path, first.stat().st_mtime_ns)
+        except OSError:
             return None
 
+        if key not in self._album_cache:
+            album = read_id3_album(first.path)
+            if album is None:
+                try:
+                    album = read_easy_id3(first.path).get('album', [''])[0]
+                except (MutagenError, OSError):
+                    album = ''
+            self._album_cache[key] = album if album else None
+        return self._album_cache[key]
+
     def categorize_issue(self, folder_name: str, metadata: str) -> IssueType:
         """Determine the type of mismatch."""
+        folder_name, metadata = _nfc(folder_name), _nfc(metadata)
         safe_metadata = make_windows_safe(metadata)
 
-        # Check for truncation
+        # Check for truncation: folder matches the start of the metadata,
+        # ignoring case and its last few characters (a cut often lands mid-word)
         if len(folder_name) < len(safe_metadata):
-            # Folder appears to be truncated version of metadata
-            if safe_metadata.lower().startswith(folder_name.lower()[:len(folder_name)-3]):
+            n = max(0, len(folder_name) - _TRUNC_SLACK)
+            if safe_metadata[:n].lower() == folder_name[:n].lower():
                 return IssueType.TRUNCATED
 
         # Check for character substitution
         # Common patterns: _ vs :, café vs cafe, etc.
-        if '_' in folder_name or 'é' in folder_name or 'à' in folder_name:
+        if '_' in folder_name or (
+                not folder_name.isascii() and ('é' in folder_name or 'à' in folder_name)):
             return IssueType.SUBSTITUTION
 
         # Check for multi-disc indicator
-        disc_patterns = [r'\[Disc\s*\d+\]', r'Disc\s*\d+', r'CD\s*\d+']
-        for pattern in disc_patterns:
-            if re.search(pattern, folder_name, re.IGNORECASE):
-                return IssueType.MULTI_DISC
-            if re.search(pattern, metadata, re.IGNORECASE):
-                return IssueType.MULTI_DISC
+        if _has_disc_marker(folder_name) or _has_disc_marker(metadata):
+            return IssueType.MULTI_DISC
 
         # General mismatch
         return IssueType.MISMATCH
 
-    def scan(self, path: str | Path) -> List[FolderIssue]:
-        """Scan all folders and return list of issues."""
+    def _scan_one(self, folder: Path) -> Optional[FolderIssue]:
+        """Check one folder against its album tag; None if it matches or has no tag."""
+        metadata = self.get_album_metadata(folder)
+        if not metadata:
+            return None
+
+        expected = make_windows_safe(metadata)
+        if folder.name == expected:
+            return None
+
+        return FolderIssue(
+            folder_path=folder,
+            folder_name=folder.name,
+            metadata_album=metadata,
+            expected_name=expected,
+            issue_type=self.categorize_issue(folder.name, metadata)
+        )
+
+    def scan(self, path: str | Path, max_workers: int = SCAN_WORKERS) -> List[FolderIssue]:
+        """Scan all folders and return list of issues (in folder name order).
+
+        Folders are checked on up to ``max_workers`` threads.
+        """
         base_path = Path(path)
         self.issues = []
 
@@ -102,27 +179,22 @@ class FolderValidator:
             print(f"Path not found: {base_path}")
             return []
 
-        folders = sorted([d for d in base_path.iterdir() if d.is_dir()])
+        # One readdir; DirEntry.is_dir() uses the entry's cached type instead
+        # of a stat per entry. Sorted like Path (case-insensitive on Windows).
+        with os.scandir(base_path) as it:
+            folders = [Path(e.path) for e in it if e.is_dir()]
+        folders.sort(key=lambda p: os.path.normcase(p.name))
+        self.folders_scanned = len(folders)
         print(f"Scanning {len(folders)} folders...")
 
-        for folder in folders:
-            metadata = self.get_album_metadata(folder)
-            if not metadata:
-                continue
-
-            expected = make_windows_safe(metadata)
-
-            if folder.name != expected:
-                issue_type = self.categorize_issue(folder.name, metadata)
-                issue = FolderIssue(
-                    folder_path=folder,
-                    folder_name=folder.name,
-                    metadata_album=metadata,
-                    expected_name=expected,
-                    issue_type=issue_type
-                )
-                self.issues.append(issue)
+        workers = min(max_workers, len(folders))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(self._scan_one, folders))
+        else:
+            results = [self._scan_one(folder) for folder in folders]
 
+        self.issues = [issue for issue in results if issue is not None]
         return self.issues
 
     def fix_issue(self, issue: FolderIssue, dry_run: bool = False) -> bool:
@@ -152,12 +224,81 @@ class FolderValidator:
             print(f"  ERROR: {issue.folder_name} - {e}")
             return False
 
-    def fix_all(self, path: str | Path, dry_run: bool = False) -> Dict:
-        """Scan and fix all issues autonomously."""
-        issues = self.scan(path)
+    def rename_all(self, issues: List[FolderIssue], dry_run: bool = False) -> Dict[str, int]:
+        """Rename the folders for ``issues`` in two passes; return fixed/skipped/errors.
+
+        Pass 1 moves every source to a unique temp name in its parent, pass 2
+        moves each temp to its final name. A target that is only occupied by a
+        folder being renamed away (swaps, chains, case-only renames on a
+        case-insensitive filesystem) is therefore not skipped.
+        """
+        counts = {'fixed': 0, 'skipped': 0, 'errors': 0}
+        moving = {issue.folder_path for issue in issues
+                  if issue.issue_type != IssueType.MULTI_DISC}
+        claimed = set()
+        plan = []
+        for issue in issues:
+            if issue.issue_type == IssueType.MULTI_DISC:
+                # Skip multi-disc - handled by DiscConsolidator
+                print(f"  SKIP (multi-disc): {issue.folder_name}")
+                counts['skipped'] += 1
+                continue
+            target = issue.folder_path.parent / issue.expected_name
+            occupied = (target.exists() and target not in moving
+                        and not _same_dir(target, issue.folder_path))
+            if occupied or os.path.normcase(target) in claimed:
+                print(f"  SKIP (target exists): {issue.folder_name}")
+                counts['skipped'] += 1
+                continue
+            claimed.add(os.path.normcase(target))
+            plan.append((issue, target))
+
+        if dry_run:
+            for issue, _ in plan:
+                print(f"  WOULD RENAME: {issue.folder_name}")
+                print(f"            TO: {issue.expected_name}")
+            counts['fixed'] = len(plan)
+            return counts
+
+        # Pass 1: move every source aside
+        staged = []
+        for issue, target in plan:
+            temp = issue.folder_path.with_name(f".__rename_{uuid.uuid4().hex}")
+            try:
+                issue.folder_path.rename(temp)
+            except OSError as e:
+                print(f"  ERROR: {issue.folder_name} - {e}")
+                counts['errors'] += 1
+                continue
+            staged.append((issue, temp, target))
+
+        # Pass 2: move each into place (or back, if the target appeared meanwhile)
+        for issue, temp, target in staged:
+            try:
+                if target.exists():
+                    raise FileExistsError(f"target exists: {target.name}")
+                temp.rename(target)
+            except OSError as e:
+                print(f"  ERROR: {issue.folder_name} - {e}")
+                counts['errors'] += 1
+                try:
+                    temp.rename(issue.folder_path)
+                except OSError:
+                    print(f"  ERROR: left at temporary name {temp.name}")
+                continue
+            print(f"  RENAMED: {issue.folder_name}")
+            print(f"       TO: {issue.expected_name}")
+            counts['fixed'] += 1
+
+        return counts
+
+    def fix_all(self, path: str | Path, dry_run: bool = False,
+                max_workers: int = SCAN_WORKERS) -> Dict:
+        """Scan (on up to ``max_workers`` threads) and fix all issues autonomously."""
+        issues = self.scan(path, max_workers=max_workers)
 
         results = {
-            'scanned': len(list(Path(path).iterdir())),
+            'scanned': self.folders_scanned,
             'issues': len(issues),
             'fixed': 0,
             'skipped': 0,
@@ -178,15 +319,13 @@ class FolderValidator:
                 by_type[t] = []
             by_type[t].append(issue)
 
-        # Process each type
         for issue_type, type_issues in by_type.items():
-            print(f"\n--- {issue_type.upper()} ({len(type_issues)}) ---")
-            for issue in type_issues:
-                if self.fix_issue(issue, dry_run):
-                    results['fixed'] += 1
-                else:
-                    results['skipped'] += 1
+            print(f"--- {issue_type.upper()} ({len(type_issues)}) ---")
+        print()
 
+        # Rename everything as one batch, in type order
+        ordered = [issue for type_issues in by_type.values() for issue in type_issues]
+        results.update(self.rename_all(ordered, dry_run))
         return results
 
 
@@ -198,13 +337,16 @@ def main():
     parser.add_argument('path', help='Path to scan')
     parser.add_argument('--dry-run', action='store_true', help='Preview without changes')
     parser.add_argument('--scan-only', action='store_true', help='Only scan, do not fix')
+    parser.add_argument('--jobs', type=int, default=SCAN_WORKERS,
+                        help=f'Folders to read concurrently (default {SCAN_WORKERS}; '
+                             'raise for high-latency network shares)')
 
     args = parser.parse_args()
 
     validator = FolderValidator()
 
     if args.scan_only:
-        issues = validator.scan(args.path)
+        issues = validator.scan(args.path, max_workers=args.jobs)
         print(f"\n=== SCAN RESULTS ===")
         for issue in issues:
             print(f"\n[{issue.issue_type.value}]")
@@ -212,7 +354,7 @@ def main():
             print(f"  Metadata: {issue.metadata_album}")
             print(f"  Expected: {issue.expected_name}")
     else:
-        results = validator.fix_all(args.path, dry_run=args.dry_run)
+        results = validator.fix_all(args.path, dry_run=args.dry_run, max_workers=args.jobs)
         print(f"\n=== SUMMARY ===")
         print(f"Scanned: {results['scanned']}")
         print(f"Issues:  {results['issues']}")
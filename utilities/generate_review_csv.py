@@ -1,23 +1,28 @@
 #!/usr/bin/env python3
 """Generate CSV file for review queue with approve/reject columns."""
 
-import json
 import csv
 import sys
 from pathlib import Path
 
+# Allow `python utilities/generate_review_csv.py` to import utilities.core.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utilities.core.json_output import iter_json_items  # noqa: E402
+
 sys.stdout.reconfigure(encoding='utf-8', errors='replace')
 
+# Write buffer for the CSV, so thousands of rows leave in a few large writes.
+CSV_BUFFER = 1 << 20
+
 def main():
     # Load queue (format: {album_id: {path, status, metadata, ...}})
     queue_path = Path('D:/music cleanup/state/queue.json')
-    with open(queue_path, 'r', encoding='utf-8') as f:
-        queue = json.load(f)
 
-    # Filter to needs_review items
+    # Filter to needs_review items while streaming, so only those are kept
     review_items = [
         {'id': album_id, **data}
-        for album_id, data in queue.items()
+        for album_id, data in iter_json_items(queue_path)
         if data.get('status') == 'needs_review'
     ]
 
@@ -27,7 +32,7 @@ def main():
     csv_path = Path('D:/music cleanup/outputs/review_queue.csv')
     csv_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+    with open(csv_path, 'w', newline='', encoding='utf-8', buffering=CSV_BUFFER) as f:
         writer = csv.writer(f)
 
         # Header
@@ -48,6 +53,7 @@ def main():
         # Data rows - sorted by confidence descending
         sorted_items = sorted(review_items, key=lambda x: x.get('metadata', {}).get('confidence', 0), reverse=True)
 
+        rows = []
         for item in sorted_items:
             album_id = item.get('id', '')[:12]  # Short ID
             path = item.get('path', '')
@@ -74,7 +80,7 @@ def main():
             else:
                 conf_str = str(confidence)
 
-            writer.writerow([
+            rows.append([
                 album_id,
                 local_folder,
                 match_title,
@@ -88,6 +94,8 @@ def main():
                 ''   # NOTES column - user fills
             ])
 
+        writer.writerows(rows)
+
     print(f'Created: {csv_path}')
     print(f'Total rows: {len(review_items)}')
     print()
@@ -1,13 +1,24 @@
 #!/usr/bin/env python3
 """Process review decisions from CSV file and update queue."""
 
-import json
 import csv
 import sys
+from collections import defaultdict
 from pathlib import Path
 
+# Allow `python utilities/process_review_csv.py` to import utilities.core.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utilities.core.json_output import read_json, write_json  # noqa: E402
+
 sys.stdout.reconfigure(encoding='utf-8', errors='replace')
 
+# Length of the short album id written by generate_review_csv.
+ID_PREFIX = 12
+
+# Columns read from the review CSV (in the unpacking order used by main).
+CSV_COLUMNS = ('album_id', 'local_folder', 'APPROVE', 'REJECT')
+
 def main():
     csv_path = Path('D:/music cleanup/outputs/review_queue.csv')
     queue_path = Path('D:/music cleanup/state/queue.json')
@@ -18,27 +29,44 @@ def main():
         sys.exit(1)
 
     # Load queue
-    with open(queue_path, 'r', encoding='utf-8') as f:
-        queue = json.load(f)
+    queue = read_json(queue_path)
+
+    # CSV album_ids are the first ID_PREFIX characters of the queue ids
+    # (see generate_review_csv), so index the queue by that prefix once.
+    prefix_index = defaultdict(list)
+    for qid in queue:
+        prefix_index[qid[:ID_PREFIX]].append(qid)
 
     # Read CSV decisions
     approved = []
     rejected = []
     unchanged = []
 
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
+    with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        missing = [name for name in CSV_COLUMNS if name not in header]
+        if missing:
+            print(f"Error: CSV is missing column(s): {', '.join(missing)}")
+            sys.exit(1)
+        # Plain lists with precomputed column positions: no dict per row
+        id_col, folder_col, approve_col, reject_col = (header.index(name) for name in CSV_COLUMNS)
+        width = len(header)
+
         for row in reader:
-            album_id = row.get('album_id', '').strip()
-            approve = row.get('APPROVE', '').strip().upper()
-            reject = row.get('REJECT', '').strip().upper()
+            if len(row) < width:  # trailing empty cells dropped by an editor
+                row += [''] * (width - len(row))
+            album_id = row[id_col].strip()
+            approve = row[approve_col].strip().upper()
+            reject = row[reject_col].strip().upper()
+            folder = row[folder_col] or album_id
 
             # Find matching album in queue (album_id is truncated, need to match prefix)
-            full_id = None
-            for qid in queue.keys():
-                if qid.startswith(album_id):
-                    full_id = qid
-                    break
+            matches = [qid for qid in prefix_index.get(album_id[:ID_PREFIX], ())
+                       if qid.startswith(album_id)]
+            full_id = matches[0] if matches else None
+            if len(matches) > 1:
+                print(f"Warning: Album id {album_id} is ambiguous, using {full_id}")
 
             if not full_id:
                 print(f"Warning: Album not found in queue: {album_id}")
@@ -46,16 +74,15 @@ def main():
 
             if approve in ('X', 'Y', 'YES', '1', 'TRUE'):
                 queue[full_id]['status'] = 'approved'
-                approved.append(row.get('local_folder', album_id))
+                approved.append(folder)
             elif reject in ('X', 'Y', 'YES', '1', 'TRUE'):
                 queue[full_id]['status'] = 'rejected'
-                rejected.append(row.get('local_folder', album_id))
+                rejected.append(folder)
             else:
-                unchanged.append(row.get('local_folder', album_id))
+                unchanged.append(folder)
 
     # Save updated queue
-    with open(queue_path, 'w', encoding='utf-8') as f:
-        json.dump(queue, f, indent=2, ensure_ascii=False)
+    write_json(queue, queue_path)
 
     # Summary
     print("=" * 60)
@@ -7,18 +7,43 @@ and cleaning up empty source folders.
 
 from pathlib import Path
 from typing import Optional
+import errno
+import os
+import re
 import shutil
 import sys
 
 sys.stdout.reconfigure(encoding='utf-8')
 
 try:
-    from mutagen.mp3 import MP3
     from mutagen.easyid3 import EasyID3
+    from mutagen.id3 import ID3NoHeaderError
 except ImportError:
     print("Error: mutagen library required. Install with: pip install mutagen")
     sys.exit(1)
 
+# Leading track number in a filename stem ("05 Title", "05. Title", "05-Title"),
+# including a disc-track prefix ("1-05 Title").
+_LEADING_TRACK_NUM_RE = re.compile(r'^(?:\d+-)?\d+[\s.\-_]+')
+
+
+def _read_tags(path: str) -> EasyID3:
+    """Parse the ID3 tag of ``path`` (tag only); a file without one gets an empty tag."""
+    try:
+        return EasyID3(path)
+    except ID3NoHeaderError:
+        return EasyID3()
+
+
+def _move_file(source: str, dest: str) -> None:
+    """Rename ``source`` over ``dest``; copy + delete only across devices."""
+    try:
+        os.replace(source, dest)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(source, dest)
+
 
 class TrackMover:
     """Move tracks between albums with metadata updates."""
@@ -32,7 +57,8 @@ class TrackMover:
         artist: Optional[str] = None,
         album_artist: Optional[str] = None,
         date: Optional[str] = None,
-        genre: Optional[str] = None
+        genre: Optional[str] = None,
+        title_from_filename: bool = False
     ) -> bool:
         """
         Move a track to a different album folder.
@@ -46,20 +72,40 @@ class TrackMover:
             album_artist: Album artist (defaults to artist if not specified)
             date: Release date/year
             genre: Genre
+            title_from_filename: When renaming, take the title from the
+                current filename instead of the tags (tags are still read
+                if the filename carries no usable title)
 
         Returns:
             True if successful, False otherwise
         """
         source_path = Path(source)
+        source_str = os.fspath(source_path)  # converted once, reused below
         dest_path = Path(dest_folder)
 
-        if not source_path.exists():
-            print(f"Source not found: {source_path}")
-            return False
-
-        if not dest_path.exists():
-            print(f"Creating destination folder: {dest_path}")
-            dest_path.mkdir(parents=True)
+        # Metadata to write once the file is in place
+        updates = {key: value for key, value in (
+            ('album', album),
+            ('artist', artist),
+            ('albumartist', album_artist or artist),
+            ('tracknumber', track_number),
+            ('date', date),
+            ('genre', genre),
+        ) if value}
+
+        # Title comes from metadata; the filename is only trusted on request
+        # and when it carries a usable title
+        title = _LEADING_TRACK_NUM_RE.sub('', source_path.stem).strip()
+        need_title = bool(track_number) and (not title_from_filename or len(title) < 3)
+
+        # Parse the tag at most once, before the move: the same object
+        # supplies the title and is saved to the destination file afterwards.
+        audio, tag_error = None, None
+        if need_title or updates:
+            try:
+                audio = _read_tags(source_str)
+            except Exception as e:
+                tag_error = e
 
         # Determine destination filename
         dest_file = dest_path / source_path.name
@@ -68,62 +114,53 @@ class TrackMover:
         if track_number:
             # Extract just the track number for filename
             track_num = track_number.split('/')[0].zfill(2)
-            # Get title from current filename or metadata
-            try:
-                audio = MP3(str(source_path), ID3=EasyID3)
-                title = audio.get('title', ['Unknown'])[0]
-            except:
-                title = source_path.stem
+            if need_title:
+                title = audio.get('title', ['Unknown'])[0] if audio is not None else source_path.stem
 
             new_filename = f"{track_num} {title}.mp3"
             dest_file = dest_path / new_filename
+        dest_str = os.fspath(dest_file)
 
         print(f"Moving track:")
         print(f"  From: {source_path}")
         print(f"  To:   {dest_file}")
 
-        # Move the file
-        shutil.move(str(source_path), str(dest_file))
-
-        # Update metadata
-        updates = {}
-        if album:
-            updates['album'] = album
-        if artist:
-            updates['artist'] = artist
-        if album_artist:
-            updates['albumartist'] = album_artist
-        elif artist:
-            updates['albumartist'] = artist
-        if track_number:
-            updates['tracknumber'] = track_number
-        if date:
-            updates['date'] = date
-        if genre:
-            updates['genre'] = genre
+        # Move the file: a plain rename within one filesystem (the usual
+        # library layout). Existence is only checked if the move fails.
+        try:
+            _move_file(source_str, dest_str)
+        except FileNotFoundError:
+            if not source_path.exists():
+                print(f"Source not found: {source_path}")
+                return False
+            # Destination album folder does not exist yet
+            dest_path.mkdir(parents=True, exist_ok=True)
+            print(f"Created destination folder: {dest_path}")
+            _move_file(source_str, dest_str)
 
         if updates:
             try:
-                audio = MP3(str(dest_file), ID3=EasyID3)
-                for key, value in updates.items():
-                    audio[key] = value
-                audio.save()
+                if audio is None:
+                    raise tag_error
+                audio.update(updates)
+                audio.save(dest_str)
                 print(f"  Updated metadata: {list(updates.keys())}")
             except Exception as e:
                 print(f"  Warning: Could not update metadata: {e}")
 
         # Clean up empty source folder
+        # (one directory read serves both the MP3 and the leftover checks)
         source_folder = source_path.parent
-        remaining_mp3s = list(source_folder.glob("*.mp3"))
-        if not remaining_mp3s:
+        with os.scandir(source_folder) as it:
+            remaining = [entry.name for entry in it]
+        if not any(name.lower().endswith('.mp3') for name in remaining):
             # Check for other files (cover art, etc.)
-            remaining = list(source_folder.glob("*"))
             if not remaining:
                 source_folder.rmdir()
                 print(f"  Removed empty folder: {source_folder.name}")
-            elif len(remaining) == 1 and remaining[0].name == "folder.jpg":
+            elif remaining == ["folder.jpg"]:
                 # Only folder.jpg left, remove it and the folder
-                remaining[0].unlink()
+                (source_folder / "folder.jpg").unlink()
                 source_folder.rmdir()
                 print(f"  Removed empty folder: {source_folder.name}")
 
@@ -144,6 +181,8 @@ def main():
     parser.add_argument('--album-artist', help='Album artist (if different from artist)')
     parser.add_argument('--date', help='Release date/year')
     parser.add_argument('--genre', help='Genre')
+    parser.add_argument('--title-from-filename', action='store_true',
+                        help='Take the renamed title from the filename instead of tags')
 
     args = parser.parse_args()
 
@@ -156,7 +195,8 @@ def main():
         artist=args.artist,
         album_artist=args.album_artist,
         date=args.date,
-        genre=args.genre
+        genre=args.genre,
+        title_from_filename=args.title_from_filename
     )
 
     sys.exit(0 if success else 1)
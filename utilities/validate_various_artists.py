@@ -12,29 +12,171 @@ Usage:
 
     # Validate specific album
     python validate_various_artists.py "/path/to/music/Various Artists" --album "Album Name"
+
+Albums are validated on --jobs worker threads (default 4): while one album
+waits for its MusicBrainz turn, others read their local files. All threads
+share one token bucket, so MusicBrainz sees one request per
+MUSICBRAINZ_RATE_LIMIT seconds on average (after a short initial burst of
+MUSICBRAINZ_BURST), and output is printed per album, in order. Disc folders
+of one album ("Album [Disc 1]", "Album [Disc 2]") are validated together:
+one search finds the release, then each folder is checked against its disc.
+With --read-procs N, local tags are parsed in N worker processes instead,
+overlapping with the lookups.
+
+Albums whose own tags are already consistent (one album tag, track numbers
+1..N, cover art present) are accepted without a MusicBrainz lookup; pass
+--force-online to look those up too. Since every album is then looked up,
+each album's search starts on a background MusicBrainz thread before its
+files are read.
+
+With --cache-dir DIR, each MusicBrainz lookup (release, track listing and
+whether the Cover Art Archive has art) is kept in DIR for 30 days, so a
+repeat validation only reads the local files.
 """
 
 import os
 import sys
 import json
+import multiprocessing
 import re
-import urllib.request
-import urllib.parse
+import threading
 import time
+import urllib.parse
+import uuid
 from collections import defaultdict
-from mutagen.mp3 import MP3
+from contextlib import nullcontext
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+
+import requests
 from mutagen.mp4 import MP4
 from mutagen.flac import FLAC
-from mutagen.id3 import ID3
-from mutagen.easyid3 import EasyID3
+from mutagen.id3 import ID3, ID3NoHeaderError
+
+# Allow running as a script (python utilities/validate_various_artists.py ...).
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utilities.core.album_log import warn
+from utilities.core.cover_art import new_http_session
+from utilities.core.json_output import loads_json, read_json, write_json
+from utilities.core.rate_limit import TokenBucket
 
 # MusicBrainz API rate limiting
-MUSICBRAINZ_RATE_LIMIT = 1.5  # seconds between requests
+MUSICBRAINZ_RATE_LIMIT = 1.5  # average seconds between requests
+MUSICBRAINZ_BURST = 2  # requests allowed back to back after an idle spell
+
+# Albums validated concurrently by validate_all_albums (network bound; the
+# MusicBrainz requests themselves stay paced by the shared bucket)
+VALIDATE_WORKERS = 4
+
+_MUSICBRAINZ_BUCKET = TokenBucket(rate=1 / MUSICBRAINZ_RATE_LIMIT, capacity=MUSICBRAINZ_BURST)
+
+# Audio files read from an album folder, and how many are read at once.
+# The thread pool is what keeps several reads in flight; batching them through
+# io_uring instead would not help, since mutagen opens and seeks each file
+# itself (tags and cover frames are not confined to a fixed-size header).
+_AUDIO_EXTS = ('.mp3', '.m4a', '.flac')
+READ_WORKERS = 8
+
+# Cover image files that count as local album art (matched case-insensitively)
+_COVER_FILES = ('folder.jpg', 'cover.jpg', 'album.jpg', 'front.jpg')
+
+# Disc / volume suffixes dropped from album names before searching and comparing
+_DISC_RE = re.compile(r'\s*\[?disc\s+\d+\]?$', re.IGNORECASE)
+_DISK_RE = re.compile(r'\s*disk\s+\d+$', re.IGNORECASE)
+_VOL_RE = re.compile(r',\s*vol\.\s*\d+$', re.IGNORECASE)
+# Disc suffix with its number, for grouping and matching a release's discs
+_DISC_NUMBER_RE = re.compile(r'\s*\[?dis[ck]\s+(\d+)\]?$', re.IGNORECASE)
+
+# Single background thread for lookups started ahead of time (prefetch_search)
+_MUSICBRAINZ_THREAD = ThreadPoolExecutor(max_workers=1, thread_name_prefix='musicbrainz')
+
+# Online answers of this run (searches, release-group browses, cover checks)
+# as Futures keyed by (kind, ...), so concurrent albums share one request.
+_REQUESTS = {}
+_REQUESTS_LOCK = threading.Lock()
+
+# Distinct (search name, artist, track count) lookups remembered per run.
+LOOKUP_MEMO_SIZE = 4096
+
+# MusicBrainz lookups kept in --cache-dir between runs, and for how long.
+LOOKUP_CACHE = "mb_album_lookups.json"
+LOOKUP_TTL = 30 * 24 * 3600
+
+# One keep-alive session for every MusicBrainz and Cover Art Archive request,
+# so each album reuses the open connections instead of a fresh TLS handshake.
+_SESSION = new_http_session()
+_SESSION.headers.update({
+    "User-Agent": "MusicCleanup/1.0",  # MusicBrainz requires an identifying agent
+    "Accept": "application/json",
+})
+
+class LookupCache:
+    """``search_musicbrainz`` results persisted as JSON in a cache dir.
+
+    Keyed by the normalized search name, artist and local track and disc
+    counts (which pick the release); entries are
+    ``{"result": dict_or_null, "at": unix_time}`` and expire after
+    :data:`LOOKUP_TTL`. A ``null`` result records "not found"; failed lookups
+    are never stored. Safe to share between validation threads.
+    """
 
-def get_local_album_metadata(album_path):
+    def __init__(self, cache_dir):
+        self.path = os.path.join(os.path.expanduser(cache_dir), LOOKUP_CACHE)
+        try:
+            self._entries = read_json(self.path)
+        except (OSError, ValueError):
+            self._entries = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+
+    @staticmethod
+    def _key(search_name, artist, track_count, discs=1):
+        key = f"{artist}\t{search_name}\t{track_count}"
+        return key if discs == 1 else f"{key}\t{discs}"
+
+    def get(self, search_name, artist, track_count=None, discs=1):
+        """Return ``(hit, result)``; ``result`` is ``None`` for a cached "not found"."""
+        with self._lock:
+            entry = self._entries.get(self._key(search_name, artist, track_count, discs))
+        if not isinstance(entry, dict) or time.time() - entry.get('at', 0) > LOOKUP_TTL:
+            return False, None
+        return True, entry.get('result')
+
+    def has_search(self, search_name, artist):
+        """True if any fresh entry answers this search (for some track count)."""
+        prefix = f"{artist}\t{search_name}\t"
+        now = time.time()
+        with self._lock:
+            return any(key.startswith(prefix) and isinstance(entry, dict)
+                       and now - entry.get('at', 0) <= LOOKUP_TTL
+                       for key, entry in self._entries.items())
+
+    def put(self, search_name, artist, track_count, result, discs=1):
+        with self._lock:
+            self._entries[self._key(search_name, artist, track_count, discs)] = {'result': result, 'at': int(time.time())}
+            self._dirty = True
+
+    def save(self):
+        """Write the cache atomically (temp file + ``os.replace``) if it changed."""
+        with self._lock:
+            if not self._dirty:
+                return
+            temp = os.path.join(os.path.dirname(self.path),
+                                f".{LOOKUP_CACHE}.{uuid.uuid4().hex}.tmp")
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                write_json(self._entries, temp)
+                os.replace(temp, self.path)
+                self._dirty = False
+            except OSError as e:
+                print(f"Warning: could not save {self.path}: {e}")
+
+def get_local_album_metadata(album_path, log=None):
     """
     Extract metadata from local album folder.
 
+    Read warnings go to ``log`` (a list of output lines) when given, else stdout.
+
     Returns:
         dict: {
             'folder_name': str,
@@ -55,172 +197,368 @@ def get_local_album_metadata(album_path):
     if not os.path.exists(album_path):
         return result
 
-    # Check for cover art files
-    cover_files = ['folder.jpg', 'cover.jpg', 'album.jpg', 'front.jpg']
-    for cover in cover_files:
-        if os.path.exists(os.path.join(album_path, cover)):
-            result['has_cover'] = True
-            break
-
-    # Get all audio files
     try:
-        files = os.listdir(album_path)
-        audio_files = [f for f in files if f.lower().endswith(('.mp3', '.m4a', '.flac'))]
-        audio_files.sort()
+        # One directory read finds both the cover files and the audio files
+        with os.scandir(album_path) as it:
+            entries = list(it)
+        names = {entry.name.lower() for entry in entries}
+        result['has_cover'] = any(cover in names for cover in _COVER_FILES)
+
+        audio_entries = sorted((e for e in entries if e.name.lower().endswith(_AUDIO_EXTS)),
+                               key=lambda e: e.name)
+        audio_files = [e.name for e in audio_entries]
+        paths = [e.path for e in audio_entries]
 
         result['track_count'] = len(audio_files)
 
-        for filename in audio_files:
-            filepath = os.path.join(album_path, filename)
-            track_info = {
-                'filename': filename,
-                'title': None,
-                'artist': None,
-                'track_num': None,
-                'album': None,
-                'has_embedded_cover': False
-            }
+        # Tags are read on a small thread pool (file reads overlap on slow
+        # storage); map() keeps the results, and so the warnings, in order.
+        workers = min(READ_WORKERS, len(paths))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                tracks = list(pool.map(_read_track, paths, audio_files))
+        else:
+            tracks = [_read_track(p, f) for p, f in zip(paths, audio_files)]
 
-            try:
-                if filepath.lower().endswith('.mp3'):
-                    audio = MP3(filepath, ID3=EasyID3)
-                    track_info['title'] = audio.get('title', [None])[0]
-                    track_info['artist'] = audio.get('artist', [None])[0]
-                    track_info['album'] = audio.get('album', [None])[0]
-                    track_num = audio.get('tracknumber', [None])[0]
-                    if track_num:
-                        # Handle "1/12" format
-                        track_info['track_num'] = int(track_num.split('/')[0])
-
-                    # Check for embedded cover
-                    audio_full = MP3(filepath, ID3=ID3)
-                    if audio_full.tags and any(key.startswith('APIC') for key in audio_full.tags.keys()):
-                        track_info['has_embedded_cover'] = True
-
-                elif filepath.lower().endswith('.m4a'):
-                    audio = MP4(filepath)
-                    track_info['title'] = audio.get('\xa9nam', [None])[0]
-                    track_info['artist'] = audio.get('\xa9ART', [None])[0]
-                    track_info['album'] = audio.get('\xa9alb', [None])[0]
-                    track_num = audio.get('trkn', [None])[0]
-                    if track_num:
-                        track_info['track_num'] = track_num[0]
-
-                    # Check for embedded cover
-                    if 'covr' in audio.tags:
-                        track_info['has_embedded_cover'] = True
-
-                elif filepath.lower().endswith('.flac'):
-                    audio = FLAC(filepath)
-                    track_info['title'] = audio.get('title', [None])[0]
-                    track_info['artist'] = audio.get('artist', [None])[0]
-                    track_info['album'] = audio.get('album', [None])[0]
-                    track_num = audio.get('tracknumber', [None])[0]
-                    if track_num:
-                        track_info['track_num'] = int(track_num.split('/')[0])
-
-                    # Check for embedded cover
-                    if audio.pictures:
-                        track_info['has_embedded_cover'] = True
-
-                # Use first track's album field as album title
-                if result['album_title'] is None and track_info['album']:
-                    result['album_title'] = track_info['album']
-
-            except Exception as e:
-                print(f"  Warning: Error reading {filename}: {e}")
+        for track_info, error in tracks:
+            if error is not None:
+                warn(log, f"  Warning: Error reading {track_info['filename']}: {error}")
+            # Use first track's album field as album title
+            elif result['album_title'] is None and track_info['album']:
+                result['album_title'] = track_info['album']
 
             result['tracks'].append(track_info)
 
     except Exception as e:
-        print(f"  Error reading album directory: {e}")
+        warn(log, f"  Error reading album directory: {e}")
 
     return result
 
-def search_musicbrainz(album_name, artist="Various Artists"):
+def _open_mp3(filepath):
+    # One tag parse serves the text fields and the cover check
+    try:
+        tags = ID3(filepath)
+    except ID3NoHeaderError:
+        tags = {}  # untagged file: nothing to read
+    return tags, any(key.startswith('APIC') for key in tags)
+
+def _open_m4a(filepath):
+    tags = MP4(filepath).tags or {}
+    return tags, 'covr' in tags
+
+def _open_flac(filepath):
+    audio = FLAC(filepath)
+    return audio.tags or {}, bool(audio.pictures)
+
+# Per audio extension (the keys are exactly _AUDIO_EXTS): a function returning
+# ``(tags, has_embedded_cover)`` and the tag keys for title, artist, album and
+# track number in that format.
+_FORMATS = {
+    '.mp3': (_open_mp3, ('TIT2', 'TPE1', 'TALB', 'TRCK')),
+    '.m4a': (_open_m4a, ('\xa9nam', '\xa9ART', '\xa9alb', 'trkn')),
+    '.flac': (_open_flac, ('title', 'artist', 'album', 'tracknumber')),
+}
+
+def _first(tags, key):
+    """First value stored under ``key``, or None (ID3 frames keep theirs in ``.text``)."""
+    values = tags.get(key)
+    values = getattr(values, 'text', values)
+    return values[0] if values else None
+
+def _read_track(filepath, filename):
+    """Read one audio file's tags for :func:`get_local_album_metadata`.
+
+    Returns ``(track_info, error)``; ``error`` is the exception that stopped
+    the read (``track_info`` then holds whatever was read before it) or None.
+    """
+    track_info = {
+        'filename': filename,
+        'title': None,
+        'artist': None,
+        'track_num': None,
+        'album': None,
+        'has_embedded_cover': False
+    }
+
+    fmt = _FORMATS.get(os.path.splitext(filename)[1].lower())
+    if fmt is None:
+        return track_info, None
+    open_tags, (title, artist, album, number) = fmt
+
+    try:
+        tags, track_info['has_embedded_cover'] = open_tags(filepath)
+        track_info['title'] = _first(tags, title)
+        track_info['artist'] = _first(tags, artist)
+        track_info['album'] = _first(tags, album)
+        track_num = _first(tags, number)
+        if isinstance(track_num, tuple):  # MP4 stores (number, total)
+            track_info['track_num'] = track_num[0]
+        elif track_num:
+            # Handle "1/12" format
+            track_info['track_num'] = int(track_num.split('/')[0])
+    except Exception as e:
+        return track_info, e
+
+    return track_info, None
+
+def _normalize_album_name(album_name):
+    """Album name as searched on MusicBrainz: disc and volume suffixes removed."""
+    # Remove disc notation for search
+    search_name = _DISC_RE.sub('', album_name)
+    search_name = _DISK_RE.sub('', search_name)
+    # Remove volume notation
+    return _VOL_RE.sub('', search_name)
+
+def search_musicbrainz(album_name, artist="Various Artists", log=None, cache=None,
+                       track_count=None, discs=1):
     """
     Search MusicBrainz for album.
 
+    ``track_count`` (the local track count) picks among the releases of the
+    matching release group; without it the group's first release is used.
+    ``discs`` (local disc folders) breaks ties toward releases with as many
+    media.
+
+    Errors go to ``log`` (a list of output lines) when given, else stdout.
+    With a :class:`LookupCache`, a fresh cached answer is returned without
+    touching the network, and new answers are added to it.
+
     Returns:
         dict: {
             'release_id': str,
             'title': str,
             'artist': str,
             'track_count': int,
+            'disc_track_counts': [int, ...] (one per medium),
             'tracks': [{'title': str, 'artist': str, 'position': int}, ...],
-            'has_cover_art': bool
+            'has_cover_art': bool, or None when the Cover Art Archive
+                could not be checked (such answers are not cached)
         } or None if not found
     """
-    # Clean up album name for search
-    search_name = album_name
-    # Remove disc notation for search
-    search_name = re.sub(r'\s*\[?Disc\s+\d+\]?$', '', search_name, flags=re.IGNORECASE)
-    search_name = re.sub(r'\s*Disk\s+\d+$', '', search_name, flags=re.IGNORECASE)
-    # Remove volume notation
-    search_name = re.sub(r',\s*Vol\.\s*\d+$', '', search_name, flags=re.IGNORECASE)
+    search_name = _normalize_album_name(album_name)
 
-    query = urllib.parse.quote(f'{search_name} AND artist:"{artist}"')
-    url = f"https://musicbrainz.org/ws/2/release/?query={query}&fmt=json&limit=5"
+    if cache is not None:
+        hit, result = cache.get(search_name, artist, track_count, discs)
+        if hit:
+            return result
 
     try:
-        time.sleep(MUSICBRAINZ_RATE_LIMIT)
-        with urllib.request.urlopen(url, timeout=10) as response:
-            data = json.loads(response.read())
-
-            if not data.get('releases') or len(data['releases']) == 0:
-                return None
-
-            # Get the first (best match) release
-            release = data['releases'][0]
-            release_id = release['id']
-
-            # Get detailed release info including tracks
-            detail_url = f"https://musicbrainz.org/ws/2/release/{release_id}?inc=recordings+artist-credits&fmt=json"
-            time.sleep(MUSICBRAINZ_RATE_LIMIT)
-
-            with urllib.request.urlopen(detail_url, timeout=10) as detail_response:
-                detail_data = json.loads(detail_response.read())
-
-                result = {
-                    'release_id': release_id,
-                    'title': detail_data.get('title', ''),
-                    'artist': release.get('artist-credit', [{}])[0].get('name', 'Various Artists'),
-                    'track_count': detail_data.get('track-count', 0),
-                    'tracks': [],
-                    'has_cover_art': False  # Will check separately
-                }
-
-                # Extract track listing
-                if 'media' in detail_data:
-                    position = 1
-                    for medium in detail_data['media']:
-                        for track in medium.get('tracks', []):
-                            track_info = {
-                                'title': track.get('title', ''),
-                                'artist': '',
-                                'position': position
-                            }
-
-                            # Get track artist if different from album artist
-                            if 'artist-credit' in track:
-                                track_info['artist'] = track['artist-credit'][0].get('name', '')
-
-                            result['tracks'].append(track_info)
-                            position += 1
-
-                # Check for cover art
-                try:
-                    cover_url = f"https://coverartarchive.org/release/{release_id}"
-                    with urllib.request.urlopen(cover_url, timeout=5) as cover_response:
-                        result['has_cover_art'] = True
-                except:
-                    result['has_cover_art'] = False
-
-                return result
-
+        result = _lookup_release(search_name, artist, track_count, discs)
     except Exception as e:
-        print(f"  MusicBrainz search error: {e}")
+        warn(log, f"  MusicBrainz search error: {e}")
+        return None
+
+    if result is not None:
+        release_id = result['release_id']
+        try:
+            has_cover = _coalesce(('cover', release_id), lambda: _has_cover_art(release_id))
+        except requests.RequestException as e:
+            warn(log, f"  Cover Art Archive check error: {e}")
+            return {**result, 'has_cover_art': None}  # re-probed next time
+        result = {**result, 'has_cover_art': has_cover}
+
+    if cache is not None:
+        cache.put(search_name, artist, track_count, result, discs)
+    return result
+
+@lru_cache(maxsize=LOOKUP_MEMO_SIZE)
+def _lookup_release(search_name, artist, track_count=None, discs=1):
+    """MusicBrainz half of :func:`search_musicbrainz`; raises on request errors.
+
+    Memoized for the run: albums that normalize to the same search (disc
+    folders, volumes of a series) with the same track count reuse the answer,
+    including "not found". Errors are not memoized. Callers must not modify
+    the returned dict.
+
+    Takes the releases of the best matching release group
+    (:func:`_find_releases`), then picks the one whose track count is closest
+    to ``track_count`` (the first release when it is None), preferring
+    releases with ``discs`` media among equals. The result has no
+    ``has_cover_art`` yet; :func:`search_musicbrainz` adds it.
+    """
+    releases = _find_releases(search_name, artist)
+    if not releases:
+        return None
+
+    if track_count is None:
+        release = releases[0]
+    else:
+        # min() keeps MusicBrainz's order among equally close releases
+        release = min(releases, key=lambda r: (abs(_release_track_count(r) - track_count),
+                                               len(r.get('media') or [1]) != discs))
+    release_id = release['id']
+
+    result = {
+        'release_id': release_id,
+        'title': release.get('title', ''),
+        'artist': (release.get('artist-credit') or [{}])[0].get('name', 'Various Artists'),
+        'track_count': _release_track_count(release),
+        'disc_track_counts': [medium['track-count'] for medium in release.get('media', [])],
+        'tracks': [],
+    }
+
+    # Extract track listing
+    position = 1
+    for medium in release.get('media', []):
+        for track in medium.get('tracks', []):
+            track_info = {
+                'title': track.get('title', ''),
+                'artist': '',
+                'position': position
+            }
+
+            # Get track artist if different from album artist
+            if 'artist-credit' in track:
+                track_info['artist'] = track['artist-credit'][0].get('name', '')
+
+            result['tracks'].append(track_info)
+            position += 1
+
+    return result
+
+def _has_cover_art(release_id):
+    """Whether the Cover Art Archive has art for a release.
+
+    Raises ``requests.RequestException`` when the archive gives no answer
+    (connection errors, or an error status after the session's retries).
+    """
+    # Headers only. The archive answers an existing release with a redirect
+    # to its index on archive.org, which need not be followed (or
+    # downloaded) to know art exists; a release without art is a 404.
+    cover_url = f"https://coverartarchive.org/release/{release_id}"
+    with _SESSION.head(cover_url, timeout=5, allow_redirects=False) as cover_response:
+        if cover_response.ok or cover_response.is_redirect:
+            return True
+        if cover_response.status_code != 404:
+            cover_response.raise_for_status()
+        return False
+
+def _coalesce(key, fetch):
+    """Return ``fetch()``, calling it at most once per ``key`` this run.
+
+    A caller arriving while another is still fetching the same key waits for
+    that result instead of sending its own request. A failed fetch is raised
+    to everyone waiting on it and then forgotten, so a later call retries.
+    """
+    with _REQUESTS_LOCK:
+        future = _REQUESTS.get(key)
+        owner = future is None
+        if owner:
+            future = _REQUESTS[key] = Future()
+    if not owner:
+        return future.result()
+
+    try:
+        result = fetch()
+    except BaseException as e:
+        with _REQUESTS_LOCK:
+            del _REQUESTS[key]
+        future.set_exception(e)
+        raise
+    future.set_result(result)
+    return result
+
+def _find_releases(search_name, artist):
+    """Releases of the release group best matching the search, or None.
+
+    Needs only the album name, so it can run (see :func:`prefetch_search`)
+    before the local files have been read. Each search is sent once per run,
+    however many albums (or a prefetch) ask for it at the same time.
+    """
+    return _coalesce(('search', search_name, artist),
+                     lambda: _search_release_group(search_name, artist))
+
+def _search_release_group(search_name, artist):
+    query = urllib.parse.quote(f'{search_name} AND artist:"{artist}"')
+    url = f"https://musicbrainz.org/ws/2/release-group/?query={query}&fmt=json&limit=1"
+
+    _MUSICBRAINZ_BUCKET.acquire()
+    with _SESSION.get(url, timeout=10) as response:
+        response.raise_for_status()
+        groups = loads_json(response.content).get('release-groups') or []
+
+    if not groups:
         return None
+    return _release_group_releases(groups[0]['id']) or None
+
+def prefetch_search(album_name, artist="Various Artists"):
+    """Start the name-only part of an album's lookup on the MusicBrainz thread.
+
+    Returns a Future. :func:`search_musicbrainz` for the same album joins the
+    prefetch if it is still running, then only has to pick the release and
+    check its cover. A failed prefetch is not remembered, so the search
+    retries (and reports) it.
+    """
+    return _MUSICBRAINZ_THREAD.submit(_find_releases, _normalize_album_name(album_name), artist)
+
+def _release_group_releases(release_group_id):
+    """Every release of a release group, with tracks, from one browse request.
+
+    Kept for the rest of the run, so sibling disc folders ("Album [Disc 1]",
+    "Album [Disc 2]") and different searches that resolve to the same group
+    share the request, even when they ask at the same time.
+    """
+    return _coalesce(('release-group', release_group_id),
+                     lambda: _browse_release_group(release_group_id))
+
+def _browse_release_group(release_group_id):
+    url = (f"https://musicbrainz.org/ws/2/release?release-group={release_group_id}"
+           f"&inc=recordings+artist-credits&fmt=json&limit=100")
+    _MUSICBRAINZ_BUCKET.acquire()
+    with _SESSION.get(url, timeout=10, stream=True) as response:
+        response.raise_for_status()
+        return [_slim_release(release) for release in _iter_releases(response)]
+
+def _iter_releases(response):
+    """Yield the releases of a streamed MusicBrainz browse response.
+
+    With ``ijson`` installed one release is parsed at a time; otherwise the
+    whole body is loaded (with ``orjson`` when available). Malformed JSON
+    raises ``ValueError`` either way.
+    """
+    try:
+        import ijson  # optional dependency
+    except ImportError:
+        yield from loads_json(response.content).get('releases') or []
+        return
+    response.raw.decode_content = True  # undo gzip as requests would
+    try:
+        yield from ijson.items(response.raw, 'releases.item', use_float=True)
+    except ijson.JSONError as e:
+        raise ValueError(f"invalid MusicBrainz response: {e}") from e
+
+def _first_credit(item):
+    """``item``'s first artist credit, reduced to its name (empty if uncredited)."""
+    credits = item.get('artist-credit') or []
+    return {'artist-credit': [{'name': credits[0].get('name', '')}]} if credits else {}
+
+def _slim_release(release):
+    """Keep only the release fields :func:`_lookup_release` reads.
+
+    Browse results carry full recording, artist and alias subtrees; dropping
+    them keeps the per-run release-group cache small.
+    """
+    return {
+        'id': release['id'],
+        'title': release.get('title', ''),
+        **_first_credit(release),
+        'media': [{
+            'track-count': medium.get('track-count', len(medium.get('tracks') or [])),
+            'tracks': [{'title': track.get('title', ''), **_first_credit(track)}
+                       for track in medium.get('tracks') or []],
+        } for medium in release.get('media') or []],
+    }
+
+def _release_track_count(release):
+    """Total tracks over a release's media (browse results have no top-level count)."""
+    media = release.get('media') or []
+    if not media:
+        return release.get('track-count', 0)
+    return sum(m.get('track-count', len(m.get('tracks', []))) for m in media)
+
+def _title_key(title):
+    """Track title as compared: case-folded, whitespace collapsed."""
+    return ' '.join(title.casefold().split())
 
 def compare_albums(local, musicbrainz):
     """
@@ -234,9 +572,10 @@ def compare_albums(local, musicbrainz):
             'track_count_match': bool,
             'track_count_local': int,
             'track_count_correct': int,
-            'missing_tracks': [str, ...],
-            'extra_tracks': [str, ...],
-            'cover_status': 'ok' | 'missing_local' | 'available_online',
+            'missing_tracks': [str, ...] (MusicBrainz titles with no local track),
+            'extra_tracks': [str, ...] (local titles not on the release),
+            'cover_status': 'ok' | 'available_online' | 'missing_everywhere'
+                | 'unknown' (not found, or the Cover Art Archive could not be checked),
             'needs_attention': bool
         }
     """
@@ -268,8 +607,8 @@ def compare_albums(local, musicbrainz):
     # Compare titles (normalized comparison)
     local_normalized = local['folder_name'].lower().strip()
     # Remove disc notation
-    local_normalized = re.sub(r'\s*\[?disc\s+\d+\]?$', '', local_normalized)
-    local_normalized = re.sub(r'\s*disk\s+\d+$', '', local_normalized)
+    local_normalized = _DISC_RE.sub('', local_normalized)
+    local_normalized = _DISK_RE.sub('', local_normalized)
     mb_normalized = musicbrainz['title'].lower().strip()
 
     result['title_match'] = (local_normalized == mb_normalized or
@@ -279,8 +618,15 @@ def compare_albums(local, musicbrainz):
     # Compare track counts
     result['track_count_match'] = (local['track_count'] == musicbrainz['track_count'])
 
-    # Compare track titles (simplified - just check if counts match for now)
-    # Full track-by-track comparison could be added later
+    # Compare track titles: one set per side, then a membership pass each way
+    # (only when both sides have titles; untagged files would list every track)
+    local_titles = {_title_key(t['title']) for t in local['tracks'] if t.get('title')}
+    mb_titles = {_title_key(t['title']) for t in musicbrainz['tracks'] if t.get('title')}
+    if local_titles and mb_titles:
+        result['missing_tracks'] = [t['title'] for t in musicbrainz['tracks']
+                                    if t.get('title') and _title_key(t['title']) not in local_titles]
+        result['extra_tracks'] = [t['title'] for t in local['tracks']
+                                  if t.get('title') and _title_key(t['title']) not in mb_titles]
 
     # Check cover art status
     has_embedded = any(t.get('has_embedded_cover', False) for t in local['tracks'])
@@ -289,6 +635,8 @@ def compare_albums(local, musicbrainz):
         result['cover_status'] = 'ok'
     elif musicbrainz['has_cover_art']:
         result['cover_status'] = 'available_online'
+    elif musicbrainz['has_cover_art'] is None:
+        result['cover_status'] = 'unknown'
     else:
         result['cover_status'] = 'missing_everywhere'
 
@@ -299,62 +647,181 @@ def compare_albums(local, musicbrainz):
 
     return result
 
-def validate_album(album_path, verbose=True):
+def validate_album(album_path, verbose=True, cache=None, force_online=False):
+    """
+    Validate single album against MusicBrainz (``cache``: optional :class:`LookupCache`).
+
+    Returns comparison dict. Verbose output (including read and lookup
+    warnings) is collected and written as one block per album; without
+    ``verbose`` only the warnings are printed, as they occur.
+    """
+    lines = []
+    try:
+        return _validate_discs(os.path.dirname(album_path), [os.path.basename(album_path)],
+                               [lines], cache, force_online,
+                               logs=None if verbose else [None])[0]
+    finally:
+        if verbose and lines:
+            print("\n".join(lines), flush=True)
+
+def _validate_discs(artist_path, folders, blocks, cache=None, force_online=False,
+                    read_local=None, logs=None):
+    """Validate the disc folders of one album with a single MusicBrainz search.
+
+    ``folders`` are sibling folders of ``artist_path`` ("Album [Disc 1]",
+    "Album [Disc 2]", or just one album); each one's output is appended to the
+    matching list in ``blocks``. Read and lookup warnings go to the matching
+    entry of ``logs`` instead when given (a ``None`` entry prints them). The
+    release is picked by the folders' total track count, and a disc folder of
+    a multi-disc release is compared with its own disc. Returns one
+    comparison dict per folder.
+
+    Unless ``force_online``, a set whose folders all pass
+    :func:`_locally_consistent` is accepted without searching MusicBrainz.
+    ``read_local(folder, lines)``, when given, supplies a folder's local
+    metadata (e.g. parsed ahead in another process) instead of reading it here.
+
+    With ``force_online`` the lookup is certain to be needed, so unless the
+    cache already answers it, its name-only part is started on the
+    MusicBrainz thread first and runs while the local files are read.
+    """
+    if force_online and (cache is None or
+                         not cache.has_search(_normalize_album_name(folders[0]), "Various Artists")):
+        prefetch_search(folders[0])
+
+    if logs is None:
+        logs = blocks
+
+    locals_ = []
+    for folder, lines, log in zip(folders, blocks, logs):
+        lines.append(f"\n[Validating] {folder}")
+        lines.append(f"  Reading local files...")
+        if read_local is not None:
+            locals_.append(read_local(folder, log))
+        else:
+            locals_.append(get_local_album_metadata(os.path.join(artist_path, folder), log=log))
+
+    if not force_online and all(_locally_consistent(local) for local in locals_):
+        comparisons = [_local_comparison(local) for local in locals_]
+        for comparison, lines in zip(comparisons, blocks):
+            _describe(comparison, lines.append)
+        return comparisons
+
+    for lines in blocks:
+        lines.append(f"  Searching MusicBrainz...")
+
+    # One search for the whole set; lookup errors are reported on its first disc
+    musicbrainz = search_musicbrainz(folders[0], log=logs[0], cache=cache,
+                                     track_count=sum(local['track_count'] for local in locals_),
+                                     discs=len(folders))
+
+    comparisons = []
+    for folder, local, lines in zip(folders, locals_, blocks):
+        comparison = compare_albums(local, _disc_view(musicbrainz, _disc_number(folder)))
+        _describe(comparison, lines.append)
+        comparisons.append(comparison)
+    return comparisons
+
+def _locally_consistent(local):
+    """True when an album's own tags leave nothing for MusicBrainz to correct.
+
+    Every track shares one album tag, track numbers run 1..N in file order,
+    and there is cover art (a cover file or an embedded picture).
     """
-    Validate single album against MusicBrainz.
+    tracks = local['tracks']
+    if not tracks:
+        return False
+    albums = {t['album'] for t in tracks}
+    return (len(albums) == 1 and None not in albums
+            and [t['track_num'] for t in tracks] == list(range(1, len(tracks) + 1))
+            and (local['has_cover'] or any(t['has_embedded_cover'] for t in tracks)))
+
+def _local_comparison(local):
+    """Comparison dict for an album accepted by the local fast path."""
+    return {
+        'title_match': None,
+        'title_local': local['folder_name'],
+        'title_correct': None,
+        'track_count_match': None,
+        'track_count_local': local['track_count'],
+        'track_count_correct': None,
+        'missing_tracks': [],
+        'extra_tracks': [],
+        'cover_status': 'ok',
+        'needs_attention': False,
+        'source': 'local-fastpath'
+    }
 
-    Returns comparison dict.
+def _disc_number(folder_name):
+    """Disc number from a "[Disc N]" / "Disk N" folder suffix, or None."""
+    match = _DISC_NUMBER_RE.search(folder_name)
+    return int(match.group(1)) if match else None
+
+def _disc_view(musicbrainz, disc):
+    """``musicbrainz`` narrowed to disc ``disc`` when it is a multi-disc release.
+
+    Otherwise (no match, no disc number, single-disc release or an unknown
+    disc) the whole release is returned unchanged.
     """
-    album_name = os.path.basename(album_path)
+    counts = (musicbrainz or {}).get('disc_track_counts') or []
+    if disc is None or len(counts) < 2 or not 1 <= disc <= len(counts):
+        return musicbrainz
+    start = sum(counts[:disc - 1])
+    return {
+        **musicbrainz,
+        'track_count': counts[disc - 1],
+        'tracks': musicbrainz['tracks'][start:start + counts[disc - 1]],
+    }
 
-    if verbose:
-        print(f"\n[Validating] {album_name}")
+def _describe(comparison, say):
+    """Write the human-readable result of one comparison through ``say``."""
+    if comparison.get('source') == 'local-fastpath':
+        say(f"  [OK] Local tags consistent (MusicBrainz lookup skipped)")
+        return
 
-    # Get local metadata
-    if verbose:
-        print(f"  Reading local files...")
-    local = get_local_album_metadata(album_path)
+    if comparison.get('musicbrainz_id') is None:
+        say(f"  [NOT FOUND] Not found in MusicBrainz")
+        return
 
-    # Search MusicBrainz
-    if verbose:
-        print(f"  Searching MusicBrainz...")
-    musicbrainz = search_musicbrainz(album_name)
+    say(f"  MusicBrainz ID: {comparison['musicbrainz_id']}")
 
-    # Compare
-    comparison = compare_albums(local, musicbrainz)
+    if comparison['title_match']:
+        say(f"  [OK] Title matches: {comparison['title_correct']}")
+    else:
+        say(f"  [MISMATCH] Title:")
+        say(f"    Local:   {comparison['title_local']}")
+        say(f"    Correct: {comparison['title_correct']}")
 
-    if verbose:
-        if musicbrainz is None:
-            print(f"  [NOT FOUND] Not found in MusicBrainz")
-        else:
-            print(f"  MusicBrainz ID: {comparison['musicbrainz_id']}")
-
-            if comparison['title_match']:
-                print(f"  [OK] Title matches: {comparison['title_correct']}")
-            else:
-                print(f"  [MISMATCH] Title:")
-                print(f"    Local:   {comparison['title_local']}")
-                print(f"    Correct: {comparison['title_correct']}")
-
-            if comparison['track_count_match']:
-                print(f"  [OK] Track count: {comparison['track_count_local']}")
-            else:
-                print(f"  [MISMATCH] Track count:")
-                print(f"    Local:   {comparison['track_count_local']}")
-                print(f"    Correct: {comparison['track_count_correct']}")
-
-            if comparison['cover_status'] == 'ok':
-                print(f"  [OK] Cover art present")
-            elif comparison['cover_status'] == 'available_online':
-                print(f"  [MISSING] Cover art available online")
-            else:
-                print(f"  [MISSING] No cover art found")
-
-    return comparison
-
-def validate_all_albums(artist_path, output_file=None):
+    if comparison['track_count_match']:
+        say(f"  [OK] Track count: {comparison['track_count_local']}")
+    else:
+        say(f"  [MISMATCH] Track count:")
+        say(f"    Local:   {comparison['track_count_local']}")
+        say(f"    Correct: {comparison['track_count_correct']}")
+
+    if comparison['cover_status'] == 'ok':
+        say(f"  [OK] Cover art present")
+    elif comparison['cover_status'] == 'available_online':
+        say(f"  [MISSING] Cover art available online")
+    elif comparison['cover_status'] == 'unknown':
+        say(f"  [MISSING] Cover art (online availability unknown)")
+    else:
+        say(f"  [MISSING] No cover art found")
+
+def validate_all_albums(artist_path, output_file=None, jobs=VALIDATE_WORKERS, cache=None,
+                        force_online=False, read_procs=1):
     """
-    Validate all albums in Various Artists folder.
+    Validate all albums in Various Artists folder, up to ``jobs`` at a time.
+
+    With ``read_procs`` > 1, local tags are parsed in that many worker
+    processes (tag parsing is pure-Python CPU work), all albums queued up
+    front; each album's lookup starts as soon as its own folders are read.
+
+    ``cache`` (a :class:`LookupCache`) is shared by every album; saving it is
+    left to the caller. With ``output_file``, each album's result is also
+    appended to ``<output_file>.partial`` (one JSON object per line) as it is
+    printed, so an interrupted run keeps its progress; the file is removed
+    once the full report is saved.
     """
     print(f"Validating albums in: {artist_path}\n")
 
@@ -376,21 +843,62 @@ def validate_all_albums(artist_path, output_file=None):
 
     results = []
 
-    for i, folder in enumerate(all_folders, 1):
-        album_path = os.path.join(artist_path, folder)
-        print(f"\n[{i}/{len(all_folders)}]", end=" ")
+    # Disc folders of one album are validated together, with one search
+    disc_sets = defaultdict(list)
+    for folder in all_folders:
+        disc_sets[_DISC_NUMBER_RE.sub('', folder).strip().casefold()].append(folder)
 
+    def check(folders):
+        blocks = [[] for _ in folders]
         try:
-            comparison = validate_album(album_path, verbose=True)
-            comparison['folder_name'] = folder
-            results.append(comparison)
+            comparisons = _validate_discs(artist_path, folders, blocks, cache, force_online,
+                                          read_local)
+            for folder, comparison in zip(folders, comparisons):
+                comparison['folder_name'] = folder
         except Exception as e:
-            print(f"  [ERROR] {e}")
-            results.append({
-                'folder_name': folder,
-                'error': str(e),
-                'needs_attention': True
-            })
+            comparisons = []
+            for folder, lines in zip(folders, blocks):
+                lines.append(f"  [ERROR] {e}")
+                comparisons.append({
+                    'folder_name': folder,
+                    'error': str(e),
+                    'needs_attention': True
+                })
+        return zip(comparisons, blocks)
+
+    progress = _open_progress(output_file)
+
+    use_procs = read_procs > 1 and len(all_folders) > 1
+    with (multiprocessing.Pool(min(read_procs, len(all_folders))) if use_procs
+          else nullcontext()) as procs:
+        if procs is not None:
+            pending = {folder: procs.apply_async(_read_album, (os.path.join(artist_path, folder),))
+                       for folder in all_folders}
+
+            def read_local(folder, lines):
+                local, log = pending[folder].get()
+                lines.extend(log)
+                return local
+        else:
+            read_local = None
+
+        workers = max(1, min(jobs, len(disc_sets)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            sets = list(disc_sets.values())
+            checked = pool.map(check, sets) if workers > 1 else map(check, sets)
+            i = 0
+            for disc_set in checked:
+                for comparison, lines in disc_set:
+                    # One write per album, in folder order (sibling discs together)
+                    i += 1
+                    print(f"\n[{i}/{len(all_folders)}] " + "\n".join(lines), flush=True)
+                    results.append(comparison)
+                    if progress is not None:
+                        progress.write(json.dumps(comparison, ensure_ascii=False) + "\n")
+                        progress.flush()
+
+    if progress is not None:
+        progress.close()
 
     # Generate summary
     print("\n" + "=" * 80)
@@ -408,6 +916,7 @@ def validate_all_albums(artist_path, output_file=None):
     print(f"  - Track count mismatches: {len(track_mismatches)}")
     print(f"  - Missing cover art: {len(missing_covers)}")
     print(f"  - Not found in MusicBrainz: {len(not_found)}")
+    print(f"Accepted from local tags: {sum(r.get('source') == 'local-fastpath' for r in results)}")
     print(f"Perfect matches: {len(results) - len(needs_attention)}")
 
     # Save report
@@ -425,11 +934,28 @@ def validate_all_albums(artist_path, output_file=None):
         }
 
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(report, f, indent=2, ensure_ascii=False)
+            write_json(report, output_file)
             print(f"\nValidation report saved: {output_file}")
         except Exception as e:
             print(f"\nError saving report: {e}")
+        else:
+            if progress is not None:
+                os.remove(progress.name)
+
+def _read_album(album_path):
+    """Worker-process entry point: ``(local metadata, warning lines)`` for one album."""
+    log = []
+    return get_local_album_metadata(album_path, log=log), log
+
+def _open_progress(output_file):
+    """Open ``<output_file>.partial`` for per-album progress lines, or return None."""
+    if not output_file:
+        return None
+    try:
+        return open(f"{output_file}.partial", 'w', encoding='utf-8')
+    except OSError as e:
+        print(f"Warning: not saving progress ({e})")
+        return None
 
 def main():
     import argparse
@@ -439,14 +965,28 @@ def main():
     parser.add_argument('--album', help='Validate specific album only')
     parser.add_argument('--output', default='D:/music cleanup/outputs/various_artists_validation.json',
                        help='Output file for validation report')
+    parser.add_argument('--jobs', type=int, default=VALIDATE_WORKERS,
+                        help=f'Albums to validate concurrently (default {VALIDATE_WORKERS})')
+    parser.add_argument('--cache-dir',
+                        help='Keep MusicBrainz lookups here for 30 days so reruns skip them')
+    parser.add_argument('--read-procs', type=int, default=1, metavar='N',
+                        help='Parse local tags in N worker processes (default 1: in-process)')
+    parser.add_argument('--force-online', action='store_true',
+                        help='Look up every album, even ones whose local tags are consistent')
 
     args = parser.parse_args()
+    cache = LookupCache(args.cache_dir) if args.cache_dir else None
 
-    if args.album:
-        album_path = os.path.join(args.path, args.album)
-        validate_album(album_path, verbose=True)
-    else:
-        validate_all_albums(args.path, output_file=args.output)
+    try:
+        if args.album:
+            album_path = os.path.join(args.path, args.album)
+            validate_album(album_path, verbose=True, cache=cache, force_online=args.force_online)
+        else:
+            validate_all_albums(args.path, output_file=args.output, jobs=args.jobs, cache=cache,
+                                force_online=args.force_online, read_procs=args.read_procs)
+    finally:
+        if cache is not None:
+            cache.save()
 
 if __name__ == '__main__':
     main()